@@ -0,0 +1,205 @@
+# Author: Helen C
+# GitHub username: hchao7
+# Date: 10/18/26
+# Description: Validates batches of moves across many boards at once with NumPy
+
+import argparse
+import random
+import time
+import numpy as np
+from ChessVar import (ChessVar, WHITE_PIECES, BLACK_PIECES, DIRECTION_OFFSETS, DIRECTION_TABLE, BETWEEN_MASKS,
+                      KING_MASKS, KNIGHT_MASKS, SLIDING_DIRECTIONS, SQUARE_NUMBERS)
+
+# Boards are int8 arrays of 64 squares, a8 first. Empty squares are 0, white pieces are positive,
+# and black pieces are the negative of the white piece of the same type.
+PIECE_CODES = {'.': 0}
+PIECE_CODES.update({piece: code for code, piece in enumerate(WHITE_PIECES, 1)})
+PIECE_CODES.update({piece: -code for code, piece in enumerate(BLACK_PIECES, 1)})
+PAWN, ROOK, KNIGHT, BISHOP, QUEEN, KING, FALCON, HUNTER = range(1, 9)
+
+def build_batch_tables():
+    """
+    Builds the lookup tables used by validate_moves() from the tables of ChessVar.py.
+
+    This function is called once when the module is imported.
+    This function does not require any arguments.
+
+    Returns:
+        tables (tuple): Direction numbers, between masks, king and knight targets, and allowed directions.
+    """
+    directions = list(DIRECTION_OFFSETS)
+    direction_numbers = np.array([[directions.index(direction) if direction in directions else -1
+                                   for direction in row] for row in DIRECTION_TABLE], dtype=np.int8)
+    between_masks = np.array(BETWEEN_MASKS, dtype=np.uint64)
+    king_targets = np.array([[(mask >> square) & 1 for square in range(64)] for mask in KING_MASKS], dtype=bool)
+    knight_targets = np.array([[(mask >> square) & 1 for square in range(64)] for mask in KNIGHT_MASKS], dtype=bool)
+
+    # allowed_directions[piece code + 8, direction number] for sliding pieces, following their player's color
+    allowed_directions = np.zeros((17, len(directions)), dtype=bool)
+    for (piece, color), piece_directions in SLIDING_DIRECTIONS.items():
+        code = PIECE_CODES[piece] if color == "WHITE" else PIECE_CODES[piece.lower()]
+        for direction in piece_directions:
+            allowed_directions[code + 8, directions.index(direction)] = True
+    return direction_numbers, between_masks, king_targets, knight_targets, allowed_directions
+
+DIRECTION_NUMBERS, BETWEEN_MASK_ARRAY, KING_TARGET_ARRAY, KNIGHT_TARGET_ARRAY, ALLOWED_DIRECTIONS = build_batch_tables()
+NORTHEAST, NORTHWEST = list(DIRECTION_OFFSETS).index('NORTHEAST'), list(DIRECTION_OFFSETS).index('NORTHWEST')
+SOUTHEAST, SOUTHWEST = list(DIRECTION_OFFSETS).index('SOUTHEAST'), list(DIRECTION_OFFSETS).index('SOUTHWEST')
+
+def encode_boards(chess_vars):
+    """
+    Converts games into the int8 board array read by validate_moves().
+
+    Args:
+        chess_vars (list): ChessVar games.
+
+    Returns:
+        boards (numpy.ndarray): int8 array with one row of 64 squares per game.
+    """
+    return np.array([[PIECE_CODES[piece] for row in chess_var.get_board().get_board_display()[:8] for piece in row[1:9]]
+                     for chess_var in chess_vars], dtype=np.int8).reshape(len(chess_vars), 64)
+
+def encode_squares(alg_coordinates):
+    """
+    Converts coordinates such as "e2" into square numbers, from 0 (a8) to 63 (h1).
+
+    Args:
+        alg_coordinates (list): Coordinates to convert.
+
+    Returns:
+        squares (numpy.ndarray): int64 array of square numbers, -1 for coordinates off the board.
+    """
+    return np.array([SQUARE_NUMBERS.get(alg_coordinate, -1) for alg_coordinate in alg_coordinates], dtype=np.int64)
+
+def validate_moves(boards, starts, ends, turns=None):
+    """
+    Checks a batch of moves, one per board, with the same rules as ChessVar's make_move():
+    verify_player_square() and is_valid_move(), which calls the Pieces methods.
+
+    Each check is a vectorized operation over the whole batch: piece ownership, direction from
+    the direction table, distance for kings, knights, and pawns, and blocking with the between masks
+    against each board's occupancy bitboard. The game state and fairy piece placements are not checked.
+
+    Args:
+        boards (numpy.ndarray): int8 array of shape (N, 64), as made by encode_boards().
+        starts (numpy.ndarray): Start square of each move, from 0 (a8) to 63 (h1), or -1 if off the board.
+        ends (numpy.ndarray): End square of each move, from 0 (a8) to 63 (h1), or -1 if off the board.
+        turns (numpy.ndarray): 1 where white is to move and -1 where black is, or None to use the color
+        of the piece on each start square.
+
+    Returns:
+        valid (numpy.ndarray): Boolean array, True where the move is legal.
+    """
+    boards = np.asarray(boards, dtype=np.int8).reshape(-1, 64)
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    on_board = (starts >= 0) & (starts < 64) & (ends >= 0) & (ends < 64) & (starts != ends)
+    starts = np.where(on_board, starts, 0)
+    ends = np.where(on_board, ends, 0)
+    rows = np.arange(len(boards))
+
+    pieces = boards[rows, starts].astype(np.int64)
+    captured = boards[rows, ends].astype(np.int64)
+    turns = np.sign(pieces) if turns is None else np.asarray(turns, dtype=np.int64)
+    piece_types = np.abs(pieces)
+
+    # verify_player_square(): the moving piece belongs to the player and the end square does not
+    valid = on_board & (pieces != 0) & (np.sign(pieces) == turns) & (np.sign(captured) != turns)
+
+    # Occupancy bitboard of each board, square 0 in the lowest bit
+    occupancy = np.packbits(boards != 0, axis=1, bitorder="little").view("<u8")[:, 0]
+    path_clear = (BETWEEN_MASK_ARRAY[starts, ends] & occupancy) == 0
+    directions = DIRECTION_NUMBERS[starts, ends].astype(np.int64)
+    end_occupied = captured != 0
+
+    # Queens, rooks, bishops, falcons, and hunters slide along their player's directions until blocked
+    sliding = (piece_types != PAWN) & (piece_types != KNIGHT) & (piece_types != KING)
+    slide_ok = (directions >= 0) & ALLOWED_DIRECTIONS[np.clip(piece_types * turns + 8, 0, 16),
+                                                     np.maximum(directions, 0)] & path_clear
+
+    # Pawns advance one square, two from their home rank, or capture one square diagonally forward
+    forward = np.where(turns == 1, -8, 8)
+    home_row = np.where(turns == 1, 6, 1)
+    capture_direction = ((turns == 1) & ((directions == NORTHEAST) | (directions == NORTHWEST))
+                         | (turns == -1) & ((directions == SOUTHEAST) | (directions == SOUTHWEST)))
+    pawn_ok = (((ends == starts + forward) & ~end_occupied)
+               | ((ends == starts + 2 * forward) & (starts // 8 == home_row) & ~end_occupied & path_clear)
+               | (capture_direction & end_occupied & KING_TARGET_ARRAY[starts, ends]))
+
+    piece_ok = np.select([sliding, piece_types == PAWN, piece_types == KNIGHT, piece_types == KING],
+                         [slide_ok, pawn_ok, KNIGHT_TARGET_ARRAY[starts, ends], KING_TARGET_ARRAY[starts, ends]],
+                         default=False)
+    return valid & piece_ok
+
+def validate_moves_one_by_one(chess_vars, moves):
+    """
+    Checks moves one at a time with ChessVar's verify_player_square() and is_valid_move().
+
+    This is the scalar version of validate_moves(), used to check and time it.
+
+    Args:
+        chess_vars (list): ChessVar games.
+        moves (list): (start coordinate, end coordinate) of one move per game.
+
+    Returns:
+        valid (list): True where the move is legal.
+    """
+    valid = []
+    for chess_var, (alg_start_coordinate, alg_end_coordinate) in zip(chess_vars, moves):
+        valid.append(chess_var.verify_player_square(alg_start_coordinate, alg_end_coordinate) is not False
+                     and chess_var.is_valid_move(chess_var.get_board().get_piece(alg_start_coordinate),
+                                                 alg_start_coordinate, alg_end_coordinate) is True)
+    return valid
+
+def main(argv=None):
+    """
+    Times validate_moves() against validate_moves_one_by_one() on random games and random moves.
+
+    Args:
+        argv (list): Command line arguments, or None to read them from sys.argv.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Time batch move validation with NumPy.")
+    parser.add_argument("--boards", type=int, default=10000, help="number of games and moves in the batch")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random games")
+    args = parser.parse_args(argv)
+
+    generator = random.Random(args.seed)
+    chess_vars = []
+    for _ in range(args.boards):
+        chess_var = ChessVar()
+        for _ in range(generator.randint(0, 40)):
+            moves = chess_var.generate_moves()
+            if not moves or chess_var.get_game_state() != "UNFINISHED":
+                break
+            chess_var.push(generator.choice(moves))
+        chess_vars.append(chess_var)
+    # Half of the moves are legal moves and half are random pairs of squares
+    squares = list(SQUARE_NUMBERS)
+    moves = []
+    for chess_var in chess_vars:
+        legal_moves = [move for move in chess_var.generate_moves() if move[2] == 'x']
+        if legal_moves and generator.random() < 0.5:
+            moves.append(generator.choice(legal_moves)[:2])
+        else:
+            moves.append((generator.choice(squares), generator.choice(squares)))
+
+    start_time = time.perf_counter()
+    expected = validate_moves_one_by_one(chess_vars, moves)
+    scalar_time = time.perf_counter() - start_time
+
+    boards = encode_boards(chess_vars)
+    starts = encode_squares([move[0] for move in moves])
+    ends = encode_squares([move[1] for move in moves])
+    turns = np.array([1 if chess_var.get_player_turn() == "WHITE" else -1 for chess_var in chess_vars])
+    start_time = time.perf_counter()
+    valid = validate_moves(boards, starts, ends, turns)
+    batch_time = time.perf_counter() - start_time
+
+    print(f"{args.boards} moves, {int(valid.sum())} legal, results {'match' if valid.tolist() == expected else 'differ'}")
+    print(f"one by one: {args.boards / scalar_time:.0f} moves/s, batch: {args.boards / batch_time:.0f} moves/s")
+
+if __name__ == "__main__":
+    main()
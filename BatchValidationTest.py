@@ -0,0 +1,66 @@
+import unittest
+import random
+from ChessVar import ChessVar, SQUARE_NAMES, chess_var_from_notation
+
+try:
+    import numpy as np
+    from BatchValidation import encode_boards, encode_squares, validate_moves, validate_moves_one_by_one
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestBatchValidation(unittest.TestCase):
+    def setUp(self):
+        generator = random.Random(3)
+        self.chess_vars = [ChessVar(), chess_var_from_notation("k7/8/8/3F4/3h4/8/8/7K w -/- 0/0 -/-"),
+                           chess_var_from_notation("k7/8/8/3F4/3h4/8/8/7K b -/- 0/0 -/-")]
+        while len(self.chess_vars) < 40:
+            chess_var = ChessVar()
+            for _ in range(generator.randint(10, 80)):
+                moves = chess_var.generate_moves()
+                if not moves:
+                    break
+                chess_var.push(generator.choice(moves))
+            if chess_var.get_game_state() == "UNFINISHED":
+                self.chess_vars.append(chess_var)
+
+    def test_matches_scalar_rules(self):
+        """Every pair of squares on every board gets the same result as the Pieces methods"""
+        chess_vars = [chess_var for chess_var in self.chess_vars for _ in range(64 * 64)]
+        moves = [(SQUARE_NAMES[start], SQUARE_NAMES[end]) for _ in self.chess_vars
+                 for start in range(64) for end in range(64)]
+        turns = np.array([1 if chess_var.get_player_turn() == "WHITE" else -1 for chess_var in chess_vars])
+        valid = validate_moves(encode_boards(chess_vars), encode_squares([move[0] for move in moves]),
+                               encode_squares([move[1] for move in moves]), turns)
+        self.assertEqual(valid.dtype, np.bool_)
+        self.assertEqual(valid.tolist(), validate_moves_one_by_one(chess_vars, moves))
+
+        # Legal moves from generate_moves() are all accepted
+        for chess_var in self.chess_vars:
+            board_moves = [move for move in chess_var.generate_moves() if move[2] == 'x']
+            valid = validate_moves(encode_boards([chess_var] * len(board_moves)),
+                                   encode_squares([move[0] for move in board_moves]),
+                                   encode_squares([move[1] for move in board_moves]),
+                                   [1 if chess_var.get_player_turn() == "WHITE" else -1] * len(board_moves))
+            self.assertTrue(valid.all())
+
+    def test_fairy_pieces_and_bad_input(self):
+        boards = encode_boards(self.chess_vars[1:3])
+
+        # 1: White falcon moves diagonally forward and straight back; black hunter moves diagonally back and straight forward
+        starts = encode_squares(['d5', 'd5', 'd5', 'd5', 'd4', 'd4'])
+        ends = encode_squares(['b7', 'd8', 'd1', 'f3', 'd1', 'c3'])
+        turns = [1, 1, 1, 1, -1, -1]
+        self.assertEqual(validate_moves(boards[[0, 0, 0, 0, 1, 1]], starts, ends, turns).tolist(),
+                         [True, False, False, False, True, False])
+
+        # 2: Coordinates off the board and moves out of turn are rejected
+        self.assertEqual(encode_squares(['z9', 'a8', 'h1']).tolist(), [-1, 0, 63])
+        self.assertEqual(validate_moves(boards[[0, 0, 0]], [-1, 27, 35], [27, 27, 59], [1, 1, 1]).tolist(),
+                         [False, False, False])
+
+        # 3: Without turns, the color of the piece on the start square moves
+        self.assertEqual(validate_moves(boards[[0]], encode_squares(['d4']), encode_squares(['d1'])).tolist(), [True])
+
+if __name__ == "__main__":
+    unittest.main()
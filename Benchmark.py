@@ -0,0 +1,298 @@
+# Author: Helen C
+# GitHub username: hchao7
+# Date: 10/18/26
+# Description: Measures how fast ChessVar's hot paths run
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import time
+from ChessVar import ChessVar, Pieces, SQUARE_NUMBERS, chess_var_from_notation, replay_chess_game
+from MCTS import MCTSPlayer
+
+# Positions the benchmark suite times the rules on, with both players to move and fairy pieces on the board
+STANDARD_POSITIONS = {
+    "start": "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w FH/fh 0/0 -/-",
+    "middlegame white": "r1bqk2r/ppp1fppp/2n2n2/3pp3/2BPP3/2N2N2/PPP1HPPP/R1BQK2R w F/h 0/0 -/-",
+    "middlegame black": "r1bqk2r/ppp1fppp/2n2n2/3pp3/2BPP3/2N2N2/PPP1HPPP/R1BQK2R b F/h 0/0 -/-",
+    "fairy entry": "r1bqk2r/ppp2ppp/2n2n2/3pp3/2BPP3/2N2N2/PPP2PPP/R1BQK2R w FH/fh 1/1 +/+",
+}
+
+# Game the benchmark suite replays, in replay_chess_game()'s format; black places a falcon and captures the king
+STANDARD_GAME = ["h2/h3/x", "b8/a6/x", "g2/g4/x", "a6/c5/x", "f2/f3/x", "c5/e4/x", "f1/g2/x", "g8/f6/x", "c2/c4/x",
+                 "e4/c5/x", "d1/a4/x", "c5/d3/x", "a4/c6/x", "b7/c6/x", "g4/g5/x", "f6/g8/x", "d1/x/F", "d3/e1/x"]
+
+# Pieces method that checks the moves of each piece type
+PIECE_METHODS = {'K': "king", 'Q': "queen", 'R': "rook", 'B': "bishop", 'N': "knight", 'P': "pawn", 'F': "falcon",
+                 'H': "hunter"}
+
+def sample_positions(count, seed=0, max_plies=60):
+    """
+    Plays random games and keeps one position from each.
+
+    Args:
+        count (int): Number of positions.
+        seed (int): Seed of the random number generator.
+        max_plies (int): Largest number of moves played before a position is kept.
+
+    Returns:
+        positions (list): ChessVar games, each in an unfinished position.
+    """
+    generator = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        chess_var = ChessVar()
+        for _ in range(generator.randint(0, max_plies)):
+            moves = chess_var.generate_moves()
+            if not moves:
+                break
+            chess_var.push(generator.choice(moves))
+        if chess_var.get_game_state() == "UNFINISHED":
+            positions.append(chess_var)
+    return positions
+
+def benchmark_evaluation(positions, repeat=200):
+    """
+    Times ChessVar's evaluate() against a full rescan with compute_evaluation(),
+    and the cost of keeping the score up to date while moves are made and undone.
+
+    Args:
+        positions (list): ChessVar games to score.
+        repeat (int): Number of times each position is scored.
+
+    Returns:
+        report (dict): "evaluations_per_second" for evaluate(), "rescans_per_second" for compute_evaluation(),
+        and "move_evaluations_per_second" for push(), evaluate(), and pop() of every legal move.
+    """
+    start_time = time.perf_counter()
+    for chess_var in positions:
+        evaluate = chess_var.evaluate
+        for _ in range(repeat):
+            evaluate()
+    evaluation_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for chess_var in positions:
+        for _ in range(max(1, repeat // 20)):
+            chess_var.compute_evaluation()
+    rescan_time = time.perf_counter() - start_time
+
+    move_evaluations = 0
+    start_time = time.perf_counter()
+    for chess_var in positions:
+        for move in chess_var.generate_moves():
+            chess_var.push(move)
+            chess_var.evaluate()
+            chess_var.pop()
+            move_evaluations += 1
+    move_time = time.perf_counter() - start_time
+
+    return {"evaluations_per_second": len(positions) * repeat / evaluation_time,
+            "rescans_per_second": len(positions) * max(1, repeat // 20) / rescan_time,
+            "move_evaluations_per_second": move_evaluations / move_time}
+
+def benchmark_playouts(playouts=200, workers=(0, 2, 4)):
+    """
+    Times MCTSPlayer's playouts from the starting position with different numbers of worker processes.
+
+    Args:
+        playouts (int): Playouts per search.
+        workers (iterable): Numbers of worker processes to try; 0 plays out in this process.
+
+    Returns:
+        report (dict): Maps "playouts_per_second_<workers>_workers" to playouts per second.
+    """
+    report = {}
+    for worker_count in workers:
+        player = MCTSPlayer(playouts=playouts, workers=worker_count, seed=0)
+        try:
+            result = player.search(ChessVar())
+        finally:
+            player.close()
+        report[f"playouts_per_second_{worker_count}_workers"] = result["playouts_per_second"]
+    return report
+
+def time_calls(function, make_calls, min_time=0.02):
+    """
+    Times a function over a list of calls.
+
+    The calls are made as many times as it takes to last at least min_time,
+    so fast and slow paths are both timed over enough calls.
+
+    Args:
+        function (function): Function to time.
+        make_calls (function): Returns the arguments of every call, such as fresh games
+        for functions that change them. It is not timed.
+        min_time (float): Shortest time to measure, in seconds.
+
+    Returns:
+        seconds (float): Time of one call.
+    """
+    elapsed_time, call_count = 0.0, 0
+    while elapsed_time < min_time:
+        calls = make_calls()
+        start_time = time.perf_counter()
+        for arguments in calls:
+            function(*arguments)
+        elapsed_time += time.perf_counter() - start_time
+        call_count += len(calls)
+    return elapsed_time / call_count
+
+def suite_workloads():
+    """
+    This method is a helper method for benchmark_suite().
+
+    This method does not require any arguments.
+
+    Returns:
+        workloads (list): (path, function, function returning the arguments of its calls) of each path.
+    """
+    games = {name: chess_var_from_notation(notation) for name, notation in STANDARD_POSITIONS.items()}
+    board = games["start"].get_board()
+    coordinates = [(alg_coordinate,) for alg_coordinate in list(SQUARE_NUMBERS) + ["i1", "a9", "z0"]]
+    workloads = [("Board.alg_coordinate_to_list_index", board.alg_coordinate_to_list_index, lambda: coordinates)]
+
+    # Every piece of the player to move is checked against every other square
+    piece_calls = {piece: [] for piece in PIECE_METHODS}
+    for chess_var in games.values():
+        white_to_move = chess_var.get_player_turn() == "WHITE"
+        for alg_start_coordinate in SQUARE_NUMBERS:
+            piece = chess_var.get_board().get_piece(alg_start_coordinate)
+            if piece.upper() in PIECE_METHODS and piece.isupper() == white_to_move:
+                piece_calls[piece.upper()] += [(alg_start_coordinate, alg_end_coordinate, chess_var)
+                                               for alg_end_coordinate in SQUARE_NUMBERS
+                                               if alg_end_coordinate != alg_start_coordinate]
+    for piece, name in PIECE_METHODS.items():
+        workloads.append((f"Pieces.is_valid_move_for_{name}", getattr(Pieces, f"is_valid_move_for_{name}"),
+                          lambda calls=piece_calls[piece]: calls))
+
+    # Moves and placements change the game, so each call gets a fresh copy of its position
+    moves = [(notation, move) for notation in STANDARD_POSITIONS.values()
+             for move in chess_var_from_notation(notation).generate_moves()]
+    regular_moves = [(notation, move[:2]) for notation, move in moves if move[2] == 'x']
+    placements = [(notation, (move[2], move[0])) for notation, move in moves if move[2] != 'x']
+    for name, function, move_calls in [("ChessVar.make_move", ChessVar.make_move, regular_moves),
+                                       ("ChessVar.enter_fairy_piece", ChessVar.enter_fairy_piece, placements)]:
+        workloads.append((name, function, lambda move_calls=move_calls: [
+            (chess_var_from_notation(notation),) + arguments for notation, arguments in move_calls]))
+
+    workloads.append(("replay_chess_game", replay_chess_game, lambda: [(ChessVar(), STANDARD_GAME)]))
+    workloads.append(("ChessVar.print_board_display", ChessVar.print_board_display,
+                      lambda: [(chess_var,) for chess_var in games.values()]))
+    return workloads
+
+def benchmark_suite(rounds=5, min_time=0.02):
+    """
+    Times the rules, replay, and rendering paths on STANDARD_POSITIONS and STANDARD_GAME.
+
+    Each round times every path once, so a burst of load on the machine slows one round of
+    every path rather than every round of one path, and the fastest round of each path is kept.
+
+    Args:
+        rounds (int): Number of rounds.
+        min_time (float): Shortest time of each path in a round, in seconds.
+
+    Returns:
+        report (dict): Maps each path, such as "Pieces.is_valid_move_for_rook" or "replay_chess_game",
+        to microseconds per call.
+    """
+    workloads = suite_workloads()
+    best_times = {name: float("inf") for name, _, _ in workloads}
+    # print_board_display() writes the board, so the output is discarded
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(rounds):
+            for name, function, make_calls in workloads:
+                best_times[name] = min(best_times[name], time_calls(function, make_calls, min_time))
+    return {name: seconds * 1e6 for name, seconds in best_times.items()}
+
+def save_baseline(report, path):
+    """
+    Writes the results of benchmark_suite() as a JSON baseline.
+
+    Args:
+        report (dict): Microseconds per call of each path.
+        path (str): File the baseline is written to.
+
+    Returns:
+        None
+    """
+    with open(path, "w") as baseline_file:
+        json.dump({"unit": "microseconds per call", "results": report}, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write("\n")
+
+def load_baseline(path):
+    """
+    Reads a baseline written by save_baseline().
+
+    Args:
+        path (str): Baseline file.
+
+    Returns:
+        baseline (dict): Microseconds per call of each path.
+    """
+    with open(path) as baseline_file:
+        return json.load(baseline_file)["results"]
+
+def find_regressions(report, baseline, threshold=20.0):
+    """
+    Compares the results of benchmark_suite() with a baseline.
+
+    Paths that are not in the baseline are skipped.
+
+    Args:
+        report (dict): Microseconds per call of each path.
+        baseline (dict): Microseconds per call of each path in the baseline.
+        threshold (float): Percentage a path may slow down by before it counts as a regression.
+
+    Returns:
+        regressions (list): (path, baseline microseconds, microseconds, percentage slower) of each
+        regression, the largest slowdown first.
+    """
+    regressions = []
+    for name, microseconds in report.items():
+        if name in baseline and microseconds > baseline[name] * (1 + threshold / 100):
+            regressions.append((name, baseline[name], microseconds, (microseconds / baseline[name] - 1) * 100))
+    return sorted(regressions, key=lambda regression: -regression[3])
+
+def main(argv=None):
+    """
+    Runs the benchmarks from the command line.
+
+    Args:
+        argv (list): Command line arguments, or None to read them from sys.argv.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Measure how fast ChessVar's hot paths run.")
+    parser.add_argument("--positions", type=int, default=100, help="number of random positions")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random positions")
+    parser.add_argument("--suite", action="store_true", help="time the rules, replay, and rendering paths instead")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write the suite's results as a JSON baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="fail if the suite is slower than this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=20.0, help="percentage slowdown counted as a regression")
+    args = parser.parse_args(argv)
+
+    if args.suite or args.save_baseline or args.baseline:
+        report = benchmark_suite()
+        for name, microseconds in report.items():
+            print(f"{name}: {microseconds:.2f} us")
+        if args.save_baseline:
+            save_baseline(report, args.save_baseline)
+        if args.baseline:
+            regressions = find_regressions(report, load_baseline(args.baseline), args.threshold)
+            for name, baseline_microseconds, microseconds, slowdown in regressions:
+                print(f"REGRESSION {name}: {baseline_microseconds:.2f} us -> {microseconds:.2f} us (+{slowdown:.0f}%)")
+            if regressions:
+                raise SystemExit(1)
+        return
+
+    report = benchmark_evaluation(sample_positions(args.positions, args.seed))
+    report.update(benchmark_playouts())
+    for name, value in report.items():
+        print(f"{name}: {value:.0f}")
+
+if __name__ == "__main__":
+    main()
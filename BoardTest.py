@@ -56,3 +56,39 @@ class TestBoard(unittest.TestCase):
         self.assertEqual(self.board.get_piece('a8'), '.')
         self.assertEqual(self.board.get_piece('d5'), '.')
         self.assertEqual(self.board.get_piece('h1'), '.')
+
+    def test_bitboards(self):
+        """Bitboards and occupancy masks stay in sync with _board_display"""
+
+        # 1: Checks starting position
+        self.assertEqual(self.board.get_piece_bitboard('K'), 1 << 60)
+        self.assertEqual(self.board.get_piece_bitboard('p'), 0xFF << 8)
+        self.assertEqual(self.board.get_occupancy("BLACK"), 0xFFFF)
+        self.assertEqual(self.board.get_occupancy("WHITE"), 0xFFFF << 48)
+        self.assertEqual(self.board.get_occupancy(), (0xFFFF << 48) | 0xFFFF)
+
+        # 2: Checks place_piece() and remove_piece()
+        self.board.place_piece('d5', 'q')
+        self.board.place_piece('e1', 'q')
+        self.board.remove_piece('a8')
+        self.assertTrue(self.board.is_occupied('d5'))
+        self.assertFalse(self.board.is_occupied('a8'))
+        self.assertEqual(self.board.get_piece_bitboard('K'), 0)
+        self.assertEqual(self.board.get_piece_bitboard('q'), (1 << 3) | (1 << 27) | (1 << 60))
+        self.assertEqual(self.board.get_piece_bitboard('r'), 1 << 7)
+        self.assertFalse(self.board.get_occupancy("WHITE") & (1 << 60))
+
+        # 3: Checks set_board_display()
+        board_display = [
+        ['8','.','.','.','.','k','.','.','.'],
+        ['7','.','.','.','.','.','.','.','.'],
+        ['6','.','.','.','.','.','.','.','.'],
+        ['5','.','.','.','.','.','.','.','.'],
+        ['4','.','.','.','.','.','.','.','.'],
+        ['3','.','.','.','.','.','.','.','.'],
+        ['2','.','.','.','.','.','.','.','.'],
+        ['1','.','.','.','.','K','.','.','.'],
+        [' ','a','b','c','d','e','f','g','h']]
+        self.board.set_board_display(board_display)
+        self.assertEqual(self.board.get_occupancy(), (1 << 4) | (1 << 60))
+        self.assertEqual(self.board.get_piece_bitboard('q'), 0)
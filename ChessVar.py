@@ -3,6 +3,257 @@
 # Date: 09/06/24
 # Description: Implementation of an abstract board game that is a variant of chess
 
+import random
+
+# Row and column offsets of each cardinal and ordinal direction on _board_display
+DIRECTION_OFFSETS = {
+    'NORTH': (-1, 0), 'NORTHEAST': (-1, 1), 'EAST': (0, 1), 'SOUTHEAST': (1, 1),
+    'SOUTH': (1, 0), 'SOUTHWEST': (1, -1), 'WEST': (0, -1), 'NORTHWEST': (-1, -1)
+}
+
+# Row and column offsets of a knight's jumps
+KNIGHT_OFFSETS = [(-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)]
+
+# Directions each sliding piece can travel in, by piece and player color
+SLIDING_DIRECTIONS = {
+    ('R', 'WHITE'): ['NORTH', 'EAST', 'SOUTH', 'WEST'],
+    ('R', 'BLACK'): ['NORTH', 'EAST', 'SOUTH', 'WEST'],
+    ('B', 'WHITE'): ['NORTHEAST', 'SOUTHEAST', 'SOUTHWEST', 'NORTHWEST'],
+    ('B', 'BLACK'): ['NORTHEAST', 'SOUTHEAST', 'SOUTHWEST', 'NORTHWEST'],
+    ('Q', 'WHITE'): list(DIRECTION_OFFSETS),
+    ('Q', 'BLACK'): list(DIRECTION_OFFSETS),
+    ('F', 'WHITE'): ['NORTHWEST', 'NORTHEAST', 'SOUTH'],
+    ('F', 'BLACK'): ['SOUTHWEST', 'SOUTHEAST', 'NORTH'],
+    ('H', 'WHITE'): ['SOUTHWEST', 'SOUTHEAST', 'NORTH'],
+    ('H', 'BLACK'): ['NORTHWEST', 'NORTHEAST', 'SOUTH']
+}
+
+def build_square_tables():
+    """
+    Builds the lookup tables used to validate and generate moves.
+
+    Squares are numbered 0 (a8) to 63 (h1), following the rows and columns of Board's _board_display.
+    This function is called once when the module is imported.
+    This function does not require any arguments.
+
+    Returns:
+        tables (tuple): Square names, knight targets, king targets, rays, direction table, and between masks.
+    """
+    square_names = [letter + number for number in '87654321' for letter in 'abcdefgh']
+    knight_targets = [[] for square in range(64)]
+    king_targets = [[] for square in range(64)]
+    rays = {direction: [[] for square in range(64)] for direction in DIRECTION_OFFSETS}
+    direction_table = [['N/A'] * 64 for square in range(64)]
+    between_masks = [[0] * 64 for square in range(64)]
+
+    for square in range(64):
+        row, column = divmod(square, 8)
+
+        for row_offset, column_offset in KNIGHT_OFFSETS:
+            if (0 <= row + row_offset <= 7) and (0 <= column + column_offset <= 7):
+                knight_targets[square].append((row + row_offset) * 8 + column + column_offset)
+
+        # Each ray lists the squares in one direction, nearest first
+        for direction, (row_offset, column_offset) in DIRECTION_OFFSETS.items():
+            end_row, end_column = row + row_offset, column + column_offset
+            path_mask = 0
+            while (0 <= end_row <= 7) and (0 <= end_column <= 7):
+                end_square = end_row * 8 + end_column
+                rays[direction][square].append(end_square)
+                direction_table[square][end_square] = direction
+                between_masks[square][end_square] = path_mask
+                path_mask |= 1 << end_square
+                end_row, end_column = end_row + row_offset, end_column + column_offset
+            king_targets[square].extend(rays[direction][square][:1])
+
+        # Matches identify_direction() for a square and itself
+        direction_table[square][square] = 'NORTH'
+
+    return square_names, knight_targets, king_targets, rays, direction_table, between_masks
+
+# Lookup tables built once at import
+SQUARE_NAMES, KNIGHT_TARGETS, KING_TARGETS, RAYS, DIRECTION_TABLE, BETWEEN_MASKS = build_square_tables()
+SQUARE_NUMBERS = {square_name: square for square, square_name in enumerate(SQUARE_NAMES)}
+KNIGHT_MASKS = [sum(1 << target for target in targets) for targets in KNIGHT_TARGETS]
+KING_MASKS = [sum(1 << target for target in targets) for targets in KING_TARGETS]
+
+# Rays each sliding piece travels along from each square, by piece and player color
+SLIDING_RAYS = {
+    piece_and_color: [[RAYS[direction][square] for direction in directions] for square in range(64)]
+    for piece_and_color, directions in SLIDING_DIRECTIONS.items()
+}
+
+# Flags of a 16-bit move code, by fairy piece ('x' is a regular move)
+MOVE_FLAGS = {'x': 0, 'F': 1, 'H': 2, 'f': 3, 'h': 4}
+MOVE_FLAG_PIECES = {flag: fairy_piece for fairy_piece, flag in MOVE_FLAGS.items()}
+
+def encode_move(move):
+    """
+    Packs a move into a 16-bit integer.
+
+    Bits 0-5 hold the start square, bits 6-11 the end square, and bits 12-15 the MOVE_FLAGS entry.
+    A fairy piece placement stores its placement square as both start and end square.
+
+    Args:
+        move (tuple): Start coordinate, end coordinate, and fairy piece, as returned by ChessVar's generate_moves().
+
+    Returns:
+        move_code (int): 16-bit move code.
+    """
+    alg_start_coordinate, alg_end_coordinate, fairy_piece = move
+    start_square = SQUARE_NUMBERS[alg_start_coordinate]
+    end_square = start_square if fairy_piece != 'x' else SQUARE_NUMBERS[alg_end_coordinate]
+    return start_square | (end_square << 6) | (MOVE_FLAGS[fairy_piece] << 12)
+
+def decode_move(move_code):
+    """
+    Unpacks a 16-bit integer made by encode_move().
+
+    Args:
+        move_code (int): 16-bit move code.
+
+    Returns:
+        move (tuple): Start coordinate, end coordinate, and fairy piece.
+    """
+    fairy_piece = MOVE_FLAG_PIECES[move_code >> 12]
+    if fairy_piece != 'x':
+        return SQUARE_NAMES[move_code & 63], 'x', fairy_piece
+    return SQUARE_NAMES[move_code & 63], SQUARE_NAMES[(move_code >> 6) & 63], 'x'
+
+# White pieces are uppercase letters and black pieces are lowercase letters
+WHITE_PIECES = ['P', 'R', 'N', 'B', 'Q', 'K', 'F', 'H']
+BLACK_PIECES = ['p', 'r', 'n', 'b', 'q', 'k', 'f', 'h']
+
+def build_zobrist_keys(seed=20240906):
+    """
+    Builds the random 64-bit keys used to hash positions.
+
+    The keys are generated from a fixed seed so that hashes are the same in every process and can be stored.
+    This function is called once when the module is imported.
+
+    Args:
+        seed (int): Seed of the random number generator.
+
+    Returns:
+        keys (tuple): Piece-square keys, side-to-move key, reserve keys, capture count keys, and fairy piece entry keys.
+    """
+    generator = random.Random(seed)
+    piece_keys = {piece: [generator.getrandbits(64) for square in range(64)] for piece in WHITE_PIECES + BLACK_PIECES}
+    black_to_move_key = generator.getrandbits(64)
+    reserve_keys = {fairy_piece: generator.getrandbits(64) for fairy_piece in ['F', 'H', 'f', 'h']}
+    capture_count_keys = {color: [generator.getrandbits(64) for count in range(ZOBRIST_CAPTURE_COUNTS)]
+                          for color in ["WHITE", "BLACK"]}
+    fairy_piece_entry_keys = {color: generator.getrandbits(64) for color in ["WHITE", "BLACK"]}
+    return piece_keys, black_to_move_key, reserve_keys, capture_count_keys, fairy_piece_entry_keys
+
+# Capture counts are hashed modulo this number of keys
+ZOBRIST_CAPTURE_COUNTS = 32
+
+# Zobrist keys built once at import
+(ZOBRIST_PIECE_KEYS, ZOBRIST_BLACK_TO_MOVE_KEY, ZOBRIST_RESERVE_KEYS,
+ ZOBRIST_CAPTURE_COUNT_KEYS, ZOBRIST_FAIRY_PIECE_ENTRY_KEYS) = build_zobrist_keys()
+
+# Material values in centipawns; a king is never traded, so capturing it is scored by the search instead
+PIECE_VALUES = {'P': 100, 'N': 300, 'B': 320, 'R': 500, 'Q': 900, 'K': 0, 'F': 400, 'H': 400}
+
+# Value of each fairy piece in a reserve list, depending on whether the player may place it now
+RESERVE_VALUES = {True: 350, False: 200}
+
+# Piece-square bonuses from white's point of view, from a8 to h1.
+# There is no promotion, so pawns get no promotion gradient: central pawns gain up to the sixth rank,
+# a pawn on the seventh rank has one move left but attacks the back rank and its king, and a pawn on the
+# last rank can never move or capture again, so it is worth little more than a blocker.
+# Falcons (forward diagonals, straight back) favour advanced central squares; hunters (straight forward,
+# diagonals back) favour the centre a little behind it. Black uses the same tables flipped top to bottom,
+# which also flips the falcon's and hunter's directions.
+PIECE_SQUARE_TABLES = {
+    'P': [-80, -80, -80, -80, -80, -80, -80, -80,
+           10,  10,  15,  20,  20,  15,  10,  10,
+           10,  10,  20,  30,  30,  20,  10,  10,
+            5,   5,  10,  25,  25,  10,   5,   5,
+            0,   0,   0,  20,  20,   0,   0,   0,
+            5,  -5, -10,   0,   0, -10,  -5,   5,
+            5,  10,  10, -20, -20,  10,  10,   5,
+            0,   0,   0,   0,   0,   0,   0,   0],
+    'N': [-50, -40, -30, -30, -30, -30, -40, -50,
+          -40, -20,   0,   0,   0,   0, -20, -40,
+          -30,   0,  10,  15,  15,  10,   0, -30,
+          -30,   5,  15,  20,  20,  15,   5, -30,
+          -30,   0,  15,  20,  20,  15,   0, -30,
+          -30,   5,  10,  15,  15,  10,   5, -30,
+          -40, -20,   0,   5,   5,   0, -20, -40,
+          -50, -40, -30, -30, -30, -30, -40, -50],
+    'B': [-20, -10, -10, -10, -10, -10, -10, -20,
+          -10,   0,   0,   0,   0,   0,   0, -10,
+          -10,   0,   5,  10,  10,   5,   0, -10,
+          -10,   5,   5,  10,  10,   5,   5, -10,
+          -10,   0,  10,  10,  10,  10,   0, -10,
+          -10,  10,  10,  10,  10,  10,  10, -10,
+          -10,   5,   0,   0,   0,   0,   5, -10,
+          -20, -10, -10, -10, -10, -10, -10, -20],
+    'R': [  0,   0,   0,   0,   0,   0,   0,   0,
+            5,  10,  10,  10,  10,  10,  10,   5,
+           -5,   0,   0,   0,   0,   0,   0,  -5,
+           -5,   0,   0,   0,   0,   0,   0,  -5,
+           -5,   0,   0,   0,   0,   0,   0,  -5,
+           -5,   0,   0,   0,   0,   0,   0,  -5,
+           -5,   0,   0,   0,   0,   0,   0,  -5,
+            0,   0,   0,   5,   5,   0,   0,   0],
+    'Q': [-20, -10, -10,  -5,  -5, -10, -10, -20,
+          -10,   0,   0,   0,   0,   0,   0, -10,
+          -10,   0,   5,   5,   5,   5,   0, -10,
+           -5,   0,   5,   5,   5,   5,   0,  -5,
+            0,   0,   5,   5,   5,   5,   0,  -5,
+          -10,   5,   5,   5,   5,   5,   0, -10,
+          -10,   0,   5,   0,   0,   0,   0, -10,
+          -20, -10, -10,  -5,  -5, -10, -10, -20],
+    'K': [-30, -40, -40, -50, -50, -40, -40, -30,
+          -30, -40, -40, -50, -50, -40, -40, -30,
+          -30, -40, -40, -50, -50, -40, -40, -30,
+          -30, -40, -40, -50, -50, -40, -40, -30,
+          -20, -30, -30, -40, -40, -30, -30, -20,
+          -10, -20, -20, -20, -20, -20, -20, -10,
+           20,  20,   0,   0,   0,   0,  20,  20,
+           20,  30,  10,   0,   0,  10,  30,  20],
+    'F': [-20, -10, -10, -10, -10, -10, -10, -20,
+          -10,   0,   0,   0,   0,   0,   0, -10,
+          -10,   5,  10,  15,  15,  10,   5, -10,
+          -10,   5,  15,  20,  20,  15,   5, -10,
+          -10,   5,  10,  15,  15,  10,   5, -10,
+          -10,   0,   5,  10,  10,   5,   0, -10,
+          -10,   0,   0,   0,   0,   0,   0, -10,
+          -20, -10, -10, -10, -10, -10, -10, -20],
+    'H': [-10,  -5,   0,   0,   0,   0,  -5, -10,
+           -5,   0,   5,   5,   5,   5,   0,  -5,
+           -5,   0,  10,  10,  10,  10,   0,  -5,
+           -5,   5,  10,  15,  15,  10,   5,  -5,
+           -5,   5,  10,  15,  15,  10,   5,  -5,
+           -5,   0,   5,  10,  10,   5,   0,  -5,
+          -10,  -5,   0,   0,   0,   0,  -5, -10,
+          -20, -10, -10, -10, -10, -10, -10, -20],
+}
+
+def build_piece_square_scores():
+    """
+    Combines PIECE_VALUES and PIECE_SQUARE_TABLES into one score per piece and square.
+
+    Scores are from white's point of view, so black pieces score negative.
+    This function is called once when the module is imported.
+
+    This function does not require any arguments.
+
+    Returns:
+        scores (dict): Maps each piece to a list of 64 scores, from a8 to h1.
+    """
+    scores = {}
+    for white_piece, black_piece in zip(WHITE_PIECES, BLACK_PIECES):
+        table = PIECE_SQUARE_TABLES[white_piece]
+        scores[white_piece] = [PIECE_VALUES[white_piece] + table[square] for square in range(64)]
+        scores[black_piece] = [-PIECE_VALUES[white_piece] - table[square ^ 56] for square in range(64)]
+    return scores
+
+PIECE_SQUARE_SCORES = build_piece_square_scores()
+
 class Player:
     """
     A class representing a chess player.
@@ -15,9 +266,13 @@ class Player:
         _reserve_list (list): A list of fairy pieces that are available for use.
         _fairy_piece_entry (bool): Indicates whether a fairy piece can be played.
         _capture_count (int): The count of captured Queen, Rook, Bishop, and Knight pieces.
+        _color (str): Color of the player's pieces, "WHITE" or "BLACK".
+        _hash_key (int): Zobrist hash of _reserve_list, _capture_count, and _fairy_piece_entry.
+
+    _hash_key is updated whenever the attributes above are changed through this class's methods.
     """
 
-    def __init__(self, reserve_list, name="Player"):
+    def __init__(self, reserve_list, name="Player", color="WHITE"):
         """
         Initializes a new Player instance.
 
@@ -27,11 +282,41 @@ class Player:
         Args:
             reserve_list (list): Fairy pieces assigned to player.
             name (str): Name of player.
+            color (str): Color of the player's pieces, "WHITE" or "BLACK".
         """
         self._reserve_list = reserve_list
         self._fairy_piece_entry = False
         self._capture_count = 0
         self._name = name
+        self._color = color
+        self._hash_key = self.compute_hash_key()
+
+    def compute_hash_key(self):
+        """
+        Computes the Zobrist hash of the player's state from scratch.
+
+        This method does not require any arguments.
+
+        Returns:
+            hash_key (int): Zobrist hash of _reserve_list, _capture_count, and _fairy_piece_entry.
+        """
+        hash_key = ZOBRIST_CAPTURE_COUNT_KEYS[self._color][self._capture_count % ZOBRIST_CAPTURE_COUNTS]
+        if self._fairy_piece_entry:
+            hash_key ^= ZOBRIST_FAIRY_PIECE_ENTRY_KEYS[self._color]
+        for fairy_piece in self._reserve_list:
+            hash_key ^= ZOBRIST_RESERVE_KEYS.get(fairy_piece, 0)
+        return hash_key
+
+    def get_hash_key(self):
+        """
+        Retrieves _hash_key.
+
+        This method does not require any arguments.
+
+        Returns:
+            _hash_key (int): Zobrist hash of _reserve_list, _capture_count, and _fairy_piece_entry.
+        """
+        return self._hash_key
 
     def set_capture_count(self, capture_count):
         """
@@ -43,7 +328,9 @@ class Player:
         Returns:
             None: This method does not return any value.
         """
+        self._hash_key ^= ZOBRIST_CAPTURE_COUNT_KEYS[self._color][self._capture_count % ZOBRIST_CAPTURE_COUNTS]
         self._capture_count = capture_count
+        self._hash_key ^= ZOBRIST_CAPTURE_COUNT_KEYS[self._color][self._capture_count % ZOBRIST_CAPTURE_COUNTS]
 
     def get_capture_count(self):
         """
@@ -70,7 +357,7 @@ class Player:
         Returns:
             None: This method does not return any value.
         """
-        self._capture_count = self._capture_count + value
+        self.set_capture_count(self._capture_count + value)
 
     def update_fairy_piece_entry(self):
         """
@@ -85,15 +372,15 @@ class Player:
         """
         # No more fairy pieces in reserve
         if not self._reserve_list:
-            self._fairy_piece_entry = False
+            self.set_fairy_piece_entry(False)
 
         # No main pieces (Queen, Rook, Bishop, or Knight) captured
         elif self._capture_count == 0:
-            self._fairy_piece_entry = False
+            self.set_fairy_piece_entry(False)
 
         # Main piece(s) captured and fairy piece(s) in reserve
         elif self._capture_count > 0:
-            self._fairy_piece_entry = True
+            self.set_fairy_piece_entry(True)
 
     def set_reserve_list(self, reserve_list):
         """
@@ -105,7 +392,11 @@ class Player:
         Returns:
             None: This method does not return any value.
         """
+        for fairy_piece in self._reserve_list:
+            self._hash_key ^= ZOBRIST_RESERVE_KEYS.get(fairy_piece, 0)
         self._reserve_list = reserve_list
+        for fairy_piece in self._reserve_list:
+            self._hash_key ^= ZOBRIST_RESERVE_KEYS.get(fairy_piece, 0)
 
     def get_reserve_list(self):
         """
@@ -143,6 +434,23 @@ class Player:
             None: This method does not return any value.
         """
         self._reserve_list.remove(fairy_piece)
+        self._hash_key ^= ZOBRIST_RESERVE_KEYS.get(fairy_piece, 0)
+
+    def add_to_reserve_list(self, fairy_piece, index):
+        """
+        Adds fairy piece back to reserve list.
+
+        This method is called by ChessVar's pop() when a fairy piece placement is undone.
+
+        Args:
+            fairy_piece (str): Fairy piece to be added.
+            index (int): Position in _reserve_list the piece was removed from.
+
+        Returns:
+            None: This method does not return any value.
+        """
+        self._reserve_list.insert(index, fairy_piece)
+        self._hash_key ^= ZOBRIST_RESERVE_KEYS.get(fairy_piece, 0)
 
     def set_fairy_piece_entry(self, fairy_piece_entry):
         """
@@ -154,6 +462,8 @@ class Player:
         Returns:
             None: This method does not return any value.
         """
+        if fairy_piece_entry != self._fairy_piece_entry:
+            self._hash_key ^= ZOBRIST_FAIRY_PIECE_ENTRY_KEYS[self._color]
         self._fairy_piece_entry = fairy_piece_entry
 
     def get_fairy_piece_entry(self):
@@ -173,6 +483,7 @@ class Pieces:
 
     This class has static methods that determine if a chess move by any chess piece is valid.
     Each method checks the validity of moves based on the specific movement rules of each piece.
+    Directions, distances, and paths are looked up in the tables built by build_square_tables().
     It communicates with:
     ChessVar class — Called by is_valid_move() to determine if a move is valid.
 
@@ -192,26 +503,10 @@ class Pieces:
         Returns:
             True or False (bool): Indicates if move is illegal or legal.
         """
-
-        # Checks direction of move
-        board = chess_var.get_board()
-        direction = Pieces.identify_direction(alg_start_coordinate, alg_end_coordinate, board)
-        if direction == 'N/A':  # Invalid direction
-            return False
-
-        # Calculates distance traveled between start and end coordinates
-        start_row, start_column = board.alg_coordinate_to_list_index(alg_start_coordinate)
-        end_row, end_column = board.alg_coordinate_to_list_index(alg_end_coordinate)
-        row_difference, column_difference = Pieces.row_column_difference(end_row, start_row, end_column, start_column)
-        total_difference = row_difference + column_difference
-
-        # Checks if King traveled a valid direction and distance
-        if (direction in ["NORTH", "EAST", "SOUTH", "WEST"]) and (total_difference == 1):
-            return True
-        elif (direction in ["NORTHEAST", "SOUTHEAST", "SOUTHWEST", "NORTHWEST"]) and (total_difference == 2):
-            return True
-
-        return False
+        # Checks if King traveled one square in any direction
+        start_square = SQUARE_NUMBERS[alg_start_coordinate]
+        end_square = SQUARE_NUMBERS[alg_end_coordinate]
+        return (KING_MASKS[start_square] >> end_square) & 1 == 1
 
     def is_valid_move_for_queen(alg_start_coordinate, alg_end_coordinate, chess_var):
         """
@@ -300,19 +595,10 @@ class Pieces:
         Returns:
             True or False (bool): Indicates if move is valid or invalid.
         """
-        # Calculates distance traveled between start and end coordinates
-        board = chess_var.get_board()
-        start_row, start_column = board.alg_coordinate_to_list_index(alg_start_coordinate)
-        end_row, end_column = board.alg_coordinate_to_list_index(alg_end_coordinate)
-        row_difference, column_difference = Pieces.row_column_difference(end_row, start_row, end_column, start_column)
-
         # Checks if knight traveled a valid distance
-        if (row_difference == 2) and (column_difference == 1):
-            return True
-        elif (row_difference == 1) and (column_difference == 2):
-            return True
-
-        return False
+        start_square = SQUARE_NUMBERS[alg_start_coordinate]
+        end_square = SQUARE_NUMBERS[alg_end_coordinate]
+        return (KNIGHT_MASKS[start_square] >> end_square) & 1 == 1
 
     def is_valid_move_for_pawn(alg_start_coordinate, alg_end_coordinate, chess_var):
         """
@@ -353,38 +639,25 @@ class Pieces:
         Returns:
             True or False (bool): Indicates if move is valid or invalid.
         """
-        # Calculates distance traveled between start and end coordinates
-        start_row, start_column = board.alg_coordinate_to_list_index(alg_start_coordinate)
-        end_row, end_column = board.alg_coordinate_to_list_index(alg_end_coordinate)
-        row_difference, column_difference = Pieces.row_column_difference(end_row, start_row, end_column, start_column)
-        total_difference = row_difference + column_difference
-
-        # Identifies direction of move
-        direction = Pieces.identify_direction(alg_start_coordinate, alg_end_coordinate, board)
+        start_square = SQUARE_NUMBERS[alg_start_coordinate]
+        end_square = SQUARE_NUMBERS[alg_end_coordinate]
+        occupancy = board.get_occupancy()
+        end_occupied = (occupancy >> end_square) & 1 == 1
 
         # Checks if non-capture moves are valid
-        # Checks direction, distance traveled, and end coordinate
         # Square represented by end coordinate must be empty
-        if direction == "SOUTH":
-            open_end_position = board.get_piece_with_list_index([end_row, end_column])
-
-            # 1. Condition where pawn starts on home rank
-            if (row_difference == 2) and (start_row == 1) and (open_end_position == "."):
-                # Checks if path is blocked
-                open_path = Pieces.identify_blocked_square(alg_start_coordinate, alg_end_coordinate, direction, board)
-                if open_path is True:
-                    return True
+        if (end_square == start_square + 8) and not end_occupied:
+            return True
 
-            # 2. Condition where pawn starts on non-home rank
-            if (row_difference == 1) and (open_end_position == "."):
-                return True
+        # Condition where pawn starts on home rank and travels 2 squares
+        # Checks if path is blocked
+        if (end_square == start_square + 16) and (start_square // 8 == 1) and not end_occupied:
+            return BETWEEN_MASKS[start_square][end_square] & occupancy == 0
 
         # Checks if capture moves are valid
         # Checks direction, distance traveled, and end coordinate
-        if (direction == "SOUTHEAST") or (direction == "SOUTHWEST"):
-            occupied_end_position = board.get_piece_with_list_index([end_row, end_column])
-            if (occupied_end_position != ".") and (total_difference == 2):
-                return True
+        if (DIRECTION_TABLE[start_square][end_square] in ["SOUTHEAST", "SOUTHWEST"]) and end_occupied:
+            return (KING_MASKS[start_square] >> end_square) & 1 == 1
 
         return False
 
@@ -403,38 +676,25 @@ class Pieces:
         Returns:
             True or False (bool): Indicates if move is valid or invalid.
         """
-        # Calculates distance traveled between start and end coordinates
-        start_row, start_column = board.alg_coordinate_to_list_index(alg_start_coordinate)
-        end_row, end_column = board.alg_coordinate_to_list_index(alg_end_coordinate)
-        row_difference, column_difference = Pieces.row_column_difference(end_row, start_row, end_column, start_column)
-        total_difference = row_difference + column_difference
-
-        # Identifies direction of move
-        direction = Pieces.identify_direction(alg_start_coordinate, alg_end_coordinate, board)
+        start_square = SQUARE_NUMBERS[alg_start_coordinate]
+        end_square = SQUARE_NUMBERS[alg_end_coordinate]
+        occupancy = board.get_occupancy()
+        end_occupied = (occupancy >> end_square) & 1 == 1
 
         # Checks if non-capture moves are valid
-        # Checks direction, distance traveled, and end coordinate
         # Square represented by end coordinate must be empty
-        if direction == "NORTH":
-            open_end_position = board.get_piece_with_list_index([end_row, end_column])
-
-            # 1. Condition where pawn starts on home rank
-            if (row_difference == 2) and (start_row == 6) and (open_end_position == "."):
-                # Checks if path is blocked
-                open_path = Pieces.identify_blocked_square(alg_start_coordinate, alg_end_coordinate, direction, board)
-                if open_path is True:
-                    return True
+        if (end_square == start_square - 8) and not end_occupied:
+            return True
 
-            # 2. Condition where pawn starts on non-home rank
-            if (row_difference == 1) and (open_end_position == "."):
-                return True
+        # Condition where pawn starts on home rank and travels 2 squares
+        # Checks if path is blocked
+        if (end_square == start_square - 16) and (start_square // 8 == 6) and not end_occupied:
+            return BETWEEN_MASKS[start_square][end_square] & occupancy == 0
 
         # Checks if capture moves are valid
         # Checks direction, distance traveled, and end coordinate
-        if (direction == "NORTHEAST") or (direction == "NORTHWEST"):
-            occupied_end_position = board.get_piece_with_list_index([end_row, end_column])
-            if (occupied_end_position != ".") and (total_difference == 2):
-                return True
+        if (DIRECTION_TABLE[start_square][end_square] in ["NORTHEAST", "NORTHWEST"]) and end_occupied:
+            return (KING_MASKS[start_square] >> end_square) & 1 == 1
 
         return False
 
@@ -588,38 +848,8 @@ class Pieces:
         Returns:
             (str): Cardinal or ordinal direction
         """
-        # Checks for cardinal direction
-        start_row, start_column = board.alg_coordinate_to_list_index(alg_start_coordinate)
-        end_row, end_column = board.alg_coordinate_to_list_index(alg_end_coordinate)
-
-        if start_column == end_column:
-            if end_row - start_row > 0:
-                return 'SOUTH'
-            else:
-                return 'NORTH'
-
-        if start_row == end_row:
-            if end_column - start_column > 0:
-                return 'EAST'
-            else:
-                return 'WEST'
-
-        # Checks for ordinal direction
-        row_difference = end_row - start_row
-        column_difference = end_column - start_column
-
-        if abs(row_difference) == abs(column_difference):
-            if (row_difference < 0) and (column_difference) > 0:
-                return 'NORTHEAST'
-            elif (row_difference > 0) and (column_difference < 0):
-                return 'SOUTHWEST'
-            elif (row_difference < 0) and (column_difference < 0):
-                return 'NORTHWEST'
-            elif (row_difference > 0) and (column_difference > 0):
-                return 'SOUTHEAST'
-
-        # Invalid direction (not cardinal or ordinal)
-        return 'N/A'
+        # Looks up the cardinal or ordinal direction, or 'N/A' if there is none
+        return DIRECTION_TABLE[SQUARE_NUMBERS[alg_start_coordinate]][SQUARE_NUMBERS[alg_end_coordinate]]
 
     def identify_blocked_square(alg_start_coordinate, alg_end_coordinate, direction, board):
         """
@@ -637,62 +867,34 @@ class Pieces:
         Returns:
             True or False (bool): Indicates if path is unblocked or blocked
         """
-        start_row, start_column = board.alg_coordinate_to_list_index(alg_start_coordinate)
-        end_row, end_column = board.alg_coordinate_to_list_index(alg_end_coordinate)
-
-        # Checks blockages for cardinal directions
-        if direction == 'NORTH':
-            for row in range(start_row-1, end_row, -1):
-                if board.get_piece_with_list_index([row, start_column]) != ".":
-                    return False
-
-        elif direction == 'SOUTH':
-            for row in range(start_row+1, end_row):
-                if board.get_piece_with_list_index([row, start_column]) != ".":
-                    return False
-
-        elif direction == 'EAST':
-            for column in range(start_column+1, end_column):
-                if board.get_piece_with_list_index([start_row, column]) != ".":
-                    return False
-
-        elif direction == 'WEST':
-            for column in range(start_column-1, end_column, -1):
-                if board.get_piece_with_list_index([start_row, column]) != ".":
-                    return False
-
-        num_of_checked_squares = abs(end_row - start_row) - 1
-
-        # Checks blockages for ordinal directions
-        if direction == 'NORTHEAST':
-            for square in range(num_of_checked_squares):
-                start_row = start_row - 1
-                start_column = start_column + 1
-                if board.get_piece_with_list_index([start_row, start_column]) != ".":
-                    return False
-
-        elif direction == 'SOUTHEAST':
-            for square in range(num_of_checked_squares):
-                start_row = start_row + 1
-                start_column = start_column + 1
-                if board.get_piece_with_list_index([start_row, start_column]) != ".":
-                    return False
-
-        elif direction == 'SOUTHWEST':
-            for square in range(num_of_checked_squares):
-                start_row = start_row + 1
-                start_column = start_column - 1
-                if board.get_piece_with_list_index([start_row, start_column]) != ".":
-                    return False
-
-        elif direction == 'NORTHWEST':
-            for square in range(num_of_checked_squares):
-                start_row = start_row - 1
-                start_column = start_column - 1
-                if board.get_piece_with_list_index([start_row, start_column]) != ".":
-                    return False
+        start_square = SQUARE_NUMBERS[alg_start_coordinate]
+        end_square = SQUARE_NUMBERS[alg_end_coordinate]
+
+        # Looks up the mask of the squares between start and end coordinate
+        if DIRECTION_TABLE[start_square][end_square] == direction:
+            path_mask = BETWEEN_MASKS[start_square][end_square]
+
+        # Direction does not lead from start to end coordinate
+        # Checks the same number of squares along the direction's ray as the distance traveled
+        elif direction in RAYS:
+            start_row, start_column = divmod(start_square, 8)
+            end_row, end_column = divmod(end_square, 8)
+            row_offset, column_offset = DIRECTION_OFFSETS[direction]
+            if direction in ['NORTH', 'SOUTH']:
+                num_of_checked_squares = (end_row - start_row) * row_offset - 1
+            elif direction in ['EAST', 'WEST']:
+                num_of_checked_squares = (end_column - start_column) * column_offset - 1
+            else:
+                num_of_checked_squares = abs(end_row - start_row) - 1
+            path_mask = 0
+            for square in RAYS[direction][start_square][:max(num_of_checked_squares, 0)]:
+                path_mask |= 1 << square
 
-        return True
+        else:
+            return True
+
+        # Path is blocked if any square on it is occupied
+        return (path_mask & board.get_occupancy()) == 0
 
     def row_column_difference(end_row, start_row, end_column, start_column):
         """
@@ -715,6 +917,44 @@ class Pieces:
         column_diff = abs(end_column - start_column)
         return row_diff, column_diff
 
+def scan_bitboard_row(row_index, row):
+    """
+    This method is a helper method for Board's update_bitboards().
+
+    Args:
+        row_index (int): Index of the row in _board_display, 0 for rank 8.
+        row (list): Pieces of the row from the a-file to the h-file, "." for empty squares.
+
+    Returns:
+        bitboard_row (tuple): Tuple of (piece, bitboard) pairs, and the row's part of the Zobrist hash,
+        the evaluation, and the white and black occupancy.
+    """
+    row_bitboards = {}
+    hash_key = evaluation = white_occupancy = black_occupancy = 0
+    for square, piece in enumerate(row, row_index * 8):
+        if piece == ".":
+            continue
+        bit = 1 << square
+        row_bitboards[piece] = row_bitboards.get(piece, 0) | bit
+        if piece in ZOBRIST_PIECE_KEYS:
+            hash_key ^= ZOBRIST_PIECE_KEYS[piece][square]
+            evaluation += PIECE_SQUARE_SCORES[piece][square]
+        if piece in WHITE_PIECES:
+            white_occupancy |= bit
+        elif piece in BLACK_PIECES:
+            black_occupancy |= bit
+    return tuple(row_bitboards.items()), hash_key, evaluation, white_occupancy, black_occupancy
+
+# Coordinate tables shared by every Board
+LETTER_TO_COLUMN = {'a': 1, 'b': 2, 'c': 3, 'd': 4, 'e': 5, 'f': 6, 'g': 7, 'h': 8}
+NUMBER_TO_ROW = {'1': 7, '2': 6, '3': 5, '4': 4, '5': 3, '6': 2, '7': 1, '8': 0}
+COLUMN_TO_LETTER = {column: letter for letter, column in LETTER_TO_COLUMN.items()}
+ROW_TO_NUMBER = {row: number for number, row in NUMBER_TO_ROW.items()}
+
+# Rows already scanned by Board's update_bitboards(), keyed by row index and row string
+BITBOARD_ROWS = {}
+BITBOARD_ROW_CACHE_SIZE = 100000
+
 class Board:
     """
     A class representing a chess board.
@@ -727,6 +967,12 @@ class Board:
         _board_display (list): Chess board (a grid) with rows and columns.
         _letter_to_column_dict (dict): Maps each letter to its corresponding column index in _board_display.
         _number_to_row_dict (dict): Maps each number to its corresponding row index in _board_display.
+        _piece_bitboards (dict): Maps each piece to a 64-bit integer with one bit set per square it occupies.
+        _occupancy (dict): Maps "WHITE", "BLACK", and "ALL" to a 64-bit integer of occupied squares.
+        _hash_key (int): Zobrist hash of the pieces on the board.
+
+    Squares are numbered 0 (a8) to 63 (h1), following the rows and columns of _board_display.
+    _board_display and the bitboards are kept in sync by place_piece(), remove_piece(), and set_board_display().
     """
 
     def __init__(self, board_display=None):
@@ -757,14 +1003,16 @@ class Board:
         [' ','a','b','c','d','e','f','g','h']]
 
         self._board_display = board_display
-        self._letter_to_column_dict = {
-            'a': 1, 'b': 2, 'c': 3, 'd': 4,
-            'e': 5, 'f': 6, 'g': 7, 'h': 8
-        }
-        self._number_to_row_dict = {
-            '1': 7, '2': 6, '3': 5, '4': 4,
-            '5': 3, '6': 2, '7': 1, '8': 0
-        }
+        # The coordinate tables are the same for every board, so they are shared instead of rebuilt
+        self._letter_to_column_dict = LETTER_TO_COLUMN
+        self._number_to_row_dict = NUMBER_TO_ROW
+        self._column_to_letter_dict = COLUMN_TO_LETTER
+        self._row_to_number_dict = ROW_TO_NUMBER
+        self._piece_bitboards = {}
+        self._occupancy = {"WHITE": 0, "BLACK": 0, "ALL": 0}
+        self._hash_key = 0
+        self._evaluation = 0
+        self.update_bitboards()
 
     def get_board_display(self):
         """
@@ -788,6 +1036,159 @@ class Board:
             None
         """
         self._board_display = board_display
+        self.update_bitboards()
+
+    def update_bitboards(self):
+        """
+        Rebuilds _piece_bitboards, _occupancy, _hash_key, and _evaluation from _board_display.
+
+        This method is called whenever _board_display is replaced.
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        piece_bitboards = {}
+        hash_key = 0
+        evaluation = 0
+        white_occupancy = black_occupancy = all_occupancy = 0
+        for row_index, row in enumerate(self._board_display[:8]):
+            # Rows seen before are combined from BITBOARD_ROWS instead of scanned square by square
+            row_key = (row_index, ''.join(row[1:9]))
+            bitboard_row = BITBOARD_ROWS.get(row_key)
+            if bitboard_row is None:
+                bitboard_row = scan_bitboard_row(row_index, row[1:9])
+                if len(BITBOARD_ROWS) >= BITBOARD_ROW_CACHE_SIZE:
+                    BITBOARD_ROWS.clear()
+                BITBOARD_ROWS[row_key] = bitboard_row
+            row_bitboards, row_hash_key, row_evaluation, row_white_occupancy, row_black_occupancy = bitboard_row
+            if not row_bitboards:
+                continue
+            for piece, bits in row_bitboards:
+                piece_bitboards[piece] = piece_bitboards.get(piece, 0) | bits
+                all_occupancy |= bits
+            hash_key ^= row_hash_key
+            evaluation += row_evaluation
+            white_occupancy |= row_white_occupancy
+            black_occupancy |= row_black_occupancy
+        self._piece_bitboards = piece_bitboards
+        self._occupancy = {"WHITE": white_occupancy, "BLACK": black_occupancy, "ALL": all_occupancy}
+        self._hash_key = hash_key
+        self._evaluation = evaluation
+
+    def add_to_bitboards(self, square, piece):
+        """
+        Sets the bit of a square in the piece's bitboard and the occupancy masks, and updates _hash_key and _evaluation.
+
+        Args:
+            square (int): Square number from 0 (a8) to 63 (h1).
+            piece (str): Piece that occupies the square.
+
+        Returns:
+            None
+        """
+        bit = 1 << square
+        self._piece_bitboards[piece] = self._piece_bitboards.get(piece, 0) | bit
+        self._occupancy["ALL"] |= bit
+        if piece in ZOBRIST_PIECE_KEYS:
+            self._hash_key ^= ZOBRIST_PIECE_KEYS[piece][square]
+            self._evaluation += PIECE_SQUARE_SCORES[piece][square]
+        if piece in WHITE_PIECES:
+            self._occupancy["WHITE"] |= bit
+        elif piece in BLACK_PIECES:
+            self._occupancy["BLACK"] |= bit
+
+    def remove_from_bitboards(self, square, piece):
+        """
+        Clears the bit of a square in the piece's bitboard and the occupancy masks, and updates _hash_key and _evaluation.
+
+        Args:
+            square (int): Square number from 0 (a8) to 63 (h1).
+            piece (str): Piece that occupied the square.
+
+        Returns:
+            None
+        """
+        mask = ~(1 << square)
+        self._piece_bitboards[piece] &= mask
+        self._occupancy["ALL"] &= mask
+        self._occupancy["WHITE"] &= mask
+        self._occupancy["BLACK"] &= mask
+        if piece in ZOBRIST_PIECE_KEYS:
+            self._hash_key ^= ZOBRIST_PIECE_KEYS[piece][square]
+            self._evaluation -= PIECE_SQUARE_SCORES[piece][square]
+
+    def get_piece_bitboard(self, piece):
+        """
+        Retrieves the bitboard of a piece.
+
+        Args:
+            piece (str): Piece whose squares are requested.
+
+        Returns:
+            bitboard (int): 64-bit integer with one bit set per square the piece occupies.
+        """
+        return self._piece_bitboards.get(piece, 0)
+
+    def get_occupancy(self, color="ALL"):
+        """
+        Retrieves the occupancy mask of a player or of the whole board.
+
+        Args:
+            color (str): "WHITE", "BLACK", or "ALL".
+
+        Returns:
+            occupancy (int): 64-bit integer with one bit set per occupied square.
+        """
+        return self._occupancy[color]
+
+    def get_hash_key(self):
+        """
+        Retrieves _hash_key.
+
+        This method does not require any arguments.
+
+        Returns:
+            _hash_key (int): Zobrist hash of the pieces on the board.
+        """
+        return self._hash_key
+
+    def get_evaluation(self):
+        """
+        Retrieves _evaluation.
+
+        This method does not require any arguments.
+
+        Returns:
+            _evaluation (int): Material and piece-square score of the pieces on the board, in centipawns,
+            from white's point of view.
+        """
+        return self._evaluation
+
+    def alg_coordinate_to_square(self, alg_coordinate):
+        """
+        Converts algebraic coordinates to a square number.
+
+        Args:
+            alg_coordinate (str): Represents a square on the board.
+
+        Returns:
+            square (int): Square number from 0 (a8) to 63 (h1).
+        """
+        row, column = self.alg_coordinate_to_list_index(alg_coordinate)
+        return row * 8 + column - 1
+
+    def is_occupied(self, alg_coordinate):
+        """
+        Checks if a square holds a piece.
+
+        Args:
+            alg_coordinate (str): Represents a square on the board.
+
+        Returns:
+            True or False (bool): Indicates if the square is occupied or empty.
+        """
+        return (self._occupancy["ALL"] >> self.alg_coordinate_to_square(alg_coordinate)) & 1 == 1
 
     def alg_coordinate_to_list_index(self, alg_coordinate):
         """
@@ -811,6 +1212,21 @@ class Board:
 
         return [row, column]
 
+    def list_index_to_alg_coordinate(self, list_index):
+        """
+        Converts a row index and column index to algebraic coordinates.
+
+        This method is the reverse of alg_coordinate_to_list_index().
+
+        Args:
+            list_index (list): Row index and column index.
+
+        Returns:
+            alg_coordinate (str): Represents a square on the board.
+        """
+        row, column = list_index
+        return self._column_to_letter_dict[column] + self._row_to_number_dict[row]
+
     def place_piece(self, alg_coordinate, piece):
         """
         Places piece on chess board.
@@ -823,7 +1239,13 @@ class Board:
             None
         """
         row, column = self.alg_coordinate_to_list_index(alg_coordinate)
+        square = row * 8 + column - 1
+        previous_piece = self._board_display[row][column]
+        if previous_piece != ".":
+            self.remove_from_bitboards(square, previous_piece)
         self._board_display[row][column] = piece
+        if piece != ".":
+            self.add_to_bitboards(square, piece)
 
     def remove_piece(self, alg_coordinate):
         """
@@ -836,6 +1258,9 @@ class Board:
             None
         """
         row, column = self.alg_coordinate_to_list_index(alg_coordinate)
+        previous_piece = self._board_display[row][column]
+        if previous_piece != ".":
+            self.remove_from_bitboards(row * 8 + column - 1, previous_piece)
         self._board_display[row][column] = '.'
 
     def get_piece(self, alg_coordinate):
@@ -884,6 +1309,7 @@ class ChessVar:
         _game_state (str): Indicates game state.
         _white_pieces (list): List of white chess pieces.
         _black_pieces (list): List of black chess pieces.
+        _undo_stack (list): Undo entries of the moves made with push(), most recent last.
     """
 
     def __init__(self, name_white="Player 1", name_black="Player 2", board_display=None):
@@ -901,12 +1327,13 @@ class ChessVar:
             None
         """
         self._board = Board(board_display)
-        self._white = Player(['F', 'H'], name_white)
-        self._black = Player(['f', 'h'], name_black)
+        self._white = Player(['F', 'H'], name_white, "WHITE")
+        self._black = Player(['f', 'h'], name_black, "BLACK")
         self._player_turn = 'WHITE'
         self._game_state = 'UNFINISHED'
         self._white_pieces = ['P', 'R', 'N', 'B', 'Q', 'K', 'F', 'H']
         self._black_pieces = ['p', 'r', 'n', 'b', 'q', 'k', 'f', 'h']
+        self._undo_stack = []
 
     def get_player(self, player):
         """
@@ -979,6 +1406,147 @@ class ChessVar:
         """
         self._player_turn = color
 
+    def hash_key(self):
+        """
+        Retrieves the Zobrist hash of the game.
+
+        The hash covers piece placement, _player_turn, and both Players' _reserve_list, _capture_count,
+        and _fairy_piece_entry. Board and Player update their parts of the hash on every change,
+        so make_move(), enter_fairy_piece(), and pop() keep it current without rescanning the board.
+        This method does not require any arguments.
+
+        Returns:
+            hash_key (int): 64-bit hash of the game.
+        """
+        hash_key = self._board.get_hash_key() ^ self._white.get_hash_key() ^ self._black.get_hash_key()
+        if self._player_turn == "BLACK":
+            hash_key ^= ZOBRIST_BLACK_TO_MOVE_KEY
+        return hash_key
+
+    def compute_hash_key(self):
+        """
+        Computes the Zobrist hash of the game from scratch.
+
+        This method is used to check the incrementally updated hash_key().
+        This method does not require any arguments.
+
+        Returns:
+            hash_key (int): 64-bit hash of the game.
+        """
+        hash_key = self._white.compute_hash_key() ^ self._black.compute_hash_key()
+        board_display = self._board.get_board_display()
+        for square in range(64):
+            piece = board_display[square // 8][square % 8 + 1]
+            if piece in ZOBRIST_PIECE_KEYS:
+                hash_key ^= ZOBRIST_PIECE_KEYS[piece][square]
+        if self._player_turn == "BLACK":
+            hash_key ^= ZOBRIST_BLACK_TO_MOVE_KEY
+        return hash_key
+
+    def evaluate(self):
+        """
+        Scores the game without searching.
+
+        The score adds the material and piece-square score kept up to date by Board on every move,
+        fairy piece placement, and pop(), and RESERVE_VALUES for each fairy piece in a reserve list,
+        which is higher while the player may place it.
+        This method does not require any arguments.
+
+        Returns:
+            score (int): Score in centipawns from white's point of view.
+        """
+        white, black = self._white, self._black
+        return (self._board.get_evaluation()
+                + RESERVE_VALUES[white.get_fairy_piece_entry()] * len(white.get_reserve_list())
+                - RESERVE_VALUES[black.get_fairy_piece_entry()] * len(black.get_reserve_list()))
+
+    def compute_evaluation(self):
+        """
+        Scores the game from scratch.
+
+        This method is used to check the incrementally updated evaluate().
+        This method does not require any arguments.
+
+        Returns:
+            score (int): Score in centipawns from white's point of view.
+        """
+        score = 0
+        board_display = self._board.get_board_display()
+        for square in range(64):
+            piece = board_display[square // 8][square % 8 + 1]
+            if piece in PIECE_SQUARE_SCORES:
+                score += PIECE_SQUARE_SCORES[piece][square]
+        for player, sign in [(self._white, 1), (self._black, -1)]:
+            score += sign * RESERVE_VALUES[player.get_fairy_piece_entry()] * len(player.get_reserve_list())
+        return score
+
+    def get_notation(self):
+        """
+        Writes the game in a compact notation.
+
+        The notation covers piece placement, _player_turn, both Players' _reserve_list, _capture_count,
+        and _fairy_piece_entry, and _game_state. It is described in parse_notation().
+        This method does not require any arguments.
+
+        Returns:
+            notation (str): Compact notation of the game.
+        """
+        rows = []
+        for row in self._board.get_board_display()[:8]:
+            row_string = ''.join(row[1:9])
+            notation_row = NOTATION_ROW_STRINGS.get(row_string)
+            if notation_row is None:
+                notation_row = row_string
+                for num_of_empty_squares in range(8, 0, -1):
+                    notation_row = notation_row.replace('.' * num_of_empty_squares, str(num_of_empty_squares))
+                if len(NOTATION_ROW_STRINGS) >= NOTATION_CACHE_SIZE:
+                    NOTATION_ROW_STRINGS.clear()
+                NOTATION_ROW_STRINGS[row_string] = notation_row
+            rows.append(notation_row)
+
+        fields = ['/'.join(rows), 'w' if self._player_turn == "WHITE" else 'b',
+                  '/'.join(''.join(player.get_reserve_list()) or '-' for player in (self._white, self._black)),
+                  '/'.join(str(player.get_capture_count()) for player in (self._white, self._black)),
+                  '/'.join('+' if player.get_fairy_piece_entry() else '-' for player in (self._white, self._black))]
+        if self._game_state != "UNFINISHED":
+            fields.append(self._game_state)
+        return ' '.join(fields)
+
+    def set_notation(self, notation):
+        """
+        Sets the game from the compact notation written by get_notation().
+
+        Moves made before with push() can no longer be undone.
+
+        Args:
+            notation (str): Compact notation of a game.
+
+        Returns:
+            None
+        """
+        board_display, player_turn, white, black, game_state = parse_notation(notation)
+        self._board.set_board_display(board_display)
+        self.set_players_from_notation(white, black)
+        self._player_turn = player_turn
+        self._game_state = game_state
+        self._undo_stack = []
+
+    def set_players_from_notation(self, white, black):
+        """
+        This method is a helper method for set_notation() and chess_var_from_notation().
+
+        Args:
+            white (tuple): White-piece Player's reserve list, capture count, and fairy piece entry.
+            black (tuple): Black-piece Player's reserve list, capture count, and fairy piece entry.
+
+        Returns:
+            None
+        """
+        for player, (reserve_list, capture_count, fairy_piece_entry) in ((self._white, white), (self._black, black)):
+            player.set_reserve_list(reserve_list)
+            player.set_capture_count(capture_count)
+            player.set_fairy_piece_entry(fairy_piece_entry)
+
     def print_board_display(self):
         """
         Prints player names, their reserve lists of fairy pieces, and _board_display.
@@ -1268,6 +1836,273 @@ class ChessVar:
 
         return True
 
+    def push(self, move):
+        """
+        Makes a move and records how to undo it.
+
+        The move uses the format returned by generate_moves(): ('d2', 'e3', 'x') for a regular move
+        and ('d1', 'x', 'F') for a fairy piece placement.
+        The undo entry records the captured piece, both Players' _capture_count and _fairy_piece_entry,
+        where the fairy piece was in the reserve list, and _game_state.
+
+        Args:
+            move (tuple): Start coordinate, end coordinate, and fairy piece.
+
+        Returns:
+            True or False (bool): Indicates if move was successful or unsuccessful.
+        """
+        if self._game_state != "UNFINISHED":
+            return False
+
+        alg_start_coordinate, alg_end_coordinate, fairy_piece = move
+        captured_piece, reserve_index = None, None
+        white_capture_count, black_capture_count = self._white.get_capture_count(), self._black.get_capture_count()
+        white_fairy_piece_entry = self._white.get_fairy_piece_entry()
+        black_fairy_piece_entry = self._black.get_fairy_piece_entry()
+        game_state = self._game_state
+
+        if fairy_piece == 'x':
+            captured_piece = self._board.get_piece(alg_end_coordinate)
+            if self.make_move(alg_start_coordinate, alg_end_coordinate) is False:
+                return False
+        else:
+            reserve_list = self.get_player(self._player_turn).get_reserve_list()
+            if fairy_piece not in reserve_list:
+                return False
+            reserve_index = reserve_list.index(fairy_piece)
+            if self.enter_fairy_piece(fairy_piece, alg_start_coordinate) is False:
+                return False
+
+        undo_entry = (move, captured_piece, reserve_index, white_capture_count, black_capture_count,
+                      white_fairy_piece_entry, black_fairy_piece_entry, game_state)
+        self._undo_stack.append(undo_entry)
+        return True
+
+    def pop(self):
+        """
+        Undoes the most recent move made with push().
+
+        This method does not require any arguments.
+
+        Returns:
+            move (tuple): The move that was undone, or None if there is nothing to undo.
+        """
+        if not self._undo_stack:
+            return None
+
+        (move, captured_piece, reserve_index, white_capture_count, black_capture_count,
+         white_fairy_piece_entry, black_fairy_piece_entry, game_state) = self._undo_stack.pop()
+        alg_start_coordinate, alg_end_coordinate, fairy_piece = move
+        self.update_player_turn()
+
+        # Moves piece back and restores the captured piece, if any
+        if fairy_piece == 'x':
+            self._board.place_piece(alg_start_coordinate, self._board.get_piece(alg_end_coordinate))
+            if captured_piece == ".":
+                self._board.remove_piece(alg_end_coordinate)
+            else:
+                self._board.place_piece(alg_end_coordinate, captured_piece)
+
+        # Removes fairy piece from the board and returns it to the reserve list
+        else:
+            self._board.remove_piece(alg_start_coordinate)
+            self.get_player(self._player_turn).add_to_reserve_list(fairy_piece, reserve_index)
+
+        self._white.set_capture_count(white_capture_count)
+        self._black.set_capture_count(black_capture_count)
+        self._white.set_fairy_piece_entry(white_fairy_piece_entry)
+        self._black.set_fairy_piece_entry(black_fairy_piece_entry)
+        self._game_state = game_state
+        return move
+
+    def generate_moves(self):
+        """
+        Lists every legal move and fairy piece placement for the current player.
+
+        Moves are generated from the geometry of each piece instead of validating every pair of squares.
+        Each move uses the start_coordinate/end_coordinate/fairy_piece format read by play_chess_game():
+        ('d2', 'e3', 'x') is a regular move and ('d1', 'x', 'F') places a falcon on d1.
+        This method does not require any arguments.
+
+        Returns:
+            moves (list): Tuples of legal moves, or an empty list if the game is finished.
+        """
+        if self._game_state != "UNFINISHED":
+            return []
+
+        own_pieces = self._white_pieces if self._player_turn == "WHITE" else self._black_pieces
+        moves = []
+
+        # Generates regular moves for each of the current player's pieces
+        for piece in own_pieces:
+            piece_bitboard = self._board.get_piece_bitboard(piece)
+            while piece_bitboard:
+                start_square = (piece_bitboard & -piece_bitboard).bit_length() - 1
+                piece_bitboard &= piece_bitboard - 1
+                alg_start_coordinate = SQUARE_NAMES[start_square]
+                for end_square in self.generate_piece_targets(piece, start_square):
+                    moves.append((alg_start_coordinate, SQUARE_NAMES[end_square], 'x'))
+
+        # Generates fairy piece placements
+        moves.extend(self.generate_fairy_piece_placements())
+        return moves
+
+    def generate_piece_targets(self, piece, start_square):
+        """
+        Lists the squares a piece can legally move to.
+
+        This method is a helper method for generate_moves().
+        Targets are read from the precomputed tables and checked against the Board's occupancy masks.
+
+        Args:
+            piece (str): Piece that will be moved.
+            start_square (int): Square number of the piece, from 0 (a8) to 63 (h1).
+
+        Returns:
+            targets (list): Square number of each end position.
+        """
+        piece_type = piece.upper()
+        occupancy = self._board.get_occupancy()
+        own_occupancy = self._board.get_occupancy(self._player_turn)
+
+        # Pawns move forward onto empty squares and capture diagonally forward
+        if piece_type == 'P':
+            targets = []
+            if self._player_turn == "WHITE":
+                forward_ray, capture_directions, home_row = RAYS['NORTH'][start_square], ['NORTHWEST', 'NORTHEAST'], 6
+            else:
+                forward_ray, capture_directions, home_row = RAYS['SOUTH'][start_square], ['SOUTHWEST', 'SOUTHEAST'], 1
+            if forward_ray and not (occupancy >> forward_ray[0]) & 1:
+                targets.append(forward_ray[0])
+                if (start_square // 8 == home_row) and not (occupancy >> forward_ray[1]) & 1:
+                    targets.append(forward_ray[1])
+            for direction in capture_directions:
+                capture_ray = RAYS[direction][start_square]
+                if capture_ray and (occupancy & ~own_occupancy) >> capture_ray[0] & 1:
+                    targets.append(capture_ray[0])
+            return targets
+
+        # Knights and kings move a fixed distance
+        if piece_type == 'N':
+            return [target for target in KNIGHT_TARGETS[start_square] if not (own_occupancy >> target) & 1]
+        if piece_type == 'K':
+            return [target for target in KING_TARGETS[start_square] if not (own_occupancy >> target) & 1]
+
+        # Sliding pieces travel until they are blocked or capture a piece
+        targets = []
+        for ray in SLIDING_RAYS[(piece_type, self._player_turn)][start_square]:
+            for target in ray:
+                if (occupancy >> target) & 1:
+                    if not (own_occupancy >> target) & 1:
+                        targets.append(target)
+                    break
+                targets.append(target)
+        return targets
+
+    def generate_fairy_piece_placements(self):
+        """
+        Lists every legal fairy piece placement for the current player.
+
+        This method is a helper method for generate_moves().
+        This method does not require any arguments.
+
+        Returns:
+            placements (list): Tuples of legal fairy piece placements.
+        """
+        player = self.get_player(self._player_turn)
+        if player.get_fairy_piece_entry() is False:
+            return []
+
+        occupancy = self._board.get_occupancy()
+        home_squares = range(48, 64) if self._player_turn == "WHITE" else range(0, 16)
+        placements = []
+        for fairy_piece in player.get_reserve_list():
+            for square in home_squares:
+                if not (occupancy >> square) & 1:
+                    placements.append((SQUARE_NAMES[square], 'x', fairy_piece))
+        return placements
+
+def parse_notation(notation):
+    """
+    Parses the compact notation written by ChessVar's get_notation().
+
+    The notation has five or six fields separated by spaces, for example
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w FH/fh 0/0 -/-":
+    1. Piece placement from rank 8 to rank 1, with digits counting empty squares.
+    2. Player turn, "w" or "b".
+    3. White and black reserve lists, "-" if empty.
+    4. White and black capture counts.
+    5. White and black fairy piece entry, "+" if True and "-" if False.
+    6. Game state, left out while the game is "UNFINISHED".
+
+    Args:
+        notation (str): Compact notation of a game.
+
+    Returns:
+        game (tuple): board_display grid, player turn, white (reserve list, capture count, fairy piece entry),
+        black (reserve list, capture count, fairy piece entry), and game state.
+    """
+    fields = notation.split()
+    if len(fields) not in [5, 6]:
+        raise ValueError(f"Invalid notation: {notation}")
+    placement, turn, reserves, capture_counts, fairy_piece_entries = fields[:5]
+    row_strings = placement.split('/')
+    if len(row_strings) != 8 or turn not in ['w', 'b']:
+        raise ValueError(f"Invalid notation: {notation}")
+
+    board_display = []
+    for number, row_string in zip('87654321', row_strings):
+        row = NOTATION_ROWS.get(row_string)
+        if row is None:
+            row = []
+            for character in row_string:
+                if character in '12345678':
+                    row.extend('.' * int(character))
+                elif character in WHITE_PIECES or character in BLACK_PIECES:
+                    row.append(character)
+                else:
+                    raise ValueError(f"Invalid notation: {notation}")
+            if len(row) != 8:
+                raise ValueError(f"Invalid notation: {notation}")
+            if len(NOTATION_ROWS) >= NOTATION_CACHE_SIZE:
+                NOTATION_ROWS.clear()
+            NOTATION_ROWS[row_string] = row
+        board_display.append([number] + row)
+    board_display.append([' ', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h'])
+
+    white_reserve, black_reserve = reserves.split('/')
+    white_capture_count, black_capture_count = capture_counts.split('/')
+    white_fairy_piece_entry, black_fairy_piece_entry = fairy_piece_entries.split('/')
+    white = ([] if white_reserve == '-' else list(white_reserve), int(white_capture_count), white_fairy_piece_entry == '+')
+    black = ([] if black_reserve == '-' else list(black_reserve), int(black_capture_count), black_fairy_piece_entry == '+')
+    game_state = fields[5] if len(fields) == 6 else "UNFINISHED"
+    return board_display, "WHITE" if turn == 'w' else "BLACK", white, black, game_state
+
+# Rows of piece placement already converted by parse_notation() and ChessVar's get_notation()
+NOTATION_ROWS = {}
+NOTATION_ROW_STRINGS = {}
+NOTATION_CACHE_SIZE = 100000
+
+def chess_var_from_notation(notation, name_white="Player 1", name_black="Player 2"):
+    """
+    Creates a ChessVar from the compact notation written by ChessVar's get_notation().
+
+    Args:
+        notation (str): Compact notation of a game.
+        name_white (str): Name of first player.
+        name_black (str): Name of second player.
+
+    Returns:
+        chess_var (ChessVar): Game described by the notation.
+    """
+    # The parsed board is passed to the constructor, so the starting position is never scanned
+    board_display, player_turn, white, black, game_state = parse_notation(notation)
+    chess_var = ChessVar(name_white, name_black, board_display)
+    chess_var.set_players_from_notation(white, black)
+    chess_var.set_player_turn(player_turn)
+    chess_var.set_game_state(game_state)
+    return chess_var
+
 def play_chess_game(game, player_one="WHITE", player_two="BLACK"):
     """
      Manages the flow of a chess game by repeatedly prompting the user for moves and applying them to the game state.
@@ -1309,6 +2144,85 @@ def play_chess_game(game, player_one="WHITE", player_two="BLACK"):
     else:
         print("You have ended the game.")
 
+def replay_moves(game, moves):
+    """
+    Applies move lines to a game without asking for input or printing the board, one line at a time.
+
+    Each line uses play_chess_game()'s start/end/fairy format, such as "d2/e3/x" or "d1/x/F".
+    Blank lines are skipped and "END/x/x" ends the game like it does in play_chess_game().
+    Replay stops after the first move that cannot be applied, whose result has an "error".
+
+    Args:
+        game (ChessVar): Game the moves are applied to.
+        moves (iterable): Move lines, such as an open file.
+
+    Returns:
+        results (generator): A dict per move with "ply", "move", "turn" (player who moved), and "game_state",
+        or "ply", "move", and "error" ("malformed move", "illegal move", or "game finished") for the move that failed.
+    """
+    ply = 0
+    for line in moves:
+        move = line.strip()
+        if not move:
+            continue
+        ply += 1
+        turn = game.get_player_turn()
+
+        fields = move.split("/")
+        if len(fields) != 3:
+            yield {"ply": ply, "move": move, "error": "malformed move"}
+            return
+        start, end, fairy = fields
+        if game.get_game_state() != "UNFINISHED":
+            yield {"ply": ply, "move": move, "error": "game finished"}
+            return
+
+        if start == "END":
+            game.set_game_state("END")
+            successful = True
+        elif fairy == 'x':
+            if start not in SQUARE_NUMBERS or end not in SQUARE_NUMBERS:
+                yield {"ply": ply, "move": move, "error": "malformed move"}
+                return
+            successful = game.make_move(start, end)
+        else:
+            if fairy not in MOVE_FLAGS or start not in SQUARE_NUMBERS:
+                yield {"ply": ply, "move": move, "error": "malformed move"}
+                return
+            successful = game.enter_fairy_piece(fairy, start)
+
+        if not successful:
+            yield {"ply": ply, "move": move, "error": "illegal move"}
+            return
+        yield {"ply": ply, "move": move, "turn": turn, "game_state": game.get_game_state()}
+
+def replay_chess_game(game, moves, keep_results=True):
+    """
+    Replays a recorded game in batch mode, without asking for input or printing the board.
+
+    Moves are read one line at a time, so a file of any size can be replayed.
+    With keep_results set to False only the last result is kept and memory use stays constant.
+
+    Args:
+        game (ChessVar): Game the moves are applied to.
+        moves (iterable or str): Move lines in start/end/fairy format, such as an open file, or the path of a file.
+        keep_results (bool): Indicates if the result of every move should be returned.
+
+    Returns:
+        game, results (tuple): The game after its last move, and the results of replay_moves()
+        (every result, or only the last one). The last result has an "error" if replay stopped early.
+    """
+    if isinstance(moves, str):
+        with open(moves) as move_file:
+            return replay_chess_game(game, move_file, keep_results)
+
+    results = []
+    for result in replay_moves(game, moves):
+        if not keep_results:
+            results.clear()
+        results.append(result)
+    return game, results
+
 def play_custom_board(board):
     """
     Initiates a chess game session with two players.
@@ -1,5 +1,8 @@
 import unittest
-from ChessVar import Player, Board, ChessVar, Pieces
+import copy
+from ChessVar import Player, Board, ChessVar, Pieces, encode_move, decode_move
+from ChessVar import parse_notation, chess_var_from_notation
+from ChessVar import PIECE_SQUARE_SCORES
 
 class TestChessVar(unittest.TestCase):
     def setUp(self):
@@ -367,3 +370,266 @@ class TestChessVar(unittest.TestCase):
 
         self.assertEqual(self.chess_var._board.get_board_display(), fairy_piece_board_display)
 
+
+    def test_generate_moves_method(self):
+        """generate_moves() matches every move accepted by make_move() and enter_fairy_piece()"""
+
+        def brute_force_moves(chess_var):
+            squares = [letter + number for number in '12345678' for letter in 'abcdefgh']
+            moves = set()
+            for start in squares:
+                for end in squares:
+                    game = copy.deepcopy(chess_var)
+                    if game.make_move(start, end):
+                        moves.add((start, end, 'x'))
+                for fairy_piece in ['F', 'H', 'f', 'h']:
+                    game = copy.deepcopy(chess_var)
+                    if game.enter_fairy_piece(fairy_piece, start):
+                        moves.add((start, 'x', fairy_piece))
+            return moves
+
+        # 1: Starting position has 20 moves
+        moves = self.chess_var.generate_moves()
+        self.assertEqual(len(moves), 20)
+        self.assertEqual(set(moves), brute_force_moves(self.chess_var))
+
+        # 2: Moves for both players, including fairy pieces and placements
+        board_display = [['8', 'r', '.', '.', 'q', 'k', '.', 'n', 'r'],
+                         ['7', 'p', 'p', '.', '.', 'f', 'p', 'p', '.'],
+                         ['6', '.', '.', 'n', '.', '.', '.', '.', 'p'],
+                         ['5', '.', '.', 'p', 'P', '.', '.', '.', '.'],
+                         ['4', '.', 'b', '.', '.', 'H', '.', '.', '.'],
+                         ['3', '.', '.', 'N', '.', '.', 'Q', '.', '.'],
+                         ['2', 'P', 'P', '.', '.', '.', 'P', 'P', 'P'],
+                         ['1', 'R', '.', 'B', '.', 'K', '.', '.', 'R'],
+                         [' ', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']]
+        self.chess_var._board.set_board_display(board_display)
+        self.chess_var._white.set_reserve_list(['F'])
+        self.chess_var._white.set_capture_count(1)
+        self.chess_var._white.set_fairy_piece_entry(True)
+        self.chess_var._black.set_reserve_list(['h'])
+        self.chess_var._black.set_capture_count(1)
+        self.chess_var._black.set_fairy_piece_entry(True)
+
+        moves = self.chess_var.generate_moves()
+        self.assertEqual(len(moves), len(set(moves)))
+        self.assertEqual(set(moves), brute_force_moves(self.chess_var))
+        self.assertIn(('d1', 'x', 'F'), moves)
+
+        self.chess_var.set_player_turn("BLACK")
+        moves = self.chess_var.generate_moves()
+        self.assertEqual(set(moves), brute_force_moves(self.chess_var))
+        self.assertIn(('b8', 'x', 'h'), moves)
+
+        # 3: Finished game has no moves
+        self.chess_var.set_game_state("WHITE_WON")
+        self.assertEqual(self.chess_var.generate_moves(), [])
+
+    def test_push_and_pop_methods(self):
+        """pop() restores the exact game state from before push()"""
+
+        def snapshot(chess_var):
+            return (copy.deepcopy(chess_var.get_board().get_board_display()),
+                    chess_var.get_board().get_occupancy(),
+                    chess_var.get_player_turn(), chess_var.get_game_state(),
+                    list(chess_var._white.get_reserve_list()), list(chess_var._black.get_reserve_list()),
+                    chess_var._white.get_capture_count(), chess_var._black.get_capture_count(),
+                    chess_var._white.get_fairy_piece_entry(), chess_var._black.get_fairy_piece_entry())
+
+        # 1: Illegal moves are not pushed
+        self.assertEqual(self.chess_var.push(('e2', 'e5', 'x')), False)
+        self.assertEqual(self.chess_var.push(('d1', 'x', 'F')), False)
+        self.assertEqual(self.chess_var.pop(), None)
+
+        # 2: Captures, fairy piece placements, and king capture are undone in reverse order
+        board_display = [['8', 'r', 'n', 'b', 'q', 'k', 'b', 'n', 'r'],
+                         ['7', 'p', 'p', 'p', '.', 'p', 'p', 'p', 'p'],
+                         ['6', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['5', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['4', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['3', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['2', 'P', 'P', 'P', '.', 'P', 'P', 'P', 'P'],
+                         ['1', 'R', 'N', 'B', 'Q', 'K', 'B', 'N', 'R'],
+                         [' ', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']]
+        self.chess_var._board.set_board_display(board_display)
+        moves = [('d1', 'd7', 'x'), ('d8', 'd7', 'x'), ('d1', 'x', 'F'), ('d7', 'd2', 'x'),
+                 ('e1', 'd2', 'x'), ('d8', 'x', 'h'), ('a2', 'a3', 'x')]
+        snapshots = []
+        for move in moves:
+            snapshots.append(snapshot(self.chess_var))
+            self.assertEqual(self.chess_var.push(move), True, move)
+        self.assertEqual(self.chess_var._black.get_reserve_list(), ['f'])
+        self.assertEqual(self.chess_var._white.get_reserve_list(), ['H'])
+        for move in reversed(moves):
+            self.assertEqual(self.chess_var.pop(), move)
+            self.assertEqual(snapshot(self.chess_var), snapshots.pop())
+
+        # 3: Game over by king capture is undone
+        self.chess_var._board.place_piece('e7', '.')
+        self.chess_var._board.place_piece('e4', 'Q')
+        before = snapshot(self.chess_var)
+        self.assertEqual(self.chess_var.push(('e4', 'e8', 'x')), True)
+        self.assertEqual(self.chess_var.get_game_state(), "WHITE_WON")
+        self.assertEqual(self.chess_var.generate_moves(), [])
+        self.chess_var.pop()
+        self.assertEqual(snapshot(self.chess_var), before)
+
+        # 4: Walking every move to depth 2 leaves the game unchanged
+        chess_var = ChessVar()
+        before = snapshot(chess_var)
+        for move in chess_var.generate_moves():
+            chess_var.push(move)
+            for reply in chess_var.generate_moves():
+                self.assertEqual(chess_var.push(reply), True)
+                chess_var.pop()
+            chess_var.pop()
+        self.assertEqual(snapshot(chess_var), before)
+
+    def test_hash_key_method(self):
+        """hash_key() is updated incrementally and covers the full game state"""
+        start_hash_key = self.chess_var.hash_key()
+        self.assertEqual(start_hash_key, self.chess_var.compute_hash_key())
+
+        # 1: Transposed move orders reach the same hash
+        for move in [('g1', 'f3', 'x'), ('g8', 'f6', 'x'), ('f3', 'g1', 'x'), ('f6', 'g8', 'x')]:
+            self.chess_var.push(move)
+            self.assertEqual(self.chess_var.hash_key(), self.chess_var.compute_hash_key())
+        self.assertEqual(self.chess_var.hash_key(), start_hash_key)
+
+        # 2: Side to move, reserve list, capture count, and fairy piece entry change the hash
+        self.chess_var.set_player_turn("BLACK")
+        self.assertNotEqual(self.chess_var.hash_key(), start_hash_key)
+        self.chess_var.set_player_turn("WHITE")
+        self.chess_var._white.remove_from_reserve_list('F')
+        self.assertNotEqual(self.chess_var.hash_key(), start_hash_key)
+        self.chess_var._white.add_to_reserve_list('F', 0)
+        self.chess_var._black.update_capture_count(1)
+        capture_hash_key = self.chess_var.hash_key()
+        self.assertNotEqual(capture_hash_key, start_hash_key)
+        self.chess_var._black.update_fairy_piece_entry()
+        self.assertNotEqual(self.chess_var.hash_key(), capture_hash_key)
+        self.assertEqual(self.chess_var.hash_key(), self.chess_var.compute_hash_key())
+        self.chess_var._black.set_capture_count(0)
+        self.chess_var._black.set_fairy_piece_entry(False)
+        self.assertEqual(self.chess_var.hash_key(), start_hash_key)
+
+        # 3: Hash stays correct through captures, fairy piece placements, and pop()
+        board_display = [['8', 'r', 'n', 'b', 'q', 'k', 'b', 'n', 'r'],
+                         ['7', 'p', 'p', 'p', '.', 'p', 'p', 'p', 'p'],
+                         ['6', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['5', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['4', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['3', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['2', 'P', 'P', 'P', '.', 'P', 'P', 'P', 'P'],
+                         ['1', 'R', 'N', 'B', 'Q', 'K', 'B', 'N', 'R'],
+                         [' ', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']]
+        self.chess_var._board.set_board_display(board_display)
+        hash_keys = []
+        for move in [('d1', 'd7', 'x'), ('d8', 'd7', 'x'), ('d1', 'x', 'F'), ('d7', 'd2', 'x'), ('e1', 'd2', 'x')]:
+            hash_keys.append(self.chess_var.hash_key())
+            self.chess_var.push(move)
+            self.assertEqual(self.chess_var.hash_key(), self.chess_var.compute_hash_key())
+        while hash_keys:
+            self.chess_var.pop()
+            self.assertEqual(self.chess_var.hash_key(), hash_keys.pop())
+
+    def test_encode_and_decode_move(self):
+        """Every generated move round-trips through a 16-bit move code"""
+        self.chess_var._white.set_capture_count(1)
+        self.chess_var._white.set_fairy_piece_entry(True)
+        self.chess_var._board.remove_piece('d1')
+        for move in self.chess_var.generate_moves():
+            move_code = encode_move(move)
+            self.assertLess(move_code, 2 ** 16)
+            self.assertEqual(decode_move(move_code), move)
+        self.assertEqual(decode_move(encode_move(('h8', 'x', 'h'))), ('h8', 'x', 'h'))
+
+    def test_evaluate_method(self):
+        """evaluate() is updated incrementally and scores both players alike"""
+        # 1: Starting position is even
+        self.assertEqual(self.chess_var.evaluate(), 0)
+        self.assertEqual(self.chess_var.compute_evaluation(), 0)
+
+        # 2: Mirrored moves keep the position even, and each side's move is scored by its piece-square table
+        self.chess_var.push(('g1', 'f3', 'x'))
+        self.assertEqual(self.chess_var.evaluate(), 50)
+        self.chess_var.push(('g8', 'f6', 'x'))
+        self.assertEqual(self.chess_var.evaluate(), 0)
+
+        # Without promotion, a pawn on the last rank can no longer move and scores below advanced pawns
+        self.assertLess(PIECE_SQUARE_SCORES['P'][3], PIECE_SQUARE_SCORES['P'][11])
+        self.assertLess(PIECE_SQUARE_SCORES['P'][11], PIECE_SQUARE_SCORES['P'][19])
+        self.assertEqual(PIECE_SQUARE_SCORES['p'][59], -PIECE_SQUARE_SCORES['P'][3])
+
+        # 3: Score stays correct through captures, fairy piece placements, and pop()
+        board_display = [['8', 'r', 'n', 'b', 'q', 'k', 'b', 'n', 'r'],
+                         ['7', 'p', 'p', 'p', '.', 'p', 'p', 'p', 'p'],
+                         ['6', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['5', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['4', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['3', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['2', 'P', 'P', 'P', '.', 'P', 'P', 'P', 'P'],
+                         ['1', 'R', 'N', 'B', 'Q', 'K', 'B', 'N', 'R'],
+                         [' ', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']]
+        self.chess_var._board.set_board_display(board_display)
+        self.chess_var.set_player_turn("WHITE")
+        scores = [self.chess_var.evaluate()]
+        for move in [('d1', 'd7', 'x'), ('d8', 'd7', 'x'), ('d1', 'x', 'F'), ('d7', 'd2', 'x'), ('e1', 'd2', 'x')]:
+            self.chess_var.push(move)
+            self.assertEqual(self.chess_var.evaluate(), self.chess_var.compute_evaluation())
+            scores.append(self.chess_var.evaluate())
+
+        # White may place a fairy piece after losing its queen, which raises the value of its reserve list
+        self.assertEqual(scores[2], scores[1] - PIECE_SQUARE_SCORES['Q'][11]
+                         - PIECE_SQUARE_SCORES['q'][3] + PIECE_SQUARE_SCORES['q'][11] + 2 * (350 - 200))
+        for score in reversed(scores[:-1]):
+            self.chess_var.pop()
+            self.assertEqual(self.chess_var.evaluate(), score)
+
+    def test_notation_methods(self):
+        """get_notation() and set_notation() round-trip the full game state"""
+
+        # 1: Starting position
+        start_notation = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w FH/fh 0/0 -/-"
+        self.assertEqual(self.chess_var.get_notation(), start_notation)
+
+        # 2: Reserve lists, capture counts, fairy piece entry, player turn, and game state
+        board_display = [['8', 'r', 'n', 'b', 'q', 'k', 'b', 'n', 'r'],
+                         ['7', 'p', 'p', 'p', '.', 'p', 'p', 'p', 'p'],
+                         ['6', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['5', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['4', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['3', '.', '.', '.', '.', '.', '.', '.', '.'],
+                         ['2', 'P', 'P', 'P', '.', 'P', 'P', 'P', 'P'],
+                         ['1', 'R', 'N', 'B', 'Q', 'K', 'B', 'N', 'R'],
+                         [' ', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']]
+        self.chess_var._board.set_board_display(board_display)
+        notations = []
+        for move in [('d1', 'd7', 'x'), ('d8', 'd7', 'x'), ('d1', 'x', 'F'), ('d7', 'd2', 'x'), ('e1', 'd2', 'x')]:
+            self.chess_var.push(move)
+            notations.append(self.chess_var.get_notation())
+        self.assertEqual(notations[-1], "rnb1kbnr/ppp1pppp/8/8/8/8/PPPKPPPP/RNBF1BNR b H/fh 0/1 -/+")
+
+        for notation in notations:
+            chess_var = chess_var_from_notation(notation)
+            self.assertEqual(chess_var.get_notation(), notation)
+            # Bitboards built from cached rows match a rescan of the board
+            self.assertEqual(chess_var.hash_key(), chess_var.compute_hash_key())
+            self.assertEqual(chess_var.evaluate(), chess_var.compute_evaluation())
+        self.assertEqual(chess_var.get_board().get_board_display(), self.chess_var.get_board().get_board_display())
+        self.assertEqual(chess_var.hash_key(), self.chess_var.hash_key())
+        self.assertEqual(chess_var.get_player("BLACK").get_fairy_piece_entry(), True)
+        self.assertEqual(chess_var.get_player("WHITE").get_reserve_list(), ['H'])
+        self.assertEqual(set(chess_var.generate_moves()), set(self.chess_var.generate_moves()))
+
+        self.chess_var.set_game_state("WHITE_WON")
+        self.assertEqual(chess_var_from_notation(self.chess_var.get_notation()).get_game_state(), "WHITE_WON")
+
+        # 3: Invalid notation
+        for notation in ["", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w FH/fh 0/0 -/-",
+                         "rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR w FH/fh 0/0 -/-",
+                         "rnbqkbnr/pppppppp/8/8/4X3/8/PPPPPPPP/RNBQKBNR w FH/fh 0/0 -/-",
+                         "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x FH/fh 0/0 -/-",
+                         "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR/8 w FH/fh 0/0 -/-"]:
+            with self.assertRaises(ValueError):
+                parse_notation(notation)
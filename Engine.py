@@ -0,0 +1,951 @@
+# Author: Helen C
+# GitHub username: hchao7
+# Date: 10/18/26
+# Description: Computer player that searches ChessVar games for the best move
+
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from ChessVar import PIECE_VALUES, SQUARE_NUMBERS, PIECE_SQUARE_SCORES, RAYS, KNIGHT_MASKS, KING_MASKS, SLIDING_RAYS
+from ChessVar import encode_move, decode_move, chess_var_from_notation
+
+# Score for capturing the opponent's king
+# Wins found at a lower ply score higher, so the engine prefers the fastest win
+WIN_SCORE = 100000
+
+# Scores this close to WIN_SCORE are wins or losses, stored relative to the position in the transposition table
+WIN_THRESHOLD = WIN_SCORE - 1000
+
+# Bound types of transposition table scores
+EXACT_BOUND = 1
+LOWER_BOUND = 2
+UPPER_BOUND = 3
+
+# Move ordering priorities, from first to last: transposition table move, king captures, other captures
+# (most valuable victim, then least valuable attacker), fairy piece placements, killer moves, and history
+TABLE_MOVE_PRIORITY = 1 << 30
+KING_CAPTURE_PRIORITY = 1 << 29
+CAPTURE_PRIORITY = 1 << 24
+DROP_PRIORITY = 1 << 23
+KILLER_PRIORITY = 1 << 22
+MAX_HISTORY = (1 << 22) - 1
+
+# Piece values used by static exchange evaluation; losing the king loses the game
+EXCHANGE_VALUES = dict(PIECE_VALUES, K=WIN_SCORE // 4)
+
+# Pieces in the order they are used to recapture, least valuable first
+RECAPTURE_ORDER = ['P', 'N', 'B', 'F', 'H', 'R', 'Q', 'K']
+
+# Quiescence search skips captures that cannot bring the score back within this margin of alpha
+DELTA_MARGIN = 200
+
+class SearchTimeout(Exception):
+    """
+    Raised inside a search when its time limit or node limit has been reached.
+    """
+
+class TranspositionTable:
+    """
+    A class representing a fixed-size table of searched positions.
+
+    Entries are keyed by ChessVar's hash_key(), which covers the reserve lists and capture counts.
+    Each entry stores the search depth, score, bound type, and best move (as a 16-bit move code).
+    The table is two preallocated arrays of 64-bit integers, so its memory use never grows.
+    Entries are grouped in buckets of two: the first slot keeps the deepest search and the second is always replaced.
+    Each key is stored XORed with its data so that a torn entry fails to match instead of returning bad data.
+    This also lets several processes share one table in shared memory without locks.
+
+    Attributes:
+        _num_buckets (int): Number of buckets, a power of two.
+        _keys (array or memoryview): Hash key XOR data of each entry.
+        _data (array or memoryview): Packed score, depth, bound type, and move code of each entry, or 0 if empty.
+        _hits (int): Probes that found their position.
+        _misses (int): Probes that did not find their position.
+        _stores (int): Entries written.
+        _overwrites (int): Entries written over a different position.
+    """
+
+    def __init__(self, size_mb=16, buffer=None):
+        """
+        Initializes a new TranspositionTable instance.
+
+        Args:
+            size_mb (float): Memory used by the table in megabytes.
+            buffer (memoryview): Zeroed memory of at least get_buffer_size(size_mb) bytes to keep the table in,
+            such as a SharedMemory's buf, or None for memory of its own.
+
+        Returns:
+            None
+        """
+        num_buckets = self.count_buckets(size_mb)
+        self._num_buckets = num_buckets
+        if buffer is None:
+            self._keys = array('Q', bytes(8 * 2 * num_buckets))
+            self._data = array('Q', bytes(8 * 2 * num_buckets))
+        else:
+            self._keys = buffer[:8 * 2 * num_buckets].cast('Q')
+            self._data = buffer[8 * 2 * num_buckets:8 * 4 * num_buckets].cast('Q')
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._overwrites = 0
+
+    @staticmethod
+    def count_buckets(size_mb):
+        """
+        Finds the number of buckets that fit in a table's size.
+
+        Args:
+            size_mb (float): Memory used by the table in megabytes.
+
+        Returns:
+            num_buckets (int): Largest power of two whose buckets fit, and at least 1.
+        """
+        # Each bucket holds two entries of two 8-byte integers
+        num_buckets = 1
+        while num_buckets * 2 * 32 <= size_mb * 1024 * 1024:
+            num_buckets *= 2
+        return num_buckets
+
+    @staticmethod
+    def get_buffer_size(size_mb):
+        """
+        Finds the number of bytes a table keeps in its buffer.
+
+        Args:
+            size_mb (float): Memory used by the table in megabytes.
+
+        Returns:
+            size (int): Number of bytes.
+        """
+        return 32 * TranspositionTable.count_buckets(size_mb)
+
+    def probe(self, hash_key):
+        """
+        Looks up a position.
+
+        Args:
+            hash_key (int): Hash of the position.
+
+        Returns:
+            entry (tuple): Depth, score, bound type, and move code, or None if the position is not stored.
+        """
+        index = (hash_key & (self._num_buckets - 1)) * 2
+        for slot in (index, index + 1):
+            data = self._data[slot]
+            if data and self._keys[slot] ^ data == hash_key:
+                self._hits += 1
+                return (data >> 32) & 0xFF, (data & 0xFFFFFFFF) - 0x80000000, (data >> 40) & 3, data >> 42
+        self._misses += 1
+        return None
+
+    def store(self, hash_key, depth, score, bound, move_code):
+        """
+        Stores a position.
+
+        The entry goes in the depth-preferred slot if it searched at least as deep as the entry there
+        or is the same position, and in the always-replace slot otherwise.
+
+        Args:
+            hash_key (int): Hash of the position.
+            depth (int): Plies searched from the position.
+            score (int): Score of the position.
+            bound (int): EXACT_BOUND, LOWER_BOUND, or UPPER_BOUND.
+            move_code (int): Best move as a 16-bit move code, or 0 if there is none.
+
+        Returns:
+            None
+        """
+        index = (hash_key & (self._num_buckets - 1)) * 2
+        data = (score + 0x80000000) | (min(max(depth, 0), 255) << 32) | (bound << 40) | (move_code << 42)
+        deepest_data = self._data[index]
+        if not deepest_data or self._keys[index] ^ deepest_data == hash_key or depth >= (deepest_data >> 32) & 0xFF:
+            slot = index
+        else:
+            slot = index + 1
+        old_data = self._data[slot]
+        if old_data and self._keys[slot] ^ old_data != hash_key:
+            self._overwrites += 1
+        self._keys[slot] = hash_key ^ data
+        self._data[slot] = data
+        self._stores += 1
+
+    def clear(self):
+        """
+        Empties the table and resets its counters.
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        for table in [self._keys, self._data]:
+            memoryview(table).cast('B')[:] = bytes(8 * len(table))
+        self._hits = self._misses = self._stores = self._overwrites = 0
+
+    def get_stats(self):
+        """
+        Retrieves the table's size and counters.
+
+        "filled" is the share of entries in use, sampled from the first 1000 buckets.
+        This method does not require any arguments.
+
+        Returns:
+            stats (dict): "entries", "hits", "misses", "stores", "overwrites", and "filled".
+        """
+        sample = self._data[:min(2000, len(self._data))]
+        return {"entries": len(self._data), "hits": self._hits, "misses": self._misses, "stores": self._stores,
+                "overwrites": self._overwrites, "filled": sum(1 for data in sample if data) / len(sample)}
+
+class MoveOrdering:
+    """
+    A class representing the move ordering of a search.
+
+    Captures are ordered by the value of the captured piece, then by the value of the capturing piece (MVV-LVA),
+    and capturing a king always comes first since it ends the game. Fairy piece placements, which are only listed
+    once a player's _fairy_piece_entry is True, come next, best square first. Quiet moves are ordered by the
+    killer moves of their ply and then by the history table. Killers and history are kept across the iterations
+    of a search and aged between searches.
+
+    Attributes:
+        _killers (list): Two quiet moves per ply that last caused a cutoff.
+        _history (dict): Maps a color to a list of depth-weighted cutoff counts, indexed by 16-bit move code.
+        _cutoffs (int): Positions where a move caused a cutoff.
+        _first_move_cutoffs (int): Positions where the first move searched caused the cutoff.
+    """
+
+    def __init__(self, max_ply=128):
+        """
+        Initializes a new MoveOrdering instance.
+
+        Args:
+            max_ply (int): Deepest ply that keeps killer moves.
+
+        Returns:
+            None
+        """
+        self._killers = [[None, None] for ply in range(max_ply)]
+        self._history = {"WHITE": [0] * (1 << 15), "BLACK": [0] * (1 << 15)}
+        self._cutoffs = 0
+        self._first_move_cutoffs = 0
+
+    def order_moves(self, chess_var, moves, ply, table_move=None):
+        """
+        Sorts moves so that the ones most likely to cause a cutoff are searched first.
+
+        Args:
+            chess_var (ChessVar): Game the moves belong to.
+            moves (list): Moves returned by generate_moves().
+            ply (int): Plies from the root of the search.
+            table_move (tuple): Best move stored in the transposition table, or None.
+
+        Returns:
+            moves (list): The same moves, best first.
+        """
+        board_display = chess_var.get_board().get_board_display()
+        killers = self._killers[ply] if ply < len(self._killers) else [None, None]
+        history = self._history[chess_var.get_player_turn()]
+
+        def priority(move):
+            if move == table_move:
+                return TABLE_MOVE_PRIORITY
+            start, end, fairy_piece = move
+            if fairy_piece != 'x':
+                return DROP_PRIORITY + abs(PIECE_SQUARE_SCORES[fairy_piece][SQUARE_NUMBERS[start]])
+            end_square = SQUARE_NUMBERS[end]
+            victim = board_display[end_square >> 3][(end_square & 7) + 1]
+            if victim != '.':
+                if victim in ('K', 'k'):
+                    return KING_CAPTURE_PRIORITY
+                start_square = SQUARE_NUMBERS[start]
+                attacker = board_display[start_square >> 3][(start_square & 7) + 1]
+                return CAPTURE_PRIORITY + PIECE_VALUES.get(victim.upper(), 0) * 16 - PIECE_VALUES.get(attacker.upper(), 0) // 16
+            if move == killers[0]:
+                return KILLER_PRIORITY + 1
+            if move == killers[1]:
+                return KILLER_PRIORITY
+            return history[encode_move(move)]
+
+        moves.sort(key=priority, reverse=True)
+        return moves
+
+    def record_cutoff(self, chess_var, move, ply, depth, move_number):
+        """
+        Remembers a move that caused a cutoff.
+
+        Quiet moves become the first killer move of their ply and gain depth squared in the history table.
+
+        Args:
+            chess_var (ChessVar): Game the move belongs to, before the move is made.
+            move (tuple): Move that caused the cutoff.
+            ply (int): Plies from the root of the search.
+            depth (int): Plies that were left to search.
+            move_number (int): Position of the move in the searched order, starting from 0.
+
+        Returns:
+            None
+        """
+        self._cutoffs += 1
+        if move_number == 0:
+            self._first_move_cutoffs += 1
+
+        if move[2] != 'x' or chess_var.get_board().get_piece(move[1]) != '.':
+            return
+        if ply < len(self._killers) and self._killers[ply][0] != move:
+            self._killers[ply][1] = self._killers[ply][0]
+            self._killers[ply][0] = move
+        history = self._history[chess_var.get_player_turn()]
+        move_code = encode_move(move)
+        history[move_code] = min(MAX_HISTORY, history[move_code] + depth * depth)
+
+    def new_search(self):
+        """
+        Prepares for a new search: killer moves and counters are cleared and the history table is halved.
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        for killers in self._killers:
+            killers[0] = killers[1] = None
+        for history in self._history.values():
+            history[:] = [count >> 1 for count in history]
+        self._cutoffs = 0
+        self._first_move_cutoffs = 0
+
+    def get_stats(self):
+        """
+        Retrieves the cutoff counters of the current search.
+
+        This method does not require any arguments.
+
+        Returns:
+            stats (dict): "cutoffs", "first_move_cutoffs", and "first_move_cutoff_rate" (share of cutoffs
+            caused by the first move searched).
+        """
+        return {"cutoffs": self._cutoffs, "first_move_cutoffs": self._first_move_cutoffs,
+                "first_move_cutoff_rate": self._first_move_cutoffs / self._cutoffs if self._cutoffs else 0.0}
+
+class Engine:
+    """
+    A class representing a computer player.
+
+    This class searches a ChessVar game with negamax alpha-beta and iterative deepening.
+    Regular moves and fairy piece placements are both searched, and the game ends when a king is captured.
+    It communicates with:
+    ChessVar class — Moves are listed with generate_moves() and searched with push() and pop().
+
+    Attributes:
+        _max_depth (int): Deepest iteration searched.
+        _time_limit (float): Seconds the search may run for, or None for no limit.
+        _node_limit (int): Positions the search may visit, or None for no limit.
+        _nodes (int): Positions visited by the current search.
+        _deadline (float): Time the current search must stop by, or None.
+        _search_node_limit (int): Node limit of the current search, or None.
+        _transposition_table (TranspositionTable): Positions searched so far, kept between searches.
+        _move_ordering (MoveOrdering): Killer moves, history table, and cutoff counters.
+        _order_moves (bool): Indicates if moves are sorted by _move_ordering, or only the stored best move is moved first.
+        _quiescence (bool): Indicates if captures are searched past the last ply.
+        _threads (int): Processes searching together; helper processes share the transposition table (Lazy SMP).
+        _hash_size_mb (float): Memory used by the transposition table in megabytes.
+        _shared_memory (SharedMemory): Memory holding the shared transposition table and stop flag, or None.
+        _stop_flag (memoryview): Set to 1 to stop helper searches, or None.
+        _executor (ProcessPoolExecutor): Helper processes, started on the first parallel search, or None.
+    """
+
+    def __init__(self, max_depth=64, time_limit=None, node_limit=None, hash_size_mb=16, order_moves=True,
+                 quiescence=True, threads=1, shared_memory_name=None):
+        """
+        Initializes a new Engine instance.
+
+        Args:
+            max_depth (int): Deepest iteration searched.
+            time_limit (float): Seconds the search may run for, or None for no limit.
+            node_limit (int): Positions the search may visit, or None for no limit.
+            hash_size_mb (float): Memory used by the transposition table in megabytes.
+            order_moves (bool): Indicates if moves are sorted by MoveOrdering.
+            quiescence (bool): Indicates if captures are searched past the last ply with quiescence().
+            threads (int): Processes searching together. With more than 1, the transposition table is kept in
+            shared memory and close() should be called when the Engine is no longer needed.
+            shared_memory_name (str): Shared memory of another Engine's transposition table to search with,
+            used by helper processes.
+
+        Returns:
+            None
+        """
+        self._threads = threads
+        self._hash_size_mb = hash_size_mb
+        self._executor = None
+        if threads > 1 or shared_memory_name is not None:
+            table_size = TranspositionTable.get_buffer_size(hash_size_mb)
+            if shared_memory_name is None:
+                self._shared_memory = shared_memory.SharedMemory(create=True, size=table_size + 8)
+            else:
+                self._shared_memory = shared_memory.SharedMemory(name=shared_memory_name)
+            self._transposition_table = TranspositionTable(hash_size_mb, self._shared_memory.buf)
+            self._stop_flag = self._shared_memory.buf[table_size:table_size + 8].cast('Q')
+        else:
+            self._shared_memory = None
+            self._stop_flag = None
+            self._transposition_table = TranspositionTable(hash_size_mb)
+        self._move_ordering = MoveOrdering()
+        self._order_moves = order_moves
+        self._quiescence = quiescence
+        self._max_depth = max_depth
+        self._time_limit = time_limit
+        self._node_limit = node_limit
+        self._nodes = 0
+        self._deadline = None
+        self._search_node_limit = None
+
+    def close(self):
+        """
+        Stops the helper processes and releases the shared transposition table.
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._shared_memory is not None:
+            self._transposition_table = TranspositionTable(self._hash_size_mb)
+            self._stop_flag.release()
+            self._stop_flag = None
+            self._shared_memory.close()
+            if self._threads > 1:
+                self._shared_memory.unlink()
+            self._shared_memory = None
+            self._threads = 1
+
+    def search(self, chess_var, max_depth=None, time_limit=None, node_limit=None, start_depth=1):
+        """
+        Finds the best move for the current player.
+
+        Each iteration searches one ply deeper than the last, starting with the previous principal variation.
+        When the time limit or node limit is reached, the result of the last finished iteration is returned.
+        With more than one thread, helper processes search the same game at the same time, starting one ply
+        deeper every other helper, and share what they find through the transposition table. The deepest
+        finished iteration of any process is returned.
+        The game is left exactly as it was passed in.
+
+        Args:
+            chess_var (ChessVar): Game to search.
+            max_depth (int): Overrides _max_depth for this search.
+            time_limit (float): Overrides _time_limit for this search.
+            node_limit (int): Overrides _node_limit for this search.
+            start_depth (int): Depth of the first iteration.
+
+        Returns:
+            result (dict): "move" (best move, or None if there are no moves), "score" (centipawns for the
+            current player), "depth" (last finished iteration), "nodes", "time" (seconds), "pv" (principal variation),
+            "tt" (transposition table counters), and "ordering" (cutoff counters, see MoveOrdering's get_stats()).
+        """
+        max_depth = self._max_depth if max_depth is None else max_depth
+        time_limit = self._time_limit if time_limit is None else time_limit
+        node_limit = self._node_limit if node_limit is None else node_limit
+        start_time = time.perf_counter()
+        self._nodes = 0
+        self._deadline = None if time_limit is None else start_time + time_limit
+        self._search_node_limit = node_limit
+        self._move_ordering.new_search()
+
+        moves = chess_var.generate_moves()
+        if self._order_moves:
+            self._move_ordering.order_moves(chess_var, moves, 0)
+        result = {"move": moves[0] if moves else None, "score": 0, "depth": 0, "nodes": 0, "time": 0.0,
+                  "pv": moves[:1]}
+
+        # Starts the helper searches, which run until the stop flag is set
+        futures = []
+        if self._threads > 1 and moves:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._threads - 1)
+            self._stop_flag[0] = 0
+            notation = chess_var.get_notation()
+            futures = [self._executor.submit(search_helper, self._shared_memory.name, self._hash_size_mb, notation,
+                                             max_depth, 1 + helper % 2, self._order_moves, self._quiescence)
+                       for helper in range(1, self._threads)]
+
+        try:
+            for depth in range(start_depth, max_depth + 1):
+                if not moves:
+                    break
+                try:
+                    score, pv = self.search_root(chess_var, moves, depth)
+                except SearchTimeout:
+                    break
+                result.update({"move": pv[0], "score": score, "depth": depth, "pv": pv})
+
+                # Searches the best move first in the next iteration
+                moves.remove(pv[0])
+                moves.insert(0, pv[0])
+
+                # Stops once a forced win or loss has been found
+                if abs(score) >= WIN_SCORE - max_depth:
+                    break
+        finally:
+            if futures:
+                self._stop_flag[0] = 1
+
+        # Uses the deepest finished iteration of any process
+        for future in futures:
+            helper_result = future.result()
+            self._nodes += helper_result["nodes"]
+            if helper_result["depth"] > result["depth"]:
+                result.update({key: helper_result[key] for key in ["move", "score", "depth", "pv"]})
+
+        result["nodes"] = self._nodes
+        result["time"] = time.perf_counter() - start_time
+        result["tt"] = self._transposition_table.get_stats()
+        result["ordering"] = self._move_ordering.get_stats()
+        return result
+
+    def search_root(self, chess_var, moves, depth):
+        """
+        Searches every move of the current player to a given depth.
+
+        This method is a helper method for search().
+
+        Args:
+            chess_var (ChessVar): Game to search.
+            moves (list): Moves of the current player, best first.
+            depth (int): Plies to search.
+
+        Returns:
+            score, pv (tuple): Score of the best move and the principal variation.
+        """
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        best_pv = None
+        for move in moves:
+            self.push_move(chess_var, move)
+            try:
+                score, pv = self.negamax(chess_var, depth - 1, -beta, -alpha, 1)
+            finally:
+                chess_var.pop()
+            score = -score
+            if best_pv is None or score > alpha:
+                alpha, best_pv = score, [move] + pv
+        return alpha, best_pv
+
+    def negamax(self, chess_var, depth, alpha, beta, ply):
+        """
+        Scores the game with alpha-beta search from the current player's point of view.
+
+        Args:
+            chess_var (ChessVar): Game to search.
+            depth (int): Plies left to search.
+            alpha (int): Lowest score the current player is already assured of.
+            beta (int): Highest score the opponent will allow.
+            ply (int): Plies from the root of the search.
+
+        Returns:
+            score, pv (tuple): Score of the game and the principal variation from it.
+        """
+        self.count_node()
+
+        # The previous move captured a king, so the current player has lost
+        if chess_var.get_game_state() != "UNFINISHED":
+            return -(WIN_SCORE - ply), []
+
+        if depth <= 0:
+            if self._quiescence:
+                return self.quiescence(chess_var, alpha, beta, ply), []
+            return self.evaluate(chess_var), []
+
+        # Uses the stored score if the position was searched deep enough
+        hash_key = chess_var.hash_key()
+        entry = self._transposition_table.probe(hash_key)
+        table_move = None
+        if entry is not None:
+            entry_depth, entry_score, entry_bound, entry_move_code = entry
+            entry_score = self.score_from_table(entry_score, ply)
+            if entry_move_code:
+                table_move = decode_move(entry_move_code)
+            if entry_depth >= depth:
+                if entry_bound == EXACT_BOUND:
+                    return entry_score, self.table_pv(chess_var, depth)
+                if (entry_bound == LOWER_BOUND and entry_score >= beta) or \
+                        (entry_bound == UPPER_BOUND and entry_score <= alpha):
+                    return entry_score, []
+
+        moves = chess_var.generate_moves()
+        if not moves:
+            return 0, []
+
+        # Searches the stored best move first
+        if self._order_moves:
+            self._move_ordering.order_moves(chess_var, moves, ply, table_move)
+        elif table_move in moves:
+            moves.remove(table_move)
+            moves.insert(0, table_move)
+
+        original_alpha = alpha
+        best_move, best_pv = None, []
+        for move_number, move in enumerate(moves):
+            self.push_move(chess_var, move)
+            try:
+                score, pv = self.negamax(chess_var, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                chess_var.pop()
+            score = -score
+            if score >= beta:
+                self._move_ordering.record_cutoff(chess_var, move, ply, depth, move_number)
+                self._transposition_table.store(hash_key, depth, self.score_to_table(score, ply), LOWER_BOUND,
+                                                encode_move(move))
+                return score, [move] + pv
+            if score > alpha:
+                alpha, best_move, best_pv = score, move, [move] + pv
+
+        bound = EXACT_BOUND if alpha > original_alpha else UPPER_BOUND
+        self._transposition_table.store(hash_key, depth, self.score_to_table(alpha, ply), bound,
+                                        encode_move(best_move) if best_move else 0)
+        return alpha, best_pv
+
+    def table_pv(self, chess_var, depth):
+        """
+        Rebuilds the principal variation of a position whose exact score came from the transposition table.
+
+        The stored best move of each position is followed for up to depth moves, stopping at a position
+        with no stored move or with a stored move that is not legal there, as after a hash collision.
+        Bounded scores are not on the principal variation, so they do not need it.
+
+        Args:
+            chess_var (ChessVar): Game to follow the stored moves from.
+            depth (int): Largest number of moves to follow.
+
+        Returns:
+            pv (list): Stored best moves, in order.
+        """
+        pv = []
+        try:
+            while len(pv) < depth and chess_var.get_game_state() == "UNFINISHED":
+                entry = self._transposition_table.probe(chess_var.hash_key())
+                if entry is None or not entry[3]:
+                    break
+                move = decode_move(entry[3])
+                if move not in chess_var.generate_moves():
+                    break
+                self.push_move(chess_var, move)
+                pv.append(move)
+        finally:
+            for _ in pv:
+                chess_var.pop()
+        return pv
+
+    def quiescence(self, chess_var, alpha, beta, ply):
+        """
+        Scores the game by searching captures until the position is quiet.
+
+        The current player may stand pat with the static evaluation, unless their king can be captured,
+        in which case every move is searched. A player who can capture the opposing king wins at once,
+        as determine_winner() would decide. Captures that lose material by static exchange evaluation,
+        or that cannot raise the score to alpha even with DELTA_MARGIN, are skipped.
+
+        Args:
+            chess_var (ChessVar): Game to search.
+            alpha (int): Lowest score the current player is already assured of.
+            beta (int): Highest score the opponent will allow.
+            ply (int): Plies from the root of the search.
+
+        Returns:
+            score (int): Score of the game from the current player's point of view.
+        """
+        self.count_node()
+
+        if chess_var.get_game_state() != "UNFINISHED":
+            return -(WIN_SCORE - ply)
+
+        board = chess_var.get_board()
+        color = chess_var.get_player_turn()
+        opponent = "BLACK" if color == "WHITE" else "WHITE"
+        occupancy = board.get_occupancy()
+        if self.find_king_attacker(board, opponent, color, occupancy) is not None:
+            return WIN_SCORE - ply - 1
+
+        # A player whose king is attacked cannot rely on a quiet move, so every move is searched
+        king_attacked = self.find_king_attacker(board, color, opponent, occupancy) is not None
+        stand_pat = self.evaluate(chess_var)
+        if not king_attacked:
+            if stand_pat >= beta:
+                return stand_pat
+            alpha = max(alpha, stand_pat)
+
+        moves = chess_var.generate_moves()
+        if king_attacked:
+            if not moves:
+                return 0
+        else:
+            opponent_occupancy = board.get_occupancy(opponent)
+            moves = [move for move in moves
+                     if move[2] == 'x' and (opponent_occupancy >> SQUARE_NUMBERS[move[1]]) & 1]
+        if self._order_moves:
+            self._move_ordering.order_moves(chess_var, moves, ply)
+
+        best_score = alpha if not king_attacked else -WIN_SCORE
+        for move in moves:
+            if not king_attacked:
+                victim = board.get_piece(move[1])
+                if stand_pat + PIECE_VALUES.get(victim.upper(), 0) + DELTA_MARGIN <= alpha:
+                    continue
+                if self.static_exchange(chess_var, move) < 0:
+                    continue
+            self.push_move(chess_var, move)
+            try:
+                score = -self.quiescence(chess_var, -beta, -alpha, ply + 1)
+            finally:
+                chess_var.pop()
+            if score > best_score:
+                best_score = score
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+        return best_score
+
+    def find_king_attacker(self, board, color, attacker_color, occupancy):
+        """
+        Finds a piece that can capture a player's king.
+
+        This method is a helper method for quiescence().
+
+        Args:
+            board (Board): Board of the game.
+            color (str): Player whose king may be attacked.
+            attacker_color (str): Player whose pieces may attack it.
+            occupancy (int): Occupied squares.
+
+        Returns:
+            attacker (tuple): Square number and piece of the least valuable attacker, or None.
+        """
+        king_bitboard = board.get_piece_bitboard('K' if color == "WHITE" else 'k')
+        if not king_bitboard:
+            return None
+        return self.find_least_valuable_attacker(board, king_bitboard.bit_length() - 1, attacker_color, occupancy)
+
+    def find_least_valuable_attacker(self, board, square, color, occupancy):
+        """
+        Finds the least valuable piece of a player that can move to a square.
+
+        Only pieces on squares in occupancy are considered, and only squares in occupancy block sliding pieces,
+        so pieces already used in an exchange can be removed from it.
+
+        Args:
+            board (Board): Board of the game.
+            square (int): Square number, from 0 (a8) to 63 (h1).
+            color (str): Player whose pieces may move to the square.
+            occupancy (int): Occupied squares.
+
+        Returns:
+            attacker (tuple): Square number and piece of the attacker, or None.
+        """
+        other_color = "BLACK" if color == "WHITE" else "WHITE"
+        for piece_type in RECAPTURE_ORDER:
+            piece = piece_type if color == "WHITE" else piece_type.lower()
+            piece_bitboard = board.get_piece_bitboard(piece) & occupancy
+            if not piece_bitboard:
+                continue
+
+            if piece_type == 'P':
+                # Pawns capture diagonally forward, so they attack from diagonally behind the square
+                directions = ['SOUTHWEST', 'SOUTHEAST'] if color == "WHITE" else ['NORTHWEST', 'NORTHEAST']
+                for direction in directions:
+                    ray = RAYS[direction][square]
+                    if ray and (piece_bitboard >> ray[0]) & 1:
+                        return ray[0], piece
+            elif piece_type == 'N' or piece_type == 'K':
+                attackers = piece_bitboard & (KNIGHT_MASKS[square] if piece_type == 'N' else KING_MASKS[square])
+                if attackers:
+                    return (attackers & -attackers).bit_length() - 1, piece
+            else:
+                # The opposite of each direction a piece travels is a direction of the other player's piece
+                for ray in SLIDING_RAYS[(piece_type, other_color)][square]:
+                    for ray_square in ray:
+                        if (occupancy >> ray_square) & 1:
+                            if (piece_bitboard >> ray_square) & 1:
+                                return ray_square, piece
+                            break
+        return None
+
+    def static_exchange(self, chess_var, move):
+        """
+        Estimates the material won by a capture if both players keep recapturing on its square
+        with their least valuable piece, and either may stop when recapturing would lose material.
+
+        Args:
+            chess_var (ChessVar): Game the capture belongs to.
+            move (tuple): Capture of the current player.
+
+        Returns:
+            score (int): Material won, in centipawns, from the current player's point of view.
+        """
+        board = chess_var.get_board()
+        start_square, square = SQUARE_NUMBERS[move[0]], SQUARE_NUMBERS[move[1]]
+        gains = [EXCHANGE_VALUES.get(board.get_piece(move[1]).upper(), 0)]
+        piece_value = EXCHANGE_VALUES.get(board.get_piece(move[0]).upper(), 0)
+        occupancy = board.get_occupancy() & ~(1 << start_square)
+        color = "BLACK" if chess_var.get_player_turn() == "WHITE" else "WHITE"
+
+        while True:
+            attacker = self.find_least_valuable_attacker(board, square, color, occupancy)
+            if attacker is None:
+                break
+            gains.append(piece_value - gains[-1])
+            attacker_square, attacker_piece = attacker
+            piece_value = EXCHANGE_VALUES[attacker_piece.upper()]
+            occupancy &= ~(1 << attacker_square)
+            color = "BLACK" if color == "WHITE" else "WHITE"
+
+        # Each player only recaptures if it does not lose material
+        for index in range(len(gains) - 1, 0, -1):
+            gains[index - 1] = -max(-gains[index - 1], gains[index])
+        return gains[0]
+
+    def score_to_table(self, score, ply):
+        """
+        Converts a win or loss score from distance-to-root to distance-to-position before it is stored.
+
+        Args:
+            score (int): Score from the search.
+            ply (int): Plies from the root of the search.
+
+        Returns:
+            score (int): Score to store in the transposition table.
+        """
+        if score >= WIN_THRESHOLD:
+            return score + ply
+        if score <= -WIN_THRESHOLD:
+            return score - ply
+        return score
+
+    def score_from_table(self, score, ply):
+        """
+        Converts a stored win or loss score back to distance-to-root.
+
+        Args:
+            score (int): Score from the transposition table.
+            ply (int): Plies from the root of the search.
+
+        Returns:
+            score (int): Score for the search.
+        """
+        if score >= WIN_THRESHOLD:
+            return score - ply
+        if score <= -WIN_THRESHOLD:
+            return score + ply
+        return score
+
+    def count_node(self):
+        """
+        Counts a visited position and stops the search when a limit has been reached.
+
+        The clock and the stop flag of a parallel search are read every 1024 positions to keep the check cheap.
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        self._nodes += 1
+        if self._search_node_limit is not None and self._nodes > self._search_node_limit:
+            raise SearchTimeout()
+        if self._nodes & 1023 == 0:
+            if self._deadline is not None and time.perf_counter() > self._deadline:
+                raise SearchTimeout()
+            if self._stop_flag is not None and self._stop_flag[0]:
+                raise SearchTimeout()
+
+    def push_move(self, chess_var, move):
+        """
+        Makes a move the search generated, which the game must accept.
+
+        A rejected move means generate_moves() and the move validators disagree, and searching on would pop a move
+        that was never made, so the search stops instead.
+
+        Args:
+            chess_var (ChessVar): Game to make the move in.
+            move (tuple): Move returned by generate_moves().
+
+        Returns:
+            None
+        """
+        if not chess_var.push(move):
+            raise ValueError(f"Generated move {'/'.join(move)} was rejected in {chess_var.get_notation()}")
+
+    def evaluate(self, chess_var):
+        """
+        Scores the game from the current player's point of view, using ChessVar's evaluate().
+
+        Args:
+            chess_var (ChessVar): Game to score.
+
+        Returns:
+            score (int): Score in centipawns.
+        """
+        score = chess_var.evaluate()
+        return score if chess_var.get_player_turn() == "WHITE" else -score
+
+    def get_transposition_table(self):
+        """
+        Retrieves _transposition_table.
+
+        This method does not require any arguments.
+
+        Returns:
+            _transposition_table (TranspositionTable): Positions searched so far.
+        """
+        return self._transposition_table
+
+    def get_move_ordering(self):
+        """
+        Retrieves _move_ordering.
+
+        This method does not require any arguments.
+
+        Returns:
+            _move_ordering (MoveOrdering): Killer moves, history table, and cutoff counters.
+        """
+        return self._move_ordering
+
+    def get_nodes(self):
+        """
+        Retrieves _nodes.
+
+        This method does not require any arguments.
+
+        Returns:
+            _nodes (int): Positions visited by the last search.
+        """
+        return self._nodes
+
+# Engines of a helper process, by the name of the shared memory they search with
+HELPER_ENGINES = {}
+
+def search_helper(shared_memory_name, hash_size_mb, notation, max_depth, start_depth, order_moves, quiescence):
+    """
+    Runs one helper search of a parallel search, in a helper process.
+
+    The helper's Engine is kept between searches so it attaches to the shared transposition table once.
+
+    Args:
+        shared_memory_name (str): Shared memory holding the transposition table and stop flag.
+        hash_size_mb (float): Memory used by the transposition table in megabytes.
+        notation (str): Game to search, from ChessVar's get_notation().
+        max_depth (int): Deepest iteration searched.
+        start_depth (int): Depth of the first iteration.
+        order_moves (bool): Indicates if moves are sorted by MoveOrdering.
+        quiescence (bool): Indicates if captures are searched past the last ply.
+
+    Returns:
+        result (dict): "move", "score", "depth", "pv", and "nodes" of the helper's search.
+    """
+    engine = HELPER_ENGINES.get(shared_memory_name)
+    if engine is None:
+        engine = Engine(hash_size_mb=hash_size_mb, order_moves=order_moves, quiescence=quiescence,
+                        shared_memory_name=shared_memory_name)
+        HELPER_ENGINES[shared_memory_name] = engine
+    result = engine.search(chess_var_from_notation(notation), max_depth, start_depth=start_depth)
+    return {key: result[key] for key in ["move", "score", "depth", "pv", "nodes"]}
@@ -0,0 +1,166 @@
+import unittest
+import copy
+import unittest.mock
+from ChessVar import ChessVar, Pieces
+from Engine import Engine, WIN_SCORE
+
+class TestEngine(unittest.TestCase):
+    def setUp(self):
+        self.chess_var = ChessVar()
+        self.engine = Engine()
+
+    def test_search_captures_king(self):
+        """Search captures the king as soon as it can"""
+        board_display = [['8','r','n','b','q','k','b','n','r'],
+                         ['7','p','p','p','p','.','p','p','p'],
+                         ['6','.','.','.','.','.','.','.','.'],
+                         ['5','.','.','.','.','.','.','.','.'],
+                         ['4','.','.','.','.','Q','.','.','.'],
+                         ['3','.','.','.','.','.','.','.','.'],
+                         ['2','P','P','P','P','P','P','P','P'],
+                         ['1','R','N','B','.','K','B','N','R'],
+                         [' ','a','b','c','d','e','f','g','h']]
+        self.chess_var.get_board().set_board_display(board_display)
+        result = self.engine.search(self.chess_var, max_depth=3)
+        self.assertEqual(result["move"], ('e4', 'e8', 'x'))
+        self.assertEqual(result["score"], WIN_SCORE - 1)
+        self.assertEqual(result["pv"], [('e4', 'e8', 'x')])
+
+    def test_search_defends_king(self):
+        """Search moves the king out of an attack"""
+        board_display = [['8','.','.','.','.','k','.','.','.'],
+                         ['7','.','.','.','.','.','.','.','.'],
+                         ['6','.','.','.','.','.','.','.','.'],
+                         ['5','.','.','.','.','.','.','.','.'],
+                         ['4','.','.','.','.','.','.','.','.'],
+                         ['3','.','.','.','.','.','.','.','.'],
+                         ['2','.','.','.','.','.','.','.','.'],
+                         ['1','.','.','.','.','R','.','.','K'],
+                         [' ','a','b','c','d','e','f','g','h']]
+        self.chess_var.get_board().set_board_display(board_display)
+        self.chess_var.set_player_turn("BLACK")
+        result = self.engine.search(self.chess_var, max_depth=2)
+        self.assertEqual(result["move"][0], 'e8')
+        self.assertNotEqual(result["move"][1][0], 'e')
+        self.assertGreater(result["score"], -WIN_SCORE + 10)
+
+    def test_search_places_fairy_piece(self):
+        """Fairy piece placements are searched like regular moves"""
+        board_display = [['8','P','P','.','.','.','.','.','k'],
+                         ['7','P','P','.','.','.','.','.','.'],
+                         ['6','P','P','.','.','.','.','.','.'],
+                         ['5','P','P','.','.','.','.','.','.'],
+                         ['4','P','P','.','.','.','.','.','.'],
+                         ['3','P','P','.','.','.','.','.','.'],
+                         ['2','P','P','.','.','.','.','.','.'],
+                         ['1','K','P','.','.','.','.','.','.'],
+                         [' ','a','b','c','d','e','f','g','h']]
+        self.chess_var.get_board().set_board_display(board_display)
+        self.chess_var.get_player("WHITE").set_capture_count(1)
+        self.chess_var.get_player("WHITE").set_fairy_piece_entry(True)
+        result = self.engine.search(self.chess_var, max_depth=2)
+        self.assertEqual(result["move"][1], 'x')
+        self.assertIn(result["move"][2], ['F', 'H'])
+
+    def test_search_limits(self):
+        """Search respects its limits and leaves the game unchanged"""
+        before = copy.deepcopy(self.chess_var.get_board().get_board_display())
+        before_hash_key = self.chess_var.hash_key()
+
+        # 1: Node limit
+        result = self.engine.search(self.chess_var, node_limit=500)
+        self.assertLessEqual(result["nodes"], 501)
+        self.assertIn(result["move"], self.chess_var.generate_moves())
+
+        # 2: Time limit
+        result = self.engine.search(self.chess_var, time_limit=0.2)
+        self.assertLess(result["time"], 1.0)
+        self.assertGreaterEqual(result["depth"], 1)
+        self.assertEqual(len(result["pv"]), result["depth"])
+
+        self.assertEqual(self.chess_var.get_board().get_board_display(), before)
+        self.assertEqual(self.chess_var.hash_key(), before_hash_key)
+
+        # 3: Finished game has no move
+        self.chess_var.set_game_state("BLACK_WON")
+        self.assertEqual(self.engine.search(self.chess_var, max_depth=2)["move"], None)
+
+    def test_rejected_move(self):
+        """A generated move the game rejects stops the search and leaves the game unchanged"""
+        before_hash_key = self.chess_var.hash_key()
+        with unittest.mock.patch.object(Pieces, "is_valid_move_for_knight", return_value=False):
+            with self.assertRaises(ValueError):
+                self.engine.search(self.chess_var, max_depth=2)
+        self.assertEqual(self.chess_var.hash_key(), before_hash_key)
+        self.assertEqual(len(self.chess_var.generate_moves()), 20)
+
+    def test_static_exchange(self):
+        """Captures are scored by the material left after both players recapture"""
+        board_display = [['8','.','.','.','r','k','.','.','.'],
+                         ['7','.','.','.','.','.','.','.','.'],
+                         ['6','.','.','.','.','p','.','.','.'],
+                         ['5','.','.','.','p','.','.','.','.'],
+                         ['4','.','.','.','.','.','.','.','.'],
+                         ['3','.','.','.','.','.','F','.','.'],
+                         ['2','.','.','.','Q','.','.','.','.'],
+                         ['1','.','.','.','R','K','.','.','.'],
+                         [' ','a','b','c','d','e','f','g','h']]
+        self.chess_var.get_board().set_board_display(board_display)
+
+        # 1: Queen takes a pawn defended by a pawn, and the falcon takes the pawn back
+        self.assertEqual(self.engine.static_exchange(self.chess_var, ('d2', 'd5', 'x')), 100 - 900 + 100)
+
+        # 2: Falcon takes the pawn and is recaptured; the queen should not follow into the rooks' exchange
+        self.assertEqual(self.engine.static_exchange(self.chess_var, ('f3', 'd5', 'x')), 100 - 400)
+
+        # 3: Undefended by a pawn, the rook's recapture is answered by the queen
+        self.chess_var.get_board().remove_piece('e6')
+        self.assertEqual(self.engine.static_exchange(self.chess_var, ('f3', 'd5', 'x')), 100)
+
+    def test_quiescence(self):
+        """Quiescence search sees captures past the last ply"""
+        board_display = [['8','.','.','.','.','k','.','.','.'],
+                         ['7','.','.','.','.','.','.','.','.'],
+                         ['6','.','.','.','.','p','.','.','.'],
+                         ['5','.','.','.','p','.','.','.','.'],
+                         ['4','.','.','.','.','.','.','.','.'],
+                         ['3','.','.','.','.','.','.','.','.'],
+                         ['2','.','.','.','Q','.','.','.','.'],
+                         ['1','.','.','.','.','K','.','.','.'],
+                         [' ','a','b','c','d','e','f','g','h']]
+        self.chess_var.get_board().set_board_display(board_display)
+
+        # 1: Without quiescence search, a one-ply search takes the defended pawn
+        result = Engine(quiescence=False).search(self.chess_var, max_depth=1)
+        self.assertEqual(result["move"], ('d2', 'd5', 'x'))
+        result = self.engine.search(self.chess_var, max_depth=1)
+        self.assertNotEqual(result["move"], ('d2', 'd5', 'x'))
+
+        # 2: A king that can be captured at the horizon is a loss
+        self.chess_var.get_board().place_piece('e7', 'r')
+        self.chess_var.get_board().remove_piece('e6')
+        score = self.engine.quiescence(self.chess_var, -WIN_SCORE - 1, WIN_SCORE + 1, 0)
+        self.assertGreater(score, -WIN_SCORE + 10)
+        self.chess_var.set_player_turn("BLACK")
+        score = self.engine.quiescence(self.chess_var, -WIN_SCORE - 1, WIN_SCORE + 1, 0)
+        self.assertEqual(score, WIN_SCORE - 1)
+
+    def test_parallel_search(self):
+        """Helper processes search the same game through a shared transposition table"""
+        engine = Engine(threads=3, hash_size_mb=1)
+        try:
+            for move in [('e2', 'e4', 'x'), ('d7', 'd5', 'x')]:
+                self.chess_var.push(move)
+            before_hash_key = self.chess_var.hash_key()
+
+            result = engine.search(self.chess_var, max_depth=3)
+            self.assertEqual(result["move"], ('e4', 'd5', 'x'))
+            self.assertEqual(result["depth"], 3)
+            self.assertEqual(self.chess_var.hash_key(), before_hash_key)
+
+            # Helpers stop with the main search
+            result = engine.search(self.chess_var, time_limit=0.3)
+            self.assertLess(result["time"], 2.0)
+            self.assertIn(result["move"], self.chess_var.generate_moves())
+        finally:
+            engine.close()
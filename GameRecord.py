@@ -0,0 +1,302 @@
+# Author: Helen C
+# GitHub username: hchao7
+# Date: 10/18/26
+# Description: Stores ChessVar games in a compact binary archive that can be read through a memory map
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+from ChessVar import ChessVar, encode_move, decode_move
+
+# File layout: header, then each game's 16-bit move codes, then one index entry per game.
+# All integers are little-endian.
+GAME_RECORD_MAGIC = b"CVGR"
+GAME_RECORD_VERSION = 1
+HEADER_FORMAT = struct.Struct("<4sHHQQ")      # magic, version, reserved, game count, index offset
+INDEX_ENTRY_FORMAT = struct.Struct("<QIB3x")  # move offset, move count, result
+GAME_RESULTS = ["UNFINISHED", "WHITE_WON", "BLACK_WON", "DRAW"]
+GAME_RESULT_CODES = {result: code for code, result in enumerate(GAME_RESULTS)}
+
+def move_to_code(move):
+    """
+    Encodes a move given as a tuple or in start/end/fairy format, such as "d2/e3/x".
+
+    Args:
+        move (tuple or str): Move to encode.
+
+    Returns:
+        move_code (int): 16-bit move code made by encode_move().
+    """
+    if isinstance(move, str):
+        move = move.split("/")
+    return encode_move(move)
+
+class GameRecordWriter:
+    """
+    A class representing a game archive being written, one game at a time.
+
+    The header and index are written when the writer is closed, so a game count is not needed up front.
+    Use it in a with statement so the archive is always closed.
+
+    Attributes:
+        _file (file): Archive being written.
+        _offset (int): Position in the file where the next game's move codes go.
+        _index (bytearray): Index entries of the games written so far.
+        _game_count (int): Number of games written so far.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes a new GameRecordWriter instance and writes a placeholder header.
+
+        Args:
+            path (str): File to write.
+        """
+        self._file = open(path, "wb")
+        self._file.write(HEADER_FORMAT.pack(GAME_RECORD_MAGIC, GAME_RECORD_VERSION, 0, 0, 0))
+        self._offset = HEADER_FORMAT.size
+        self._index = bytearray()
+        self._game_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_game_count(self):
+        """
+        Returns the number of games written so far.
+
+        This method does not require any arguments.
+
+        Returns:
+            game_count (int)
+        """
+        return self._game_count
+
+    def add_game(self, moves, result="UNFINISHED"):
+        """
+        Appends a game to the archive.
+
+        Args:
+            moves (iterable): Moves as tuples, in start/end/fairy format, or as 16-bit move codes.
+            result (str): "UNFINISHED", "DRAW", "WHITE_WON", or "BLACK_WON".
+
+        Returns:
+            None
+        """
+        move_codes = array("H", (move if isinstance(move, int) else move_to_code(move) for move in moves))
+        if sys.byteorder == "big":
+            move_codes.byteswap()
+        self._file.write(move_codes.tobytes())
+        self._index += INDEX_ENTRY_FORMAT.pack(self._offset, len(move_codes), GAME_RESULT_CODES[result])
+        self._offset += 2 * len(move_codes)
+        self._game_count += 1
+
+    def close(self):
+        """
+        Writes the index and header and closes the file.
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        if self._file.closed:
+            return
+        self._file.write(self._index)
+        self._file.seek(0)
+        self._file.write(HEADER_FORMAT.pack(GAME_RECORD_MAGIC, GAME_RECORD_VERSION, 0, self._game_count, self._offset))
+        self._file.close()
+
+class GameRecordReader:
+    """
+    A class representing a game archive opened through a memory map.
+
+    Games are returned as copies of their move codes, so they stay valid after the archive is closed.
+    view_move_codes() reads a game without copying inside a with statement.
+
+    Attributes:
+        _file (file): Archive file.
+        _mmap (mmap): Memory map of the whole file.
+        _game_count (int): Number of games in the archive.
+        _index_offset (int): Position in the file of the first index entry.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes a new GameRecordReader instance and checks the archive's header.
+
+        Args:
+            path (str): Archive written by GameRecordWriter.
+        """
+        self._file = open(path, "rb")
+        if os.fstat(self._file.fileno()).st_size < HEADER_FORMAT.size:
+            self._file.close()
+            raise ValueError(f"Not a game record archive: {path}")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self._game_count, self._index_offset = HEADER_FORMAT.unpack_from(self._mmap, 0)
+        if magic != GAME_RECORD_MAGIC or version != GAME_RECORD_VERSION:
+            self.close()
+            raise ValueError(f"Not a game record archive: {path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._game_count
+
+    def __iter__(self):
+        for game_number in range(self._game_count):
+            yield self.get_move_codes(game_number), self.get_result(game_number)
+
+    def close(self):
+        """
+        Releases the memory map and closes the file.
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        self._mmap.close()
+        self._file.close()
+
+    def get_index_entry(self, game_number):
+        """
+        This method is a helper method for get_move_codes() and get_result().
+
+        Args:
+            game_number (int): Position of the game in the archive.
+
+        Returns:
+            index_entry (tuple): Offset of the first move code, number of moves, and result code.
+        """
+        if not 0 <= game_number < self._game_count:
+            raise IndexError(f"Game {game_number} is not in the archive")
+        return INDEX_ENTRY_FORMAT.unpack_from(self._mmap, self._index_offset + game_number * INDEX_ENTRY_FORMAT.size)
+
+    def get_move_codes(self, game_number):
+        """
+        Returns a copy of the 16-bit move codes of a game.
+
+        Args:
+            game_number (int): Position of the game in the archive.
+
+        Returns:
+            move_codes (array): Move codes, decoded with decode_move().
+        """
+        offset, move_count, _ = self.get_index_entry(game_number)
+        move_codes = array("H", self._mmap[offset:offset + 2 * move_count])
+        if sys.byteorder == "big":
+            move_codes.byteswap()
+        return move_codes
+
+    @contextmanager
+    def view_move_codes(self, game_number):
+        """
+        Gives the 16-bit move codes of a game without copying them, for use in a with statement.
+
+        The view is released when the with statement ends, so the archive can be closed afterwards.
+
+        Args:
+            game_number (int): Position of the game in the archive.
+
+        Returns:
+            move_codes (memoryview or array): Move codes, decoded with decode_move().
+        """
+        if sys.byteorder == "big":
+            yield self.get_move_codes(game_number)
+            return
+        offset, move_count, _ = self.get_index_entry(game_number)
+        with memoryview(self._mmap) as view, view[offset:offset + 2 * move_count] as game_view, \
+                game_view.cast("H") as move_codes:
+            yield move_codes
+
+    def get_moves(self, game_number):
+        """
+        Returns the moves of a game as tuples of start coordinate, end coordinate, and fairy piece.
+
+        Args:
+            game_number (int): Position of the game in the archive.
+
+        Returns:
+            moves (list)
+        """
+        return [decode_move(move_code) for move_code in self.get_move_codes(game_number)]
+
+    def get_result(self, game_number):
+        """
+        Returns the result of a game: "UNFINISHED", "WHITE_WON", "BLACK_WON", or "DRAW".
+
+        Args:
+            game_number (int): Position of the game in the archive.
+
+        Returns:
+            result (str)
+        """
+        return GAME_RESULTS[self.get_index_entry(game_number)[2]]
+
+    def replay_game(self, game_number):
+        """
+        Replays a game from the starting position.
+
+        Args:
+            game_number (int): Position of the game in the archive.
+
+        Returns:
+            chess_var (ChessVar): Game after its last move.
+        """
+        chess_var = ChessVar()
+        for move_code in self.get_move_codes(game_number):
+            if not chess_var.push(decode_move(move_code)):
+                raise ValueError(f"Game {game_number} has an illegal move: {'/'.join(decode_move(move_code))}")
+        return chess_var
+
+def write_game_records(path, games):
+    """
+    Writes games to an archive.
+
+    Args:
+        path (str): File to write.
+        games (iterable): Pairs of moves and result, as taken by GameRecordWriter's add_game().
+
+    Returns:
+        game_count (int): Number of games written.
+    """
+    with GameRecordWriter(path) as writer:
+        for moves, result in games:
+            writer.add_game(moves, result)
+        return writer.get_game_count()
+
+def main(argv=None):
+    """
+    Converts a JSON lines file of games, such as the output of Tournament.py, into an archive.
+
+    Args:
+        argv (list): Command line arguments, or None to read them from sys.argv.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Convert JSON lines game records into a binary archive.")
+    parser.add_argument("input", help='JSON lines file with "moves" and "result" in each record')
+    parser.add_argument("output", help="archive to write")
+    args = parser.parse_args(argv)
+
+    with open(args.input) as input_file:
+        records = (json.loads(line) for line in input_file if line.strip())
+        game_count = write_game_records(args.output, ((record["moves"], record["result"]) for record in records))
+    print(f"{game_count} games: {os.path.getsize(args.input)} bytes -> {os.path.getsize(args.output)} bytes")
+
+if __name__ == "__main__":
+    main()
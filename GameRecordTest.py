@@ -0,0 +1,90 @@
+import unittest
+import os
+import json
+import tempfile
+import unittest.mock
+from ChessVar import ChessVar, encode_move
+from GameRecord import GameRecordWriter, GameRecordReader, write_game_records, main
+from Tournament import play_game
+
+class TestGameRecord(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.cvgr")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_write_and_read(self):
+        """Games are read back exactly as they were written"""
+        games = [(["e2/e4/x", "d7/d5/x", "e4/d5/x"], "UNFINISHED"),
+                 ([], "DRAW"),
+                 ([('e2', 'e4', 'x'), ('f7', 'f6', 'x'), ('d1', 'h5', 'x'), ('g7', 'g6', 'x'),
+                   ('h5', 'g6', 'x'), ('h7', 'g6', 'x')], "UNFINISHED")]
+        self.assertEqual(write_game_records(self.path, games), 3)
+
+        with GameRecordReader(self.path) as reader:
+            self.assertEqual(len(reader), 3)
+            self.assertEqual(reader.get_moves(0), [('e2', 'e4', 'x'), ('d7', 'd5', 'x'), ('e4', 'd5', 'x')])
+            self.assertEqual(list(reader.get_move_codes(0)), [encode_move(('e2', 'e4', 'x')),
+                                                              encode_move(('d7', 'd5', 'x')),
+                                                              encode_move(('e4', 'd5', 'x'))])
+            self.assertEqual(reader.get_moves(1), [])
+            self.assertEqual(reader.get_result(1), "DRAW")
+            self.assertEqual(reader.get_moves(2), games[2][0])
+            self.assertEqual([len(move_codes) for move_codes, result in reader], [3, 0, 6])
+
+            # Replaying reaches the same game
+            chess_var = ChessVar()
+            for move in games[2][0]:
+                chess_var.push(move)
+            self.assertEqual(reader.replay_game(2).hash_key(), chess_var.hash_key())
+
+            with self.assertRaises(IndexError):
+                reader.get_moves(3)
+
+    def test_close_after_reading(self):
+        """Move codes read from an archive do not keep it open"""
+        write_game_records(self.path, [(["e2/e4/x", "d7/d5/x"], "UNFINISHED"), (["d2/d4/x"], "DRAW")])
+
+        # 1: Iterating inside a with statement and leaving it
+        total = 0
+        with GameRecordReader(self.path) as reader:
+            for move_codes, result in reader:
+                total += len(move_codes)
+            move_codes = reader.get_move_codes(0)
+        self.assertEqual(total, 3)
+        self.assertEqual(list(move_codes), [encode_move(('e2', 'e4', 'x')), encode_move(('d7', 'd5', 'x'))])
+
+        # 2: Views are released at the end of their with statement
+        with GameRecordReader(self.path) as reader:
+            with reader.view_move_codes(1) as move_codes:
+                self.assertEqual(list(move_codes), [encode_move(('d2', 'd4', 'x'))])
+
+    def test_fairy_pieces_and_results(self):
+        """Fairy piece placements and finished games are stored"""
+        record = play_game(0, "greedy", "random", 7)
+        with GameRecordWriter(self.path) as writer:
+            writer.add_game(record["moves"], record["result"])
+        with GameRecordReader(self.path) as reader:
+            self.assertEqual(["/".join(move) for move in reader.get_moves(0)], record["moves"])
+            self.assertEqual(reader.get_result(0), record["result"])
+            self.assertEqual(reader.replay_game(0).get_game_state(), reader.get_result(0))
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as output_file:
+            output_file.write(b"e2/e4/x\n" * 10)
+        with self.assertRaises(ValueError):
+            GameRecordReader(self.path)
+
+    def test_command_line(self):
+        """Converting JSON lines records shrinks them"""
+        jsonl_path = os.path.join(self.directory.name, "games.jsonl")
+        with open(jsonl_path, "w") as jsonl_file:
+            for game_number in range(4):
+                jsonl_file.write(json.dumps(play_game(game_number, "random", "random", game_number)) + "\n")
+        with open(os.devnull, "w") as devnull, unittest.mock.patch("sys.stdout", devnull):
+            main([jsonl_path, self.path])
+        with GameRecordReader(self.path) as reader:
+            self.assertEqual(len(reader), 4)
+        self.assertLess(os.path.getsize(self.path) * 4, os.path.getsize(jsonl_path))
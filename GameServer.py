@@ -0,0 +1,352 @@
+# Author: Helen C
+# GitHub username: hchao7
+# Date: 10/18/26
+# Description: Hosts many ChessVar games at once over TCP with a line-delimited JSON protocol
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+from ChessVar import ChessVar, chess_var_from_notation
+from Instrumentation import INSTRUMENTATION
+
+# Requests and responses are one JSON object per line. Every request has an "op" and may have an "id",
+# which is copied into its response. Responses have "ok" and, when "ok" is false, an "error".
+#   {"op": "create", "notation": optional}           -> {"game": id, "notation": ...}
+#   {"op": "move", "game": id, "move": "d2/d4/x"}    -> {"turn": ..., "game_state": ...}
+#   {"op": "state", "game": id}                      -> {"notation": ..., "turn": ..., "game_state": ...}
+#   {"op": "moves", "game": id}                      -> {"moves": ["d2/d4/x", ...]}
+#   {"op": "close", "game": id}                      -> {}
+# Any connection can read a game's state and moves, but only the connection that created it can move or close it.
+MAX_LINE_LENGTH = 4096
+WRITE_BUFFER_HIGH_WATER = 64 * 1024
+
+class GameServer:
+    """
+    A class representing a server hosting ChessVar games, kept in a session table by game id.
+
+    Each connection handles one request at a time and waits for its response to be sent before reading
+    the next, so a client that stops reading stops being served instead of filling the server's memory.
+
+    Attributes:
+        _sessions (dict): Maps game ids to ChessVar games.
+        _game_ids (itertools.count): Source of new game ids.
+        _max_sessions (int): Largest number of games hosted at once.
+        _server (asyncio.Server): Listening server, or None before start().
+        _stats (dict): Counts of "connections" open, "requests" answered, and "errors" returned.
+    """
+
+    def __init__(self, max_sessions=100000):
+        """
+        Initializes a new GameServer instance with an empty session table.
+
+        Args:
+            max_sessions (int): Largest number of games hosted at once.
+        """
+        self._sessions = {}
+        self._game_ids = itertools.count(1)
+        self._max_sessions = max_sessions
+        self._server = None
+        self._stats = {"connections": 0, "requests": 0, "errors": 0}
+
+    def get_sessions(self):
+        """
+        Returns the session table, which maps game ids to ChessVar games.
+
+        This method does not require any arguments.
+
+        Returns:
+            sessions (dict)
+        """
+        return self._sessions
+
+    def get_stats(self):
+        """
+        Returns the number of open connections, requests handled, and requests that failed.
+
+        This method does not require any arguments.
+
+        Returns:
+            stats (dict): "connections", "requests", "errors", and "sessions".
+        """
+        return dict(self._stats, sessions=len(self._sessions))
+
+    async def start(self, host="127.0.0.1", port=8765):
+        """
+        Starts listening for connections.
+
+        Args:
+            host (str): Address to listen on.
+            port (int): Port to listen on, or 0 for any free port.
+
+        Returns:
+            port (int): Port the server is listening on.
+        """
+        self._server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE_LENGTH)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """
+        Serves connections until the server is closed.
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """
+        Stops listening for connections.
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def handle_connection(self, reader, writer):
+        """
+        Answers the requests of one connection until it is closed.
+
+        Games created by the connection and not closed are removed from the session table when it ends,
+        so clients that disconnect without closing their games do not use up max_sessions.
+
+        Args:
+            reader (asyncio.StreamReader): Incoming requests.
+            writer (asyncio.StreamWriter): Outgoing responses.
+
+        Returns:
+            None
+        """
+        self._stats["connections"] += 1
+        writer.transport.set_write_buffer_limits(high=WRITE_BUFFER_HIGH_WATER)
+        game_ids = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    writer.write(b'{"ok": false, "error": "request too long"}\n')
+                    break
+                if not line:
+                    break
+                writer.write(self.handle_line(line, game_ids))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._stats["connections"] -= 1
+            for game_id in game_ids:
+                self._sessions.pop(game_id, None)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def handle_line(self, line, game_ids=None):
+        """
+        Answers one request.
+
+        Args:
+            line (bytes): Request as a line of JSON.
+            game_ids (set): Ids of the games created by the connection, or None if they are not tracked.
+
+        Returns:
+            response (bytes): Response as a line of JSON.
+        """
+        self._stats["requests"] += 1
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+            request_id = request.get("id")
+            response = self.handle_request(request, game_ids)
+            response["ok"] = True
+        except (ValueError, KeyError, TypeError) as error:
+            self._stats["errors"] += 1
+            response = {"ok": False, "error": str(error) if not isinstance(error, KeyError) else f"missing {error}"}
+        if request_id is not None:
+            response["id"] = request_id
+        return (json.dumps(response) + "\n").encode()
+
+    def handle_request(self, request, game_ids=None):
+        """
+        This method is a helper method for handle_line().
+
+        Args:
+            request (dict): Decoded request.
+            game_ids (set): Ids of the games created by the connection, or None if they are not tracked.
+            Only these games can be moved in or closed when they are tracked.
+
+        Returns:
+            response (dict): Fields of the response other than "ok" and "id".
+        """
+        op = request["op"]
+        if op == "create":
+            if len(self._sessions) >= self._max_sessions:
+                raise ValueError("too many games")
+            if request.get("notation"):
+                if not isinstance(request["notation"], str):
+                    raise ValueError("notation must be a string")
+                chess_var = chess_var_from_notation(request["notation"])
+            else:
+                chess_var = ChessVar()
+            game_id = next(self._game_ids)
+            self._sessions[game_id] = chess_var
+            if game_ids is not None:
+                game_ids.add(game_id)
+            return {"game": game_id, "notation": chess_var.get_notation()}
+
+        chess_var = self.get_session(request["game"])
+        if op in ["move", "close"] and game_ids is not None and request["game"] not in game_ids:
+            raise ValueError(f"game {request['game']} belongs to another connection")
+        if op == "move":
+            if not isinstance(request["move"], str):
+                raise ValueError("move must be a string")
+            move = request["move"].split("/")
+            if len(move) != 3 or not chess_var.push(tuple(move)):
+                raise ValueError(f"illegal move: {request['move']}")
+            return {"turn": chess_var.get_player_turn(), "game_state": chess_var.get_game_state()}
+        if op == "state":
+            return {"notation": chess_var.get_notation(), "turn": chess_var.get_player_turn(),
+                    "game_state": chess_var.get_game_state()}
+        if op == "moves":
+            return {"moves": ["/".join(move) for move in chess_var.generate_moves()]}
+        if op == "close":
+            del self._sessions[request["game"]]
+            if game_ids is not None:
+                game_ids.discard(request["game"])
+            return {}
+        raise ValueError(f"unknown op: {op}")
+
+    def get_session(self, game_id):
+        """
+        This method is a helper method for handle_request().
+
+        Args:
+            game_id (int): Id returned by a create request.
+
+        Returns:
+            chess_var (ChessVar)
+        """
+        if game_id not in self._sessions:
+            raise ValueError(f"unknown game: {game_id}")
+        return self._sessions[game_id]
+
+async def simulate_client(host, port, games, seed, max_plies, latencies):
+    """
+    This method is a helper method for simulate().
+
+    Plays games over one connection, with random legal moves, one request at a time.
+
+    Args:
+        host (str): Address of the server.
+        port (int): Port of the server.
+        games (int): Number of games to play.
+        seed (int): Seed of the client's random number generator.
+        max_plies (int): Number of moves after which a game is abandoned.
+        latencies (list): Receives the seconds taken by each move request.
+
+    Returns:
+        moves (int): Number of moves played.
+    """
+    generator = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port, limit=1 << 20)
+
+    async def send(request):
+        writer.write((json.dumps(request) + "\n").encode())
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    moves = 0
+    for _ in range(games):
+        game_id = (await send({"op": "create"}))["game"]
+        for _ in range(max_plies):
+            legal_moves = (await send({"op": "moves", "game": game_id}))["moves"]
+            if not legal_moves:
+                break
+            start_time = time.perf_counter()
+            response = await send({"op": "move", "game": game_id, "move": generator.choice(legal_moves)})
+            latencies.append(time.perf_counter() - start_time)
+            moves += 1
+            if response["game_state"] != "UNFINISHED":
+                break
+        await send({"op": "close", "game": game_id})
+    writer.close()
+    await writer.wait_closed()
+    return moves
+
+async def simulate(host, port, clients=100, games_per_client=1, max_plies=100, seed=0):
+    """
+    Load-tests a server with many clients playing at the same time.
+
+    Args:
+        host (str): Address of the server.
+        port (int): Port of the server.
+        clients (int): Number of connections, each playing its games one after another.
+        games_per_client (int): Number of games each connection plays.
+        max_plies (int): Number of moves after which a game is abandoned.
+        seed (int): Seed of the first client; client n uses seed + n.
+
+    Returns:
+        report (dict): "games", "moves", "time" (seconds), "moves_per_second", and move latency
+        "latency_p50" and "latency_p99" (seconds).
+    """
+    latencies = []
+    start_time = time.perf_counter()
+    moves = await asyncio.gather(*(simulate_client(host, port, games_per_client, seed + client, max_plies, latencies)
+                                   for client in range(clients)))
+    elapsed = time.perf_counter() - start_time
+    latencies.sort()
+    return {"games": clients * games_per_client, "moves": sum(moves), "time": elapsed,
+            "moves_per_second": sum(moves) / elapsed if elapsed > 0 else 0.0,
+            "latency_p50": latencies[len(latencies) // 2] if latencies else 0.0,
+            "latency_p99": latencies[len(latencies) * 99 // 100] if latencies else 0.0}
+
+def main(argv=None):
+    """
+    Runs the server, or the client simulator, from the command line.
+
+    Args:
+        argv (list): Command line arguments, or None to read them from sys.argv.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Host ChessVar games over TCP, or load-test a host.")
+    parser.add_argument("mode", choices=["serve", "simulate"])
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on or connect to")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on or connect to")
+    parser.add_argument("--clients", type=int, default=1000, help="simulated connections")
+    parser.add_argument("--games", type=int, default=1, help="games played by each simulated connection")
+    parser.add_argument("--max-plies", type=int, default=100, help="moves after which a simulated game is abandoned")
+    parser.add_argument("--metrics-port", type=int, help="instrument the rules and serve /metrics on this port")
+    args = parser.parse_args(argv)
+
+    if args.mode == "serve":
+        if args.metrics_port is not None:
+            INSTRUMENTATION.enable()
+            print(f"metrics on {args.host}:{INSTRUMENTATION.start_server(args.host, args.metrics_port)}")
+        async def serve():
+            server = GameServer()
+            port = await server.start(args.host, args.port)
+            print(f"listening on {args.host}:{port}")
+            await server.serve_forever()
+        asyncio.run(serve())
+    else:
+        report = asyncio.run(simulate(args.host, args.port, args.clients, args.games, args.max_plies))
+        print(f"{report['games']} games, {report['moves']} moves in {report['time']:.1f}s "
+              f"({report['moves_per_second']:.0f} moves/s, p50 {report['latency_p50'] * 1000:.2f}ms, "
+              f"p99 {report['latency_p99'] * 1000:.2f}ms)")
+
+if __name__ == "__main__":
+    main()
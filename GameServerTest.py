@@ -0,0 +1,113 @@
+import unittest
+import asyncio
+import json
+from GameServer import GameServer, simulate
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = GameServer(max_sessions=50)
+        self.port = await self.server.start("127.0.0.1", 0)
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", self.port)
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.server.close()
+
+    async def send(self, request):
+        self.writer.write((json.dumps(request) + "\n").encode())
+        await self.writer.drain()
+        return json.loads(await self.reader.readline())
+
+    async def test_requests(self):
+        """Games are created, played, and closed through requests"""
+        # 1: Create
+        response = await self.send({"op": "create", "id": 1})
+        self.assertEqual((response["ok"], response["id"]), (True, 1))
+        game_id = response["game"]
+        self.assertEqual(response["notation"], "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w FH/fh 0/0 -/-")
+
+        # 2: Moves
+        self.assertEqual(len((await self.send({"op": "moves", "game": game_id}))["moves"]), 20)
+        response = await self.send({"op": "move", "game": game_id, "move": "e2/e4/x"})
+        self.assertEqual((response["ok"], response["turn"], response["game_state"]), (True, "BLACK", "UNFINISHED"))
+        response = await self.send({"op": "state", "game": game_id})
+        self.assertEqual(response["notation"], "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b FH/fh 0/0 -/-")
+
+        # 3: Errors do not close the connection
+        for request in [{"op": "move", "game": game_id, "move": "e2/e4/x"},
+                        {"op": "move", "game": game_id, "move": "e7"},
+                        {"op": "move", "game": 999, "move": "e7/e5/x"},
+                        {"op": "move", "game": game_id},
+                        {"op": "move", "game": game_id, "move": 5},
+                        {"op": "create", "notation": 5},
+                        {"op": "jump"}]:
+            self.assertEqual((await self.send(request))["ok"], False)
+        self.writer.write(b"not json\n")
+        self.assertEqual(json.loads(await self.reader.readline())["ok"], False)
+
+        # 4: Create from notation and close
+        response = await self.send({"op": "create", "notation": "4k3/8/8/8/8/8/8/4K2R w -/- 0/0 -/-"})
+        self.assertEqual(len(self.server.get_sessions()), 2)
+        self.assertEqual((await self.send({"op": "close", "game": response["game"]}))["ok"], True)
+        self.assertEqual(len(self.server.get_sessions()), 1)
+        self.assertEqual(self.server.get_stats()["errors"], 8)
+
+    async def test_session_limit(self):
+        for _ in range(50):
+            self.assertEqual((await self.send({"op": "create"}))["ok"], True)
+        response = await self.send({"op": "create"})
+        self.assertEqual((response["ok"], response["error"]), (False, "too many games"))
+
+    async def test_disconnect(self):
+        """Games a client leaves open are removed when it disconnects"""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        for _ in range(3):
+            writer.write(b'{"op": "create"}\n')
+            await writer.drain()
+            self.assertEqual(json.loads(await reader.readline())["ok"], True)
+        self.assertEqual((await self.send({"op": "create"}))["ok"], True)
+        self.assertEqual(len(self.server.get_sessions()), 4)
+        writer.close()
+        await writer.wait_closed()
+        while self.server.get_stats()["connections"] > 1:
+            await asyncio.sleep(0.01)
+        self.assertEqual(len(self.server.get_sessions()), 1)
+
+    async def test_game_ownership(self):
+        """Only the connection that created a game can move in it or close it"""
+        game_id = (await self.send({"op": "create"}))["game"]
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        self.addAsyncCleanup(writer.wait_closed)
+        self.addCleanup(writer.close)
+
+        async def send_other(request):
+            writer.write((json.dumps(request) + "\n").encode())
+            await writer.drain()
+            return json.loads(await reader.readline())
+
+        # 1: The other client can look at the game but not change it
+        self.assertEqual((await send_other({"op": "state", "game": game_id}))["ok"], True)
+        for request in [{"op": "move", "game": game_id, "move": "e2/e4/x"}, {"op": "close", "game": game_id}]:
+            response = await send_other(request)
+            self.assertEqual((response["ok"], response["error"]),
+                             (False, f"game {game_id} belongs to another connection"))
+        self.assertEqual(len(self.server.get_sessions()), 1)
+
+        # 2: The owner still can
+        self.assertEqual((await self.send({"op": "move", "game": game_id, "move": "e2/e4/x"}))["ok"], True)
+        self.assertEqual((await self.send({"op": "close", "game": game_id}))["ok"], True)
+
+    async def test_request_too_long(self):
+        self.writer.write(b"x" * 10000 + b"\n")
+        response = json.loads(await self.reader.readline())
+        self.assertEqual(response["ok"], False)
+        self.assertEqual(await self.reader.readline(), b"")
+
+    async def test_simulate(self):
+        """Simulated clients play concurrent games to the end"""
+        report = await simulate("127.0.0.1", self.port, clients=20, games_per_client=2, max_plies=30)
+        self.assertEqual(report["games"], 40)
+        self.assertGreater(report["moves"], 40)
+        self.assertGreater(report["latency_p99"], 0)
+        self.assertEqual(len(self.server.get_sessions()), 0)
@@ -0,0 +1,438 @@
+# Author: Helen C
+# GitHub username: hchao7
+# Date: 10/18/26
+# Description: Counts and times calls of ChessVar's rules hot paths when switched on at runtime
+
+import argparse
+import bisect
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from ChessVar import ChessVar, Pieces
+
+# Upper bounds of the latency histogram buckets, in seconds; the last bucket has no bound
+HISTOGRAM_BOUNDS = [1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 1e-1]
+
+def verify_player_square_rejection(chess_var, alg_start_coordinate, alg_end_coordinate):
+    """
+    Explains why ChessVar's verify_player_square() rejects a move, following the order of its checks.
+
+    Args:
+        chess_var (ChessVar): Game the move is checked in.
+        alg_start_coordinate (str): Piece's current position.
+        alg_end_coordinate (str): Piece's potential end position.
+
+    Returns:
+        reason (str): Reason for the rejection, or None if the squares are valid.
+    """
+    board = chess_var.get_board()
+    if alg_start_coordinate == alg_end_coordinate:
+        return "same square"
+    if [False, False] in [board.alg_coordinate_to_list_index(alg_start_coordinate),
+                          board.alg_coordinate_to_list_index(alg_end_coordinate)]:
+        return "off the board"
+    start_piece = board.get_piece(alg_start_coordinate)
+    end_piece = board.get_piece(alg_end_coordinate)
+    if start_piece == ".":
+        return "empty start square"
+    white_to_move = chess_var.get_player_turn() == "WHITE"
+    if start_piece.isupper() != white_to_move:
+        return "opponent's piece"
+    if end_piece != "." and end_piece.isupper() == white_to_move:
+        return "own piece on end square"
+    return None
+
+def make_move_rejection(chess_var, alg_start_coordinate, alg_end_coordinate):
+    """
+    Explains why ChessVar's make_move() rejected a move, following the order of its checks.
+
+    Args:
+        chess_var (ChessVar): Game the move was made in.
+        alg_start_coordinate (str): Piece's current position.
+        alg_end_coordinate (str): Piece's potential end position.
+
+    Returns:
+        reason (str)
+    """
+    reason = verify_player_square_rejection(chess_var, alg_start_coordinate, alg_end_coordinate)
+    if reason is not None:
+        return reason
+    if chess_var.get_game_state() != "UNFINISHED":
+        return "game finished"
+    return f"illegal {chess_var.get_board().get_piece(alg_start_coordinate).upper()} move"
+
+def enter_fairy_piece_rejection(chess_var, fairy_piece_type, placement_square):
+    """
+    Explains why ChessVar's enter_fairy_piece() rejected a placement, following the order of its checks.
+
+    Args:
+        chess_var (ChessVar): Game the fairy piece was placed in.
+        fairy_piece_type (str): Fairy piece that was placed.
+        placement_square (str): Square where the fairy piece was placed.
+
+    Returns:
+        reason (str)
+    """
+    board = chess_var.get_board()
+    row, column = board.alg_coordinate_to_list_index(placement_square)
+    if [row, column] == [False, False]:
+        return "off the board"
+    if row not in ([6, 7] if chess_var.get_player_turn() == "WHITE" else [0, 1]):
+        return "outside home ranks"
+    if board.get_piece_with_list_index([row, column]) != ".":
+        return "occupied square"
+    if fairy_piece_type not in chess_var.get_player(chess_var.get_player_turn()).get_reserve_list():
+        return "not in reserve"
+    return "fairy piece entry not allowed"
+
+# Functions instrumented by default, as (class, method name, function naming why a call returned False).
+# The Pieces methods are plain functions called through the class; the ChessVar methods are called on games.
+DEFAULT_TARGETS = [
+    (Pieces, "identify_direction", None),
+    (Pieces, "identify_blocked_square", None),
+    (ChessVar, "make_move", make_move_rejection),
+    (ChessVar, "verify_player_square", verify_player_square_rejection),
+    (ChessVar, "is_valid_move", None),
+    (ChessVar, "enter_fairy_piece", enter_fairy_piece_rejection),
+    (ChessVar, "generate_moves", None),
+    (ChessVar, "push", None),
+    (ChessVar, "pop", None),
+]
+
+class FunctionStats:
+    """
+    A class representing the calls of one instrumented function: count, latency histogram, and rejection reasons.
+
+    Attributes:
+        _calls (int): Number of calls.
+        _total_seconds (float): Time taken by all calls.
+        _buckets (list): Calls per latency bucket, bounded by HISTOGRAM_BOUNDS, the last one unbounded.
+        _rejections (dict): Maps each reason a call returned False to its number of calls.
+    """
+
+    def __init__(self):
+        """
+        Initializes a new FunctionStats instance with no calls recorded.
+
+        This method does not require any arguments.
+        """
+        self._calls = 0
+        self._total_seconds = 0.0
+        self._buckets = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self._rejections = {}
+
+    def record_call(self, seconds):
+        """
+        Counts one call and adds its latency to the histogram.
+
+        Args:
+            seconds (float): Time the call took.
+
+        Returns:
+            None
+        """
+        self._calls += 1
+        self._total_seconds += seconds
+        self._buckets[bisect.bisect_left(HISTOGRAM_BOUNDS, seconds)] += 1
+
+    def record_rejection(self, reason):
+        """
+        Counts one call that returned False.
+
+        Args:
+            reason (str): Why the call returned False.
+
+        Returns:
+            None
+        """
+        self._rejections[reason] = self._rejections.get(reason, 0) + 1
+
+    def snapshot(self):
+        """
+        Copies the statistics.
+
+        This method does not require any arguments.
+
+        Returns:
+            stats (dict): "calls", "total_seconds", "buckets" (calls per histogram bucket, the last one
+            unbounded), and "rejections" (calls that returned False, by reason).
+        """
+        return {"calls": self._calls, "total_seconds": self._total_seconds, "buckets": list(self._buckets),
+                "rejections": dict(self._rejections)}
+
+class Instrumentation:
+    """
+    A class representing instrumentation of ChessVar's rules hot paths that can be switched on and off at runtime.
+
+    enable() replaces each target method on its class with a wrapper that counts and times its calls,
+    and disable() puts the original methods back, so nothing is added to a call while instrumentation is off.
+
+    Attributes:
+        _targets (list): (class, method name, rejection function) of each instrumented method.
+        _originals (dict): Original methods replaced by enable(), empty while instrumentation is off.
+        _stats (dict): Maps function names from get_name() to their FunctionStats.
+        _lock (threading.Lock): Keeps enable(), disable(), and reset() from running at the same time.
+        _server (ThreadingHTTPServer): Metrics server started by start_server(), or None.
+    """
+
+    def __init__(self, targets=None):
+        """
+        Initializes a new Instrumentation instance, switched off.
+
+        Args:
+            targets (list): (class, method name, rejection function) of each method to instrument,
+            or None for DEFAULT_TARGETS.
+        """
+        self._targets = DEFAULT_TARGETS if targets is None else targets
+        self._originals = {}
+        self._stats = {self.get_name(owner, method_name): FunctionStats() for owner, method_name, _ in self._targets}
+        self._lock = threading.Lock()
+        self._server = None
+
+    @staticmethod
+    def get_name(owner, method_name):
+        """
+        Names an instrumented function in snapshots and exports, such as "ChessVar.make_move".
+
+        Args:
+            owner (type): Class of the method.
+            method_name (str): Name of the method.
+
+        Returns:
+            name (str)
+        """
+        return f"{owner.__name__}.{method_name}"
+
+    def is_enabled(self):
+        """
+        Returns whether the target methods are instrumented.
+
+        This method does not require any arguments.
+
+        Returns:
+            enabled (bool)
+        """
+        return bool(self._originals)
+
+    def enable(self):
+        """
+        Replaces each target method with a wrapper that counts and times its calls.
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._originals:
+                return
+            for owner, method_name, explain in self._targets:
+                original = owner.__dict__[method_name]
+                self._originals[(owner, method_name)] = original
+                setattr(owner, method_name, self.make_wrapper(original, self._stats[self.get_name(owner, method_name)],
+                                                              explain))
+
+    def disable(self):
+        """
+        Puts the original target methods back. The statistics are kept.
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            for (owner, method_name), original in self._originals.items():
+                setattr(owner, method_name, original)
+            self._originals = {}
+
+    def reset(self):
+        """
+        Clears the statistics.
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            for stats in self._stats.values():
+                stats.__init__()
+
+    @staticmethod
+    def make_wrapper(original, stats, explain):
+        """
+        This method is a helper method for enable().
+
+        Args:
+            original (function): Method to instrument.
+            stats (FunctionStats): Statistics of the method.
+            explain (function): Takes the method's arguments and names why it returned False, or None
+            to count no rejections.
+
+        Returns:
+            wrapper (function): Method that calls the original and records the call.
+        """
+        perf_counter = time.perf_counter
+
+        def wrapper(*args, **kwargs):
+            start_time = perf_counter()
+            result = original(*args, **kwargs)
+            stats.record_call(perf_counter() - start_time)
+            if result is False and explain is not None:
+                stats.record_rejection(explain(*args, **kwargs) or "other")
+            return result
+
+        wrapper.__name__ = original.__name__
+        wrapper.__doc__ = original.__doc__
+        wrapper.__wrapped__ = original
+        return wrapper
+
+    def snapshot(self):
+        """
+        Copies the statistics of every target method.
+
+        This method does not require any arguments.
+
+        Returns:
+            snapshot (dict): "enabled", "histogram_bounds" (seconds), and "functions", which maps each name
+            from get_name() to the statistics of FunctionStats's snapshot().
+        """
+        return {"enabled": self.is_enabled(), "histogram_bounds": list(HISTOGRAM_BOUNDS),
+                "functions": {name: stats.snapshot() for name, stats in self._stats.items()}}
+
+    def to_json(self):
+        """
+        Exports the statistics as JSON.
+
+        This method does not require any arguments.
+
+        Returns:
+            text (str): JSON of snapshot().
+        """
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        """
+        Exports the statistics in the Prometheus text exposition format.
+
+        This method does not require any arguments.
+
+        Returns:
+            text (str): Call counters, cumulative latency histograms, and rejection counters, labeled by function.
+        """
+        functions = self.snapshot()["functions"]
+        lines = ["# HELP chessvar_calls_total Calls of instrumented ChessVar functions.",
+                 "# TYPE chessvar_calls_total counter"]
+        for name, stats in functions.items():
+            lines.append(f'chessvar_calls_total{{function="{name}"}} {stats["calls"]}')
+
+        lines += ["# HELP chessvar_call_duration_seconds Latency of instrumented ChessVar functions.",
+                  "# TYPE chessvar_call_duration_seconds histogram"]
+        for name, stats in functions.items():
+            cumulative = 0
+            for bound, count in zip([repr(bound) for bound in HISTOGRAM_BOUNDS] + ["+Inf"], stats["buckets"]):
+                cumulative += count
+                lines.append(f'chessvar_call_duration_seconds_bucket{{function="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'chessvar_call_duration_seconds_sum{{function="{name}"}} {stats["total_seconds"]!r}')
+            lines.append(f'chessvar_call_duration_seconds_count{{function="{name}"}} {stats["calls"]}')
+
+        lines += ["# HELP chessvar_rejections_total Calls of instrumented ChessVar functions that returned False.",
+                  "# TYPE chessvar_rejections_total counter"]
+        for name, stats in functions.items():
+            for reason, count in sorted(stats["rejections"].items()):
+                reason = reason.replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'chessvar_rejections_total{{function="{name}",reason="{reason}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def start_server(self, host="127.0.0.1", port=9108):
+        """
+        Serves the statistics over HTTP from a background thread, for scraping long-running processes.
+
+        GET /metrics returns to_prometheus() and GET /metrics.json returns to_json().
+
+        Args:
+            host (str): Address to listen on.
+            port (int): Port to listen on, or 0 for any free port.
+
+        Returns:
+            port (int): Port the server is listening on.
+        """
+        instrumentation = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/metrics":
+                    body, content_type = instrumentation.to_prometheus(), "text/plain; version=0.0.4"
+                elif self.path == "/metrics.json":
+                    body, content_type = instrumentation.to_json(), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body.encode())))
+                self.end_headers()
+                self.wfile.write(body.encode())
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server.server_address[1]
+
+    def stop_server(self):
+        """
+        Stops the server started by start_server().
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+# Instrumentation of DEFAULT_TARGETS shared by the whole process
+INSTRUMENTATION = Instrumentation()
+
+def main(argv=None):
+    """
+    Plays random games with instrumentation switched on and prints the statistics.
+
+    Args:
+        argv (list): Command line arguments, or None to read them from sys.argv.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Play random games with ChessVar's hot paths instrumented.")
+    parser.add_argument("--games", type=int, default=20, help="number of random games")
+    parser.add_argument("--format", choices=["json", "prometheus"], default="prometheus", help="output format")
+    args = parser.parse_args(argv)
+
+    generator = random.Random(0)
+    INSTRUMENTATION.enable()
+    try:
+        for _ in range(args.games):
+            chess_var = ChessVar()
+            for _ in range(200):
+                moves = chess_var.generate_moves()
+                if not moves:
+                    break
+                # Some random pairs of squares are tried too, so rejections show up
+                squares = [move[0] for move in moves]
+                chess_var.make_move(generator.choice(squares), generator.choice(squares + ['a1', 'h8']))
+                if chess_var.get_game_state() == "UNFINISHED":
+                    chess_var.push(generator.choice(chess_var.generate_moves()))
+    finally:
+        INSTRUMENTATION.disable()
+    print(INSTRUMENTATION.to_json() if args.format == "json" else INSTRUMENTATION.to_prometheus(), end="")
+
+if __name__ == "__main__":
+    main()
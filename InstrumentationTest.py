@@ -0,0 +1,101 @@
+import unittest
+import json
+import urllib.request
+from ChessVar import ChessVar, Pieces, chess_var_from_notation
+from Instrumentation import Instrumentation, HISTOGRAM_BOUNDS
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.instrumentation = Instrumentation()
+
+    def tearDown(self):
+        self.instrumentation.disable()
+        self.instrumentation.stop_server()
+
+    def test_enable_and_disable(self):
+        originals = [ChessVar.__dict__["make_move"], Pieces.__dict__["identify_blocked_square"]]
+
+        # 1: Methods are only replaced while instrumentation is on
+        self.assertFalse(self.instrumentation.is_enabled())
+        self.instrumentation.enable()
+        self.assertTrue(self.instrumentation.is_enabled())
+        self.assertIsNot(ChessVar.__dict__["make_move"], originals[0])
+        self.assertIs(ChessVar.make_move.__wrapped__, originals[0])
+
+        # 2: Enabling twice does not wrap the wrappers
+        self.instrumentation.enable()
+        self.assertIs(ChessVar.make_move.__wrapped__, originals[0])
+
+        # 3: The original methods are put back and calls are no longer counted
+        self.instrumentation.disable()
+        self.assertEqual([ChessVar.__dict__["make_move"], Pieces.__dict__["identify_blocked_square"]], originals)
+        ChessVar().make_move('a2', 'a3')
+        self.assertEqual(self.instrumentation.snapshot()["functions"]["ChessVar.make_move"]["calls"], 0)
+
+    def test_call_counts(self):
+        self.instrumentation.enable()
+        chess_var = ChessVar()
+        self.assertTrue(chess_var.make_move('a2', 'a4'))
+        self.assertTrue(chess_var.make_move('b7', 'b5'))
+        self.assertTrue(chess_var.make_move('a1', 'a3'))
+        functions = self.instrumentation.snapshot()["functions"]
+
+        # 1: Every call is counted and falls in one histogram bucket
+        self.assertEqual(functions["ChessVar.make_move"]["calls"], 3)
+        self.assertEqual(sum(functions["ChessVar.make_move"]["buckets"]), 3)
+        self.assertEqual(len(functions["ChessVar.make_move"]["buckets"]), len(HISTOGRAM_BOUNDS) + 1)
+        self.assertGreater(functions["ChessVar.make_move"]["total_seconds"], 0)
+
+        # 2: Only the rook's move checks for a blocking piece
+        self.assertEqual(functions["Pieces.identify_blocked_square"]["calls"], 1)
+
+        # 3: reset() clears the statistics
+        self.instrumentation.reset()
+        self.assertEqual(self.instrumentation.snapshot()["functions"]["ChessVar.make_move"]["calls"], 0)
+
+    def test_rejection_reasons(self):
+        self.instrumentation.enable()
+        chess_var = ChessVar()
+        for start, end in [('a2', 'a2'), ('a2', 'a9'), ('a3', 'a4'), ('a7', 'a6'), ('a1', 'a2'), ('a1', 'a3')]:
+            self.assertFalse(chess_var.make_move(start, end))
+        chess_var = chess_var_from_notation("8/8/8/8/8/8/2K5/k7 w F/- 0/0 -/-")
+        self.assertFalse(chess_var.enter_fairy_piece('F', 'e4'))
+        self.assertFalse(chess_var.enter_fairy_piece('H', 'e1'))
+        self.assertFalse(chess_var.enter_fairy_piece('F', 'e1'))
+        functions = self.instrumentation.snapshot()["functions"]
+
+        # 1: verify_player_square() rejections follow the order of its checks
+        self.assertEqual(functions["ChessVar.verify_player_square"]["rejections"],
+                         {"same square": 1, "off the board": 1, "empty start square": 1, "opponent's piece": 1,
+                          "own piece on end square": 1})
+
+        # 2: make_move() adds the moves the piece cannot make
+        self.assertEqual(functions["ChessVar.make_move"]["rejections"]["illegal R move"], 1)
+
+        # 3: Fairy piece placements
+        self.assertEqual(functions["ChessVar.enter_fairy_piece"]["rejections"],
+                         {"outside home ranks": 1, "not in reserve": 1, "fairy piece entry not allowed": 1})
+
+    def test_exports(self):
+        self.instrumentation.enable()
+        ChessVar().make_move('a2', 'a2')
+
+        # 1: JSON export matches snapshot()
+        self.assertEqual(json.loads(self.instrumentation.to_json()), self.instrumentation.snapshot())
+
+        # 2: Prometheus export has counters and cumulative histograms
+        text = self.instrumentation.to_prometheus()
+        self.assertIn('chessvar_calls_total{function="ChessVar.make_move"} 1\n', text)
+        self.assertIn('chessvar_call_duration_seconds_bucket{function="ChessVar.make_move",le="+Inf"} 1\n', text)
+        self.assertIn('chessvar_call_duration_seconds_count{function="ChessVar.make_move"} 1\n', text)
+        self.assertIn('chessvar_rejections_total{function="ChessVar.make_move",reason="same square"} 1\n', text)
+
+        # 3: Both exports are served over HTTP
+        port = self.instrumentation.start_server(port=0)
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            self.assertIn('chessvar_calls_total{function="ChessVar.make_move"} 1', response.read().decode())
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics.json") as response:
+            self.assertEqual(json.loads(response.read())["functions"]["ChessVar.make_move"]["calls"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
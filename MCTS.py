@@ -0,0 +1,441 @@
+# Author: Helen C
+# GitHub username: hchao7
+# Date: 10/18/26
+# Description: Computer player that picks ChessVar moves with Monte Carlo Tree Search
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from ChessVar import PIECE_VALUES, chess_var_from_notation
+
+def playout(chess_var, generator, max_plies=200, policy="random"):
+    """
+    Plays random moves until a king is captured or max_plies moves have been made.
+
+    The "light" policy always captures a king when it can and otherwise prefers captures of valuable pieces
+    half of the time. The game is changed by the playout.
+
+    Args:
+        chess_var (ChessVar): Game to play out.
+        generator (random.Random): Random number generator.
+        max_plies (int): Number of moves after which the playout is a draw.
+        policy (str): "random" or "light".
+
+    Returns:
+        result (str): "WHITE_WON", "BLACK_WON", or "DRAW".
+    """
+    for _ in range(max_plies):
+        if chess_var.get_game_state() != "UNFINISHED":
+            break
+        moves = chess_var.generate_moves()
+        if not moves:
+            break
+        move = None
+        if policy == "light":
+            board = chess_var.get_board()
+            best_value = 0
+            for candidate in moves:
+                if candidate[2] != 'x':
+                    continue
+                victim = board.get_piece(candidate[1])
+                if victim in ('K', 'k'):
+                    move, best_value = candidate, None
+                    break
+                if victim != '.' and PIECE_VALUES.get(victim.upper(), 0) > best_value:
+                    move, best_value = candidate, PIECE_VALUES[victim.upper()]
+            # Captures other than the king's are only preferred half of the time
+            if best_value is not None and generator.random() < 0.5:
+                move = None
+        if move is None:
+            move = generator.choice(moves)
+        chess_var.make_move(move[0], move[1]) if move[2] == 'x' else chess_var.enter_fairy_piece(move[2], move[0])
+
+    game_state = chess_var.get_game_state()
+    return game_state if game_state in ("WHITE_WON", "BLACK_WON") else "DRAW"
+
+def run_playouts(notations, seeds, max_plies=200, policy="random"):
+    """
+    Plays out a batch of positions, in a worker process.
+
+    Args:
+        notations (list): Positions from ChessVar's get_notation().
+        seeds (list): Seed of each playout's random number generator.
+        max_plies (int): Number of moves after which a playout is a draw.
+        policy (str): "random" or "light".
+
+    Returns:
+        results (list): Result of each playout, as returned by playout().
+    """
+    return [playout(chess_var_from_notation(notation), random.Random(seed), max_plies, policy)
+            for notation, seed in zip(notations, seeds)]
+
+class MCTSNode:
+    """
+    A class representing a position in the search tree.
+
+    Attributes:
+        _move (tuple): Move that led to the position, or None for the root.
+        _parent (MCTSNode): Position before the move, or None for the root.
+        _mover (str): Player who made the move.
+        _hash_key (int): ChessVar's hash_key() of the position.
+        _untried_moves (list): Legal moves without a child yet.
+        _children (list): Positions searched after each tried move.
+        _visits (int): Playouts through the position, including those still running.
+        _wins (float): Wins of _mover in finished playouts through the position, with draws counting half.
+        _result (str): "WHITE_WON" or "BLACK_WON" if the game is over in the position, or None.
+    """
+
+    def __init__(self, chess_var, move=None, parent=None, mover=None):
+        """
+        Initializes a new MCTSNode instance.
+
+        Args:
+            chess_var (ChessVar): Game in the position.
+            move (tuple): Move that led to the position.
+            parent (MCTSNode): Position before the move.
+            mover (str): Player who made the move.
+
+        Returns:
+            None
+        """
+        self._move = move
+        self._parent = parent
+        self._mover = mover
+        self._hash_key = chess_var.hash_key()
+        game_state = chess_var.get_game_state()
+        self._result = game_state if game_state in ("WHITE_WON", "BLACK_WON") else None
+        self._untried_moves = chess_var.generate_moves() if self._result is None else []
+        self._children = []
+        self._visits = 0
+        self._wins = 0.0
+
+    def get_move(self):
+        """
+        Retrieves _move.
+
+        This method does not require any arguments.
+
+        Returns:
+            _move (tuple): Move that led to the position, or None for the root.
+        """
+        return self._move
+
+    def get_children(self):
+        """
+        Retrieves _children.
+
+        This method does not require any arguments.
+
+        Returns:
+            _children (list): Positions searched after each tried move.
+        """
+        return self._children
+
+    def get_visits(self):
+        """
+        Retrieves _visits.
+
+        This method does not require any arguments.
+
+        Returns:
+            _visits (int): Playouts through the position.
+        """
+        return self._visits
+
+    def get_wins(self):
+        """
+        Retrieves _wins.
+
+        This method does not require any arguments.
+
+        Returns:
+            _wins (float): Wins of the player who made _move, with draws counting half.
+        """
+        return self._wins
+
+    def get_hash_key(self):
+        """
+        Retrieves _hash_key.
+
+        This method does not require any arguments.
+
+        Returns:
+            _hash_key (int): Hash of the position.
+        """
+        return self._hash_key
+
+    def count_nodes(self):
+        """
+        Counts the positions in the subtree of this position, including itself.
+
+        This method does not require any arguments.
+
+        Returns:
+            count (int)
+        """
+        count, stack = 0, [self]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node._children)
+        return count
+
+    def select_child(self, exploration):
+        """
+        Picks the child with the highest UCT score.
+
+        A child where the king has just been captured is a win for the player to move, so it is always picked.
+
+        Args:
+            exploration (float): Weight of the exploration term.
+
+        Returns:
+            child (MCTSNode)
+        """
+        for child in self._children:
+            if child._result is not None:
+                return child
+        log_visits = math.log(self._visits)
+        return max(self._children, key=lambda child: child._wins / child._visits
+                   + exploration * math.sqrt(log_visits / child._visits))
+
+    def add_child(self, chess_var, move, mover):
+        """
+        Creates the child of a tried move.
+
+        Args:
+            chess_var (ChessVar): Game after the move.
+            move (tuple): Move from _untried_moves.
+            mover (str): Player who made the move.
+
+        Returns:
+            child (MCTSNode)
+        """
+        self._untried_moves.remove(move)
+        child = MCTSNode(chess_var, move, self, mover)
+        self._children.append(child)
+        return child
+
+    def update(self, result):
+        """
+        Records the result of a finished playout. The visit was counted when the playout was started.
+
+        Args:
+            result (str): "WHITE_WON", "BLACK_WON", or "DRAW".
+
+        Returns:
+            None
+        """
+        if result == "DRAW":
+            self._wins += 0.5
+        elif self._mover is not None and result == self._mover + "_WON":
+            self._wins += 1.0
+
+class MCTSPlayer:
+    """
+    A class representing a computer player that uses Monte Carlo Tree Search.
+
+    Positions are selected with UCT and played out to a king capture. Playouts are started in batches:
+    each selected path counts its visit at once (a virtual loss), so the rest of the batch explores elsewhere,
+    and the batch is played out on a process pool. The tree is kept, so the next search continues from
+    the node of its position, such as the one after the chosen move and the opponent's reply.
+
+    Attributes:
+        _playouts (int): Playouts per search.
+        _exploration (float): Weight of the UCT exploration term.
+        _workers (int): Worker processes for playouts, or 0 to play out in this process.
+        _batch_size (int): Playouts started before any result is recorded.
+        _max_plies (int): Number of moves after which a playout is a draw.
+        _policy (str): Playout policy, "random" or "light".
+        _generator (random.Random): Random number generator of the moves and playout seeds.
+        _root (MCTSNode): Tree kept from the last search, or None.
+        _executor (ProcessPoolExecutor): Worker processes, started on the first search, or None.
+    """
+
+    def __init__(self, playouts=1000, exploration=1.4, workers=0, batch_size=None, max_plies=200,
+                 policy="light", seed=None):
+        """
+        Initializes a new MCTSPlayer instance.
+
+        Args:
+            playouts (int): Playouts per search.
+            exploration (float): Weight of the UCT exploration term.
+            workers (int): Worker processes for playouts, or 0 to play out in this process.
+            batch_size (int): Playouts started before any result is recorded, or None for 8 per worker.
+            max_plies (int): Number of moves after which a playout is a draw.
+            policy (str): Playout policy, "random" or "light".
+            seed (int): Seed of the random number generator, or None.
+
+        Returns:
+            None
+        """
+        self._playouts = playouts
+        self._exploration = exploration
+        self._workers = workers
+        self._batch_size = batch_size if batch_size is not None else max(1, 8 * workers)
+        self._max_plies = max_plies
+        self._policy = policy
+        self._generator = random.Random(seed)
+        self._root = None
+        self._executor = None
+
+    def close(self):
+        """
+        Stops the worker processes.
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def get_root(self):
+        """
+        Retrieves _root.
+
+        This method does not require any arguments.
+
+        Returns:
+            _root (MCTSNode): Tree kept from the last search, or None.
+        """
+        return self._root
+
+    def find_root(self, chess_var):
+        """
+        Finds the kept tree's node for the game, or starts a new tree.
+
+        The game may be the last search's position, or follow it by one or two moves, such as the move
+        that was chosen and the opponent's reply.
+
+        This method is a helper method for search().
+
+        Args:
+            chess_var (ChessVar): Game to search.
+
+        Returns:
+            root, reused (tuple): Root of the tree, and whether it was kept from the last search.
+        """
+        hash_key = chess_var.hash_key()
+        if self._root is not None:
+            candidates = [self._root] + self._root.get_children()
+            for child in self._root.get_children():
+                candidates.extend(child.get_children())
+            for node in candidates:
+                if node.get_hash_key() == hash_key:
+                    node._parent, node._move, node._mover = None, None, None
+                    return node, True
+        return MCTSNode(chess_var), False
+
+    def search(self, chess_var, playouts=None):
+        """
+        Finds the best move for the current player.
+
+        The game is left exactly as it was passed in.
+
+        Args:
+            chess_var (ChessVar): Game to search.
+            playouts (int): Overrides _playouts for this search.
+
+        Returns:
+            result (dict): "move" (a king capture, else the most visited move, or None if there are no moves), "win_rate" (of the move,
+            for the current player), "playouts", "time" (seconds), "playouts_per_second", "tree_size",
+            and "reused" (whether the tree was kept from the last search).
+        """
+        playouts = self._playouts if playouts is None else playouts
+        start_time = time.perf_counter()
+        root, reused = self.find_root(chess_var)
+        if self._workers and self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+
+        completed = 0
+        while completed < playouts and (root._untried_moves or root._children):
+            batch = []
+            for _ in range(min(self._batch_size, playouts - completed)):
+                batch.append(self.select_leaf(chess_var, root))
+            self.play_batch(batch)
+            completed += len(batch)
+
+        elapsed = time.perf_counter() - start_time
+        self._root = root
+        if not root.get_children():
+            return {"move": None, "win_rate": 0.0, "playouts": completed, "time": elapsed,
+                    "playouts_per_second": 0.0, "tree_size": 1, "reused": reused}
+
+        best_child = max(root.get_children(), key=lambda child: (child._result is not None, child.get_visits()))
+        return {"move": best_child.get_move(), "win_rate": best_child.get_wins() / best_child.get_visits(),
+                "playouts": completed, "time": elapsed,
+                "playouts_per_second": completed / elapsed if elapsed > 0 else 0.0,
+                "tree_size": root.count_nodes(), "reused": reused}
+
+    def select_leaf(self, chess_var, root):
+        """
+        Walks down the tree with UCT, adds one new position, and counts a visit on every position passed.
+
+        This method is a helper method for search().
+
+        Args:
+            chess_var (ChessVar): Game in the root position; it is restored before returning.
+            root (MCTSNode): Root of the tree.
+
+        Returns:
+            leaf, notation (tuple): The new position (or a finished one), and its notation to play out,
+            or None if the game is already over in it.
+        """
+        node = root
+        node._visits += 1
+        plies = 0
+        try:
+            while not node._untried_moves and node._children:
+                node = node.select_child(self._exploration)
+                chess_var.push(node._move)
+                node._visits += 1
+                plies += 1
+
+            if node._untried_moves:
+                move = self._generator.choice(node._untried_moves)
+                mover = chess_var.get_player_turn()
+                chess_var.push(move)
+                plies += 1
+                node = node.add_child(chess_var, move, mover)
+                node._visits += 1
+
+            notation = chess_var.get_notation() if node._result is None else None
+        finally:
+            for _ in range(plies):
+                chess_var.pop()
+        return node, notation
+
+    def play_batch(self, batch):
+        """
+        Plays out a batch of positions and records the results along their paths.
+
+        This method is a helper method for search().
+
+        Args:
+            batch (list): Pairs of leaf and notation from select_leaf().
+
+        Returns:
+            None
+        """
+        notations = [notation for leaf, notation in batch if notation is not None]
+        seeds = [self._generator.getrandbits(32) for notation in notations]
+        if self._executor is not None and notations:
+            chunk_size = max(1, -(-len(notations) // self._workers))
+            futures = [self._executor.submit(run_playouts, notations[start:start + chunk_size],
+                                             seeds[start:start + chunk_size], self._max_plies, self._policy)
+                       for start in range(0, len(notations), chunk_size)]
+            results = [result for future in futures for result in future.result()]
+        else:
+            results = run_playouts(notations, seeds, self._max_plies, self._policy)
+
+        results = iter(results)
+        for leaf, notation in batch:
+            result = leaf._result if notation is None else next(results)
+            node = leaf
+            while node is not None:
+                node.update(result)
+                node = node._parent
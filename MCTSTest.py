@@ -0,0 +1,59 @@
+import unittest
+from ChessVar import ChessVar
+from MCTS import MCTSPlayer
+
+class TestMCTSPlayer(unittest.TestCase):
+    def setUp(self):
+        self.chess_var = ChessVar()
+
+    def test_search_captures_king(self):
+        """Capturing the king wins every playout through it"""
+        board_display = [['8','r','n','b','q','k','b','n','r'],
+                         ['7','p','p','p','p','.','p','p','p'],
+                         ['6','.','.','.','.','.','.','.','.'],
+                         ['5','.','.','.','.','.','.','.','.'],
+                         ['4','.','.','.','.','Q','.','.','.'],
+                         ['3','.','.','.','.','.','.','.','.'],
+                         ['2','P','P','P','P','P','P','P','P'],
+                         ['1','R','N','B','.','K','B','N','R'],
+                         [' ','a','b','c','d','e','f','g','h']]
+        self.chess_var.get_board().set_board_display(board_display)
+        before_hash_key = self.chess_var.hash_key()
+        result = MCTSPlayer(playouts=300, seed=1).search(self.chess_var)
+        self.assertEqual(result["move"], ('e4', 'e8', 'x'))
+        self.assertEqual(result["win_rate"], 1.0)
+        self.assertEqual(result["playouts"], 300)
+        self.assertGreater(result["playouts_per_second"], 0)
+        self.assertEqual(self.chess_var.hash_key(), before_hash_key)
+
+    def test_tree_reuse(self):
+        """Next search continues from the position after the chosen move and the reply"""
+        player = MCTSPlayer(playouts=60, policy="random", seed=2)
+        result = player.search(self.chess_var)
+        self.assertEqual(result["reused"], False)
+        self.assertEqual(result["tree_size"], 61)
+
+        chosen_node = [child for child in player.get_root().get_children() if child.get_move() == result["move"]][0]
+        self.chess_var.push(result["move"])
+        self.chess_var.push(chosen_node.get_children()[0].get_move())
+        result = player.search(self.chess_var)
+        self.assertEqual(result["reused"], True)
+        self.assertIn(result["move"], self.chess_var.generate_moves())
+
+        # Unrelated position starts a new tree
+        self.assertEqual(player.search(ChessVar())["reused"], False)
+
+        # Finished game has no move
+        self.chess_var.set_game_state("WHITE_WON")
+        self.assertEqual(MCTSPlayer(playouts=10).search(self.chess_var)["move"], None)
+
+    def test_process_pool(self):
+        """Batches are played out on worker processes"""
+        player = MCTSPlayer(playouts=40, workers=2, batch_size=10, max_plies=40, seed=3)
+        try:
+            result = player.search(self.chess_var)
+        finally:
+            player.close()
+        self.assertEqual(result["playouts"], 40)
+        self.assertIn(result["move"], self.chess_var.generate_moves())
+        self.assertEqual(result["tree_size"], 41)
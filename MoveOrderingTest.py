@@ -0,0 +1,66 @@
+import unittest
+import unittest.mock
+from ChessVar import ChessVar
+from Engine import Engine, MoveOrdering
+
+class TestMoveOrdering(unittest.TestCase):
+    def setUp(self):
+        self.chess_var = ChessVar()
+        self.move_ordering = MoveOrdering()
+
+    def test_order_moves_method(self):
+        board_display = [['8','.','.','.','.','k','.','.','.'],
+                         ['7','.','.','.','.','.','.','.','.'],
+                         ['6','.','.','.','.','.','.','.','.'],
+                         ['5','.','.','.','q','.','.','.','.'],
+                         ['4','.','.','P','.','.','.','.','.'],
+                         ['3','.','.','.','.','.','.','.','.'],
+                         ['2','.','.','.','.','.','.','n','.'],
+                         ['1','.','.','.','.','R','.','.','K'],
+                         [' ','a','b','c','d','e','f','g','h']]
+        self.chess_var.get_board().set_board_display(board_display)
+        self.chess_var.get_player("WHITE").set_capture_count(1)
+        self.chess_var.get_player("WHITE").set_fairy_piece_entry(True)
+        moves = self.move_ordering.order_moves(self.chess_var, self.chess_var.generate_moves(), 0)
+
+        # 1: King capture first, then captures by most valuable victim
+        self.assertEqual(moves[:3], [('e1', 'e8', 'x'), ('c4', 'd5', 'x'), ('h1', 'g2', 'x')])
+
+        # 2: Fairy piece placements come after captures and before quiet moves
+        kinds = ['drop' if move[2] != 'x' else
+                 'capture' if self.chess_var.get_board().get_piece(move[1]) != '.' else 'quiet' for move in moves]
+        self.assertEqual(kinds, sorted(kinds, key=['capture', 'drop', 'quiet'].index))
+
+        # 3: Stored best move first
+        moves = self.move_ordering.order_moves(self.chess_var, moves, 0, ('h1', 'h2', 'x'))
+        self.assertEqual(moves[0], ('h1', 'h2', 'x'))
+
+    def test_killer_moves_and_history(self):
+        """Quiet moves that caused cutoffs are searched first"""
+        self.move_ordering.record_cutoff(self.chess_var, ('b1', 'c3', 'x'), 2, 3, 0)
+        self.move_ordering.record_cutoff(self.chess_var, ('g1', 'f3', 'x'), 2, 3, 4)
+        self.move_ordering.record_cutoff(self.chess_var, ('a2', 'a3', 'x'), 5, 6, 1)
+
+        moves = self.move_ordering.order_moves(self.chess_var, self.chess_var.generate_moves(), 2)
+        self.assertEqual(moves[:3], [('g1', 'f3', 'x'), ('b1', 'c3', 'x'), ('a2', 'a3', 'x')])
+        self.assertEqual(self.move_ordering.get_stats(), {"cutoffs": 3, "first_move_cutoffs": 1,
+                                                          "first_move_cutoff_rate": 1 / 3})
+
+        # New search clears killer moves and counters and ages the history
+        self.move_ordering.new_search()
+        moves = self.move_ordering.order_moves(self.chess_var, self.chess_var.generate_moves(), 2)
+        self.assertEqual(moves[0], ('a2', 'a3', 'x'))
+        self.assertEqual(self.move_ordering.get_stats()["cutoffs"], 0)
+
+    def test_node_count(self):
+        """Ordered search finds the same score with fewer nodes"""
+        for move in [('e2', 'e4', 'x'), ('d7', 'd5', 'x'), ('b1', 'c3', 'x')]:
+            self.chess_var.push(move)
+        with unittest.mock.patch.object(MoveOrdering, "order_moves") as order_moves:
+            unordered = Engine(order_moves=False).search(self.chess_var, max_depth=3)
+        order_moves.assert_not_called()
+        ordered = Engine().search(self.chess_var, max_depth=3)
+        self.assertEqual(ordered["score"], unordered["score"])
+        self.assertLess(ordered["nodes"], unordered["nodes"])
+        self.assertGreater(ordered["ordering"]["first_move_cutoff_rate"],
+                           unordered["ordering"]["first_move_cutoff_rate"])
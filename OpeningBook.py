@@ -0,0 +1,325 @@
+# Author: Helen C
+# GitHub username: hchao7
+# Date: 10/18/26
+# Description: Builds an opening book from archived games and probes it through a memory map
+
+import argparse
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+from itertools import groupby
+from ChessVar import ChessVar, decode_move, chess_var_from_notation
+from GameRecord import GameRecordReader
+
+# File layout: header, then one fixed-width entry per (position, move), sorted by hash and then move code.
+# All integers are little-endian.
+OPENING_BOOK_MAGIC = b"CVOB"
+OPENING_BOOK_VERSION = 1
+HEADER_FORMAT = struct.Struct("<4sHHQ")  # magic, version, reserved, entry count
+ENTRY_FORMAT = struct.Struct("<QH2xII")  # hash, move code, games, weight
+HASH_FORMAT = struct.Struct("<Q")        # hash at the start of an entry
+
+# Weight a move earns from one game, by whether the player who made it won, drew, or lost.
+# Unfinished games have no winner and are left out of the book.
+RESULT_WEIGHTS = {"WIN": 2, "DRAW": 1, "LOSS": 0}
+
+def count_book_moves(reader, max_plies, run_size):
+    """
+    This method is a helper method for build_opening_book().
+
+    Counts are handed over every time run_size (position, move) pairs have been counted, so memory use does not
+    grow with the archive. Unfinished games are skipped.
+
+    Args:
+        reader (GameRecordReader): Archive to count.
+        max_plies (int): Number of moves counted from the start of each game.
+        run_size (int): Number of (position, move) pairs counted in memory at once.
+
+    Returns:
+        counts (generator): Dicts mapping (hash, move code) to a list of games and weight.
+    """
+    counts = {}
+    for move_codes, result in reader:
+        if result == "UNFINISHED":
+            continue
+        chess_var = ChessVar()
+        for move_code in move_codes[:max_plies]:
+            hash_key = chess_var.hash_key()
+            mover = chess_var.get_player_turn()
+            if not chess_var.push(decode_move(move_code)):
+                break
+            if result == "DRAW":
+                weight = RESULT_WEIGHTS["DRAW"]
+            elif result == f"{mover}_WON":
+                weight = RESULT_WEIGHTS["WIN"]
+            else:
+                weight = RESULT_WEIGHTS["LOSS"]
+            count = counts.get((hash_key, move_code))
+            if count is None:
+                counts[(hash_key, move_code)] = [1, weight]
+            else:
+                count[0] += 1
+                count[1] += weight
+        if len(counts) >= run_size:
+            yield counts
+            counts = {}
+    yield counts
+
+def write_run(counts, directory):
+    """
+    This method is a helper method for build_opening_book().
+
+    Sorts counted moves and writes them to a temporary file as book entries.
+
+    Args:
+        counts (dict): Maps (hash, move code) to a list of games and weight.
+        directory (str): Directory of the temporary file.
+
+    Returns:
+        path (str): Path of the temporary file.
+    """
+    entries = sorted((hash_key, move_code, games, weight)
+                     for (hash_key, move_code), (games, weight) in counts.items())
+    run_file = tempfile.NamedTemporaryFile("wb", dir=directory, suffix=".run", delete=False)
+    with run_file:
+        pack = ENTRY_FORMAT.pack
+        run_file.write(b"".join(pack(*entry) for entry in entries))
+    return run_file.name
+
+def read_run(path):
+    """
+    This method is a helper method for build_opening_book().
+
+    Args:
+        path (str): Path of a file written by write_run().
+
+    Returns:
+        entries (generator): (hash, move code, games, weight) tuples in ascending order.
+    """
+    chunk_size = ENTRY_FORMAT.size * 65536
+    with open(path, "rb") as run_file:
+        while True:
+            chunk = run_file.read(chunk_size)
+            if not chunk:
+                return
+            yield from ENTRY_FORMAT.iter_unpack(chunk)
+
+def merge_runs(run_paths):
+    """
+    This method is a helper method for build_opening_book().
+
+    Counts of the same position and move from different runs are added together.
+
+    Args:
+        run_paths (list): Paths of files written by write_run().
+
+    Returns:
+        entries (generator): (hash, move code, games, weight) tuples in ascending order.
+    """
+    merged = heapq.merge(*(read_run(path) for path in run_paths))
+    for (hash_key, move_code), entries in groupby(merged, key=lambda entry: entry[:2]):
+        games = 0
+        weight = 0
+        for _, _, entry_games, entry_weight in entries:
+            games += entry_games
+            weight += entry_weight
+        yield hash_key, move_code, games, weight
+
+def build_opening_book(archive_path, book_path, max_plies=20, min_games=1, run_size=1000000):
+    """
+    Counts the moves played from every position in the opening of each completed archived game and writes the book.
+
+    A move's weight is the sum of RESULT_WEIGHTS over the games it was played in, from the point of view
+    of the player who made it. Moves are counted and sorted in runs of run_size and then merged,
+    so memory use does not grow with the archive.
+
+    Args:
+        archive_path (str): Archive written by GameRecord.py.
+        book_path (str): File to write.
+        max_plies (int): Number of moves of each game added to the book.
+        min_games (int): Moves played in fewer games are left out.
+        run_size (int): Number of (position, move) pairs counted in memory at once.
+
+    Returns:
+        entry_count (int): Number of entries written.
+    """
+    directory = os.path.dirname(os.path.abspath(book_path))
+    run_paths = []
+    entry_count = 0
+    try:
+        with GameRecordReader(archive_path) as reader:
+            for counts in count_book_moves(reader, max_plies, run_size):
+                run_paths.append(write_run(counts, directory))
+
+        # The entry count is only known after merging, so the header is written again at the end
+        with open(book_path, "wb") as book_file:
+            book_file.write(HEADER_FORMAT.pack(OPENING_BOOK_MAGIC, OPENING_BOOK_VERSION, 0, 0))
+            pack = ENTRY_FORMAT.pack
+            entries = []
+            for entry in merge_runs(run_paths):
+                if entry[2] >= min_games:
+                    entries.append(pack(*entry))
+                if len(entries) == 65536:
+                    entry_count += len(entries)
+                    book_file.write(b"".join(entries))
+                    entries = []
+            entry_count += len(entries)
+            book_file.write(b"".join(entries))
+            book_file.seek(0)
+            book_file.write(HEADER_FORMAT.pack(OPENING_BOOK_MAGIC, OPENING_BOOK_VERSION, 0, entry_count))
+    finally:
+        for path in run_paths:
+            os.remove(path)
+    return entry_count
+
+class OpeningBook:
+    """
+    A class representing an opening book opened through a memory map.
+
+    Probes binary search the mapped entries by hash, so nothing is loaded and a probe takes microseconds.
+
+    Attributes:
+        _file (file): Book file.
+        _mmap (mmap): Memory map of the whole file.
+        _entry_count (int): Number of (position, move) entries in the book.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes a new OpeningBook instance and checks the book's header.
+
+        Args:
+            path (str): File written by build_opening_book().
+        """
+        self._file = open(path, "rb")
+        if os.fstat(self._file.fileno()).st_size < HEADER_FORMAT.size:
+            self._file.close()
+            raise ValueError(f"Not an opening book: {path}")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self._entry_count = HEADER_FORMAT.unpack_from(self._mmap, 0)
+        if magic != OPENING_BOOK_MAGIC or version != OPENING_BOOK_VERSION:
+            self.close()
+            raise ValueError(f"Not an opening book: {path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._entry_count
+
+    def close(self):
+        """
+        Releases the memory map and closes the file.
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        self._mmap.close()
+        self._file.close()
+
+    def lookup(self, hash_key):
+        """
+        Finds the book entries of a position.
+
+        Args:
+            hash_key (int): Hash returned by ChessVar's hash_key().
+
+        Returns:
+            entries (list): (move code, games, weight) tuples, ordered by move code.
+        """
+        data = self._mmap
+        entry_size = ENTRY_FORMAT.size
+        unpack_hash = HASH_FORMAT.unpack_from
+        low = 0
+        high = self._entry_count
+        while low < high:
+            middle = (low + high) // 2
+            if unpack_hash(data, HEADER_FORMAT.size + middle * entry_size)[0] < hash_key:
+                low = middle + 1
+            else:
+                high = middle
+
+        entries = []
+        offset = HEADER_FORMAT.size + low * entry_size
+        end = HEADER_FORMAT.size + self._entry_count * entry_size
+        while offset < end:
+            entry_hash, move_code, games, weight = ENTRY_FORMAT.unpack_from(data, offset)
+            if entry_hash != hash_key:
+                break
+            entries.append((move_code, games, weight))
+            offset += entry_size
+        return entries
+
+    def get_moves(self, chess_var):
+        """
+        Returns the book moves of a position, with the heaviest first.
+
+        Args:
+            chess_var (ChessVar): Position to look up.
+
+        Returns:
+            moves (list): (move, games, weight) tuples, where move is a tuple of start coordinate,
+            end coordinate, and fairy piece.
+        """
+        entries = sorted(self.lookup(chess_var.hash_key()), key=lambda entry: entry[2], reverse=True)
+        return [(decode_move(move_code), games, weight) for move_code, games, weight in entries]
+
+    def choose_move(self, chess_var, generator=None):
+        """
+        Chooses a legal book move for a position.
+
+        Args:
+            chess_var (ChessVar): Position to look up.
+            generator (random.Random): Picks moves at random in proportion to their weight, or None for the heaviest.
+
+        Returns:
+            move (tuple): Book move, or None if the position is not in the book.
+        """
+        book_moves = self.get_moves(chess_var)
+        while book_moves:
+            if generator is None or not any(weight for _, _, weight in book_moves):
+                choice = 0
+            else:
+                choice = generator.choices(range(len(book_moves)), weights=[weight for _, _, weight in book_moves])[0]
+            move = book_moves[choice][0]
+            # Only the chosen move is checked, which is much faster than generating every legal move
+            if chess_var.push(move):
+                chess_var.pop()
+                return move
+            del book_moves[choice]
+        return None
+
+def main(argv=None):
+    """
+    Builds an opening book, or lists the book moves of a position, from the command line.
+
+    Args:
+        argv (list): Command line arguments, or None to read them from sys.argv.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Build or probe an opening book.")
+    parser.add_argument("book", help="opening book file")
+    parser.add_argument("--build", metavar="ARCHIVE", help="archive written by GameRecord.py to count")
+    parser.add_argument("--plies", type=int, default=20, help="moves of each game added to the book")
+    parser.add_argument("--min-games", type=int, default=1, help="leave out moves played in fewer games")
+    parser.add_argument("--notation", help="position in ChessVar notation to look up")
+    args = parser.parse_args(argv)
+
+    if args.build:
+        print(f"{build_opening_book(args.build, args.book, args.plies, args.min_games)} book entries")
+    if args.notation:
+        with OpeningBook(args.book) as book:
+            for move, games, weight in book.get_moves(chess_var_from_notation(args.notation)):
+                print(f"{'/'.join(move)}: {games} games, weight {weight}")
+
+if __name__ == "__main__":
+    main()
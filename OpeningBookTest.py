@@ -0,0 +1,95 @@
+import unittest
+import os
+import random
+import tempfile
+from ChessVar import ChessVar, encode_move
+from GameRecord import write_game_records
+from OpeningBook import OpeningBook, build_opening_book
+from Tournament import make_policy
+
+class TestOpeningBook(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.archive_path = os.path.join(self.directory.name, "games.cvgr")
+        self.book_path = os.path.join(self.directory.name, "games.cvob")
+        games = [(["e2/e4/x", "e7/e5/x", "g1/f3/x"], "WHITE_WON"),
+                 (["e2/e4/x", "e7/e5/x", "f1/c4/x"], "BLACK_WON"),
+                 (["e2/e4/x", "d7/d5/x"], "WHITE_WON"),
+                 (["d2/d4/x", "d7/d5/x"], "DRAW"),
+                 (["g1/f3/x", "e7/e5/x", "e2/e4/x"], "BLACK_WON"),
+                 (["c2/c4/x", "e7/e5/x"], "UNFINISHED")]
+        write_game_records(self.archive_path, games)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_build_and_probe(self):
+        """Moves are counted by position and weighted by the result for the player who made them"""
+        self.assertEqual(build_opening_book(self.archive_path, self.book_path), 10)
+
+        with OpeningBook(self.book_path) as book:
+            self.assertEqual(len(book), 10)
+
+            # 1: Starting position, heaviest move first
+            self.assertEqual(book.get_moves(ChessVar()), [(('e2', 'e4', 'x'), 3, 4),
+                                                          (('d2', 'd4', 'x'), 1, 1),
+                                                          (('g1', 'f3', 'x'), 1, 0)])
+
+            # 2: Transposition collects the moves of both games
+            chess_var = ChessVar()
+            for move in [('e2', 'e4', 'x'), ('e7', 'e5', 'x')]:
+                chess_var.push(move)
+            self.assertEqual(sorted(book.get_moves(chess_var)), [(('f1', 'c4', 'x'), 1, 0),
+                                                                 (('g1', 'f3', 'x'), 1, 2)])
+            self.assertEqual(book.choose_move(chess_var), ('g1', 'f3', 'x'))
+
+            # 3: Position left out of the book
+            chess_var.push(('g1', 'f3', 'x'))
+            self.assertEqual(book.get_moves(chess_var), [])
+            self.assertIsNone(book.choose_move(chess_var))
+
+            # 4: Random choices follow the weights
+            generator = random.Random(0)
+            choices = {book.choose_move(ChessVar(), generator) for _ in range(50)}
+            self.assertEqual(choices, {('e2', 'e4', 'x'), ('d2', 'd4', 'x')})
+
+            # 5: Unfinished games are left out
+            move_codes = [move_code for move_code, games, weight in book.lookup(ChessVar().hash_key())]
+            self.assertNotIn(encode_move(('c2', 'c4', 'x')), move_codes)
+
+            self.assertEqual(book.lookup(ChessVar().hash_key() ^ 1), [])
+            self.assertIn((encode_move(('e2', 'e4', 'x')), 3, 4), book.lookup(ChessVar().hash_key()))
+
+    def test_min_games_and_plies(self):
+        # 1: Only moves played in two games are kept
+        self.assertEqual(build_opening_book(self.archive_path, self.book_path, min_games=2), 2)
+
+        # 2: Only the first move of each game is kept
+        self.assertEqual(build_opening_book(self.archive_path, self.book_path, max_plies=1), 3)
+
+    def test_runs(self):
+        """Counting in runs that are merged writes the same book"""
+        build_opening_book(self.archive_path, self.book_path)
+        with open(self.book_path, "rb") as book_file:
+            expected = book_file.read()
+        self.assertEqual(build_opening_book(self.archive_path, self.book_path, run_size=2), 10)
+        with open(self.book_path, "rb") as book_file:
+            self.assertEqual(book_file.read(), expected)
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ["games.cvgr", "games.cvob"])
+
+    def test_book_policy(self):
+        """Tournament policies play book moves and fall back once out of the book"""
+        build_opening_book(self.archive_path, self.book_path)
+        policy = make_policy(f"greedy:book={self.book_path}")
+        self.addCleanup(policy.close)
+        chess_var = ChessVar()
+        self.assertIn(policy(chess_var, random.Random(1)), [('e2', 'e4', 'x'), ('d2', 'd4', 'x')])
+        chess_var.push(('a2', 'a3', 'x'))
+        self.assertIn(policy(chess_var, random.Random(1)), chess_var.generate_moves())
+
+    def test_invalid_file(self):
+        with self.assertRaises(ValueError):
+            OpeningBook(self.archive_path)
+
+if __name__ == "__main__":
+    unittest.main()
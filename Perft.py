@@ -0,0 +1,181 @@
+# Author: Helen C
+# GitHub username: hchao7
+# Date: 10/18/26
+# Description: Counts the positions reachable from a ChessVar game to measure and check the move rules
+
+import argparse
+import json
+import time
+from ChessVar import ChessVar, chess_var_from_notation, SQUARE_NAMES, WHITE_PIECES, BLACK_PIECES
+
+def perft(chess_var, depth, validate=False):
+    """
+    Counts the positions reached after exactly depth moves.
+
+    Regular moves and fairy piece placements are both counted.
+    A game that ends with a king capture has no moves after it.
+    The game is left exactly as it was passed in.
+
+    Args:
+        chess_var (ChessVar): Game to count from.
+        depth (int): Number of moves to make.
+        validate (bool): Indicates if the moves of every position should be checked with validate_moves().
+
+    Returns:
+        nodes (int): Number of positions reached.
+    """
+    if depth <= 0:
+        return 1
+
+    moves = validate_moves(chess_var) if validate else chess_var.generate_moves()
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        push_move(chess_var, move)
+        nodes += perft(chess_var, depth - 1, validate)
+        chess_var.pop()
+    return nodes
+
+def perft_divide(chess_var, depth, validate=False):
+    """
+    Counts the positions reached after exactly depth moves, separately for each first move.
+
+    Args:
+        chess_var (ChessVar): Game to count from.
+        depth (int): Number of moves to make.
+        validate (bool): Indicates if the moves of every position should be checked with validate_moves().
+
+    Returns:
+        divide (dict): Maps each first move, in start/end/fairy format, to its number of positions.
+    """
+    divide = {}
+    for move in validate_moves(chess_var) if validate else chess_var.generate_moves():
+        push_move(chess_var, move)
+        divide["/".join(move)] = perft(chess_var, depth - 1, validate)
+        chess_var.pop()
+    return divide
+
+def push_move(chess_var, move):
+    """
+    This method is a helper method for perft() and perft_divide().
+
+    Args:
+        chess_var (ChessVar): Game to make the move in.
+        move (tuple): Move returned by generate_moves().
+
+    Returns:
+        None
+    """
+    if not chess_var.push(move):
+        raise ValueError(f"Generated move {'/'.join(move)} was rejected in {chess_var.get_notation()}")
+
+def validate_moves(chess_var):
+    """
+    Checks generate_moves() against the move and fairy piece validators.
+
+    Every pair of squares starting on one of the current player's pieces, and every fairy piece in their
+    reserve on every square, is tried with push(), which validates it with make_move() or enter_fairy_piece().
+    The moves accepted must be exactly the moves generated.
+
+    Args:
+        chess_var (ChessVar): Game to check.
+
+    Returns:
+        moves (list): Moves returned by generate_moves().
+    """
+    moves = chess_var.generate_moves()
+    own_pieces = WHITE_PIECES if chess_var.get_player_turn() == "WHITE" else BLACK_PIECES
+    board = chess_var.get_board()
+    candidates = [(start, end, 'x') for start in SQUARE_NAMES if board.get_piece(start) in own_pieces
+                  for end in SQUARE_NAMES]
+    reserve_list = chess_var.get_player(chess_var.get_player_turn()).get_reserve_list()
+    candidates += [(square, 'x', fairy_piece) for fairy_piece in sorted(set(reserve_list)) for square in SQUARE_NAMES]
+
+    accepted = []
+    for move in candidates:
+        if chess_var.push(move):
+            chess_var.pop()
+            accepted.append(move)
+
+    if set(accepted) != set(moves):
+        notation = chess_var.get_notation()
+        rejected = sorted("/".join(move) for move in set(moves) - set(accepted))
+        not_generated = sorted("/".join(move) for move in set(accepted) - set(moves))
+        raise ValueError(f"Move generation disagrees with the validators in {notation}: "
+                         f"rejected {rejected}, not generated {not_generated}")
+    return moves
+
+def run_perft(chess_var, depth, divide=False, validate=False):
+    """
+    Counts positions and measures how fast they were counted.
+
+    Args:
+        chess_var (ChessVar): Game to count from.
+        depth (int): Number of moves to make.
+        divide (bool): Indicates if counts should be broken down by first move.
+        validate (bool): Indicates if the moves of every position should be checked with validate_moves().
+
+    Returns:
+        report (dict): "depth", "nodes", "time" (seconds), "nodes_per_second", and "divide" (or None).
+    """
+    start_time = time.perf_counter()
+    if divide:
+        divide_counts = perft_divide(chess_var, depth, validate)
+        nodes = sum(divide_counts.values())
+    else:
+        divide_counts = None
+        nodes = perft(chess_var, depth, validate)
+    elapsed = time.perf_counter() - start_time
+    return {"depth": depth, "nodes": nodes, "time": elapsed,
+            "nodes_per_second": nodes / elapsed if elapsed > 0 else 0.0, "divide": divide_counts}
+
+def main(argv=None):
+    """
+    Runs perft from the command line.
+
+    The starting position is used unless --notation gives a position in ChessVar's compact notation
+    or --board names a JSON file holding a board_display grid.
+
+    Args:
+        argv (list): Command line arguments, or None to read them from sys.argv.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Count positions reachable from a ChessVar game.")
+    parser.add_argument("depth", type=int, help="number of moves to make")
+    position = parser.add_mutually_exclusive_group()
+    position.add_argument("--notation", help="position in ChessVar's compact notation, including the player to move")
+    position.add_argument("--board", help="JSON file holding a board_display grid")
+    parser.add_argument("--turn", choices=["WHITE", "BLACK"], help="player to move with --board (default WHITE)")
+    parser.add_argument("--divide", action="store_true", help="break down counts by first move")
+    parser.add_argument("--validate", action="store_true",
+                        help="check the generated moves of every position against the move validators")
+    args = parser.parse_args(argv)
+    if args.depth < 1:
+        parser.error("depth must be at least 1")
+    if args.notation and args.turn:
+        parser.error("argument --turn: not allowed with argument --notation")
+
+    board_display = None
+    if args.board:
+        with open(args.board) as board_file:
+            board_display = json.load(board_file)
+    if args.notation:
+        chess_var = chess_var_from_notation(args.notation)
+    else:
+        chess_var = ChessVar(board_display=board_display)
+        chess_var.set_player_turn(args.turn or "WHITE")
+
+    for depth in range(1, args.depth + 1):
+        report = run_perft(chess_var, depth, args.divide and depth == args.depth, args.validate)
+        print(f"depth {depth}: {report['nodes']} nodes in {report['time']:.3f}s "
+              f"({report['nodes_per_second']:.0f} nodes/s)")
+    if report["divide"]:
+        for move, nodes in sorted(report["divide"].items()):
+            print(f"{move}: {nodes}")
+
+if __name__ == "__main__":
+    main()
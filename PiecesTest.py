@@ -1,5 +1,6 @@
 import unittest
 from ChessVar import Board, Pieces, ChessVar
+from ChessVar import SQUARE_NAMES, SQUARE_NUMBERS, KNIGHT_TARGETS, KING_TARGETS, RAYS, BETWEEN_MASKS, SLIDING_RAYS
 
 
 class TestPieces(unittest.TestCase):
@@ -466,3 +467,37 @@ class TestPieces(unittest.TestCase):
         return_value_4 = Pieces.is_valid_move_for_hunter('d6', 'g3',
                                                               self.chess_var)
         self.assertEqual(return_value_4, False)
+
+    def test_square_tables(self):
+        """Precomputed tables match the direction and distance rules"""
+        # 1: Checks knight and king targets
+        self.assertEqual(sorted(SQUARE_NAMES[square] for square in KNIGHT_TARGETS[SQUARE_NUMBERS['a1']]), ['b3', 'c2'])
+        self.assertEqual(len(KING_TARGETS[SQUARE_NUMBERS['e4']]), 8)
+        self.assertEqual(len(KING_TARGETS[SQUARE_NUMBERS['h8']]), 3)
+
+        # 2: Checks rays and between masks
+        self.assertEqual([SQUARE_NAMES[square] for square in RAYS['NORTHEAST'][SQUARE_NUMBERS['e6']]], ['f7', 'g8'])
+        between_mask = BETWEEN_MASKS[SQUARE_NUMBERS['b3']][SQUARE_NUMBERS['e6']]
+        self.assertEqual(between_mask, (1 << SQUARE_NUMBERS['c4']) | (1 << SQUARE_NUMBERS['d5']))
+        self.assertEqual(BETWEEN_MASKS[SQUARE_NUMBERS['a1']][SQUARE_NUMBERS['b3']], 0)
+
+        # 3: Checks falcon and hunter rays by player color
+        white_falcon_rays = SLIDING_RAYS[('F', 'WHITE')][SQUARE_NUMBERS['d4']]
+        black_hunter_rays = SLIDING_RAYS[('H', 'BLACK')][SQUARE_NUMBERS['d4']]
+        self.assertEqual(white_falcon_rays, black_hunter_rays)
+        self.assertIn(RAYS['SOUTH'][SQUARE_NUMBERS['d4']], white_falcon_rays)
+        self.assertNotIn(RAYS['NORTH'][SQUARE_NUMBERS['d4']], white_falcon_rays)
+
+        # 4: Checks that the direction table matches identify_direction() for every pair of squares
+        for start_square in range(64):
+            for end_square in range(64):
+                start_row, start_column = divmod(start_square, 8)
+                end_row, end_column = divmod(end_square, 8)
+                direction = Pieces.identify_direction(SQUARE_NAMES[start_square], SQUARE_NAMES[end_square], self.board)
+                if start_square == end_square:
+                    self.assertEqual(direction, 'NORTH')
+                elif (start_row == end_row) or (start_column == end_column) or \
+                        (abs(start_row - end_row) == abs(start_column - end_column)):
+                    self.assertNotEqual(direction, 'N/A')
+                else:
+                    self.assertEqual(direction, 'N/A')
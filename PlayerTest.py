@@ -33,3 +33,9 @@ class TestPlayer(unittest.TestCase):
         # 2: Checks increment of _capture_count
         self.white_piece_player.update_capture_count(1)
         self.assertEqual(self.white_piece_player.get_capture_count(), 0)
+
+    def test_add_to_reserve_list_method(self):
+        # 1: Checks that fairy piece is returned to its original position
+        self.white_piece_player.remove_from_reserve_list('F')
+        self.white_piece_player.add_to_reserve_list('F', 0)
+        self.assertEqual(self.white_piece_player.get_reserve_list(), ['F', 'H'])
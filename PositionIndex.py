@@ -0,0 +1,279 @@
+# Author: Helen C
+# GitHub username: hchao7
+# Date: 10/18/26
+# Description: Indexes every position of a game archive by its hash so games reaching a position can be found quickly
+
+import argparse
+import heapq
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from ChessVar import ChessVar, decode_move, chess_var_from_notation
+from GameRecord import GameRecordReader
+
+# File layout: header, then every position hash in ascending order, then the (game, ply) of each hash.
+# All integers are little-endian.
+POSITION_INDEX_MAGIC = b"CVPI"
+POSITION_INDEX_VERSION = 1
+HEADER_FORMAT = struct.Struct("<4sHHQ")  # magic, version, reserved, entry count
+RUN_ENTRY_FORMAT = struct.Struct("<QII")  # hash, game, ply
+
+def replay_positions(move_codes):
+    """
+    Hashes every position of a game, starting with the starting position.
+
+    Args:
+        move_codes (iterable): 16-bit move codes of the game.
+
+    Returns:
+        hash_keys (generator): The hash_key() of the game after 0, 1, 2, ... moves.
+    """
+    chess_var = ChessVar()
+    yield chess_var.hash_key()
+    for move_code in move_codes:
+        if not chess_var.push(decode_move(move_code)):
+            return
+        yield chess_var.hash_key()
+
+def write_run(entries, directory):
+    """
+    This method is a helper method for build_position_index().
+
+    Sorts entries and writes them to a temporary file.
+
+    Args:
+        entries (list): (hash, game, ply) tuples.
+        directory (str): Directory of the temporary file.
+
+    Returns:
+        path (str): Path of the temporary file.
+    """
+    entries.sort()
+    run_file = tempfile.NamedTemporaryFile("wb", dir=directory, suffix=".run", delete=False)
+    with run_file:
+        pack = RUN_ENTRY_FORMAT.pack
+        run_file.write(b"".join(pack(*entry) for entry in entries))
+    return run_file.name
+
+def read_run(path):
+    """
+    This method is a helper method for build_position_index().
+
+    Args:
+        path (str): Path of a file written by write_run().
+
+    Returns:
+        entries (generator): (hash, game, ply) tuples in ascending order.
+    """
+    chunk_size = RUN_ENTRY_FORMAT.size * 65536
+    with open(path, "rb") as run_file:
+        while True:
+            chunk = run_file.read(chunk_size)
+            if not chunk:
+                return
+            yield from RUN_ENTRY_FORMAT.iter_unpack(chunk)
+
+def build_position_index(archive_path, index_path, run_size=2000000):
+    """
+    Replays every game of an archive and writes the sorted hash -> (game, ply) index.
+
+    Entries are sorted in runs of run_size and then merged, so memory use does not grow with the archive.
+    Ply 0 is the starting position and ply n is the position after n moves.
+
+    Args:
+        archive_path (str): Archive written by GameRecord.py.
+        index_path (str): File to write.
+        run_size (int): Number of entries sorted in memory at once.
+
+    Returns:
+        entry_count (int): Number of positions indexed.
+    """
+    directory = os.path.dirname(os.path.abspath(index_path))
+    run_paths = []
+    entry_count = 0
+    try:
+        entries = []
+        with GameRecordReader(archive_path) as reader:
+            for game_number in range(len(reader)):
+                for ply, hash_key in enumerate(replay_positions(reader.get_move_codes(game_number))):
+                    entries.append((hash_key, game_number, ply))
+                if len(entries) >= run_size:
+                    entry_count += len(entries)
+                    run_paths.append(write_run(entries, directory))
+                    entries = []
+        entry_count += len(entries)
+        run_paths.append(write_run(entries, directory))
+
+        # Hashes go straight to the index file and locations to a temporary file that is appended afterwards
+        with open(index_path, "wb") as index_file, tempfile.TemporaryFile(dir=directory) as location_file:
+            index_file.write(HEADER_FORMAT.pack(POSITION_INDEX_MAGIC, POSITION_INDEX_VERSION, 0, entry_count))
+            hash_keys = array("Q")
+            locations = array("I")
+            for hash_key, game_number, ply in heapq.merge(*(read_run(path) for path in run_paths)):
+                hash_keys.append(hash_key)
+                locations.append(game_number)
+                locations.append(ply)
+                if len(hash_keys) == 65536:
+                    write_columns(index_file, location_file, hash_keys, locations)
+                    hash_keys = array("Q")
+                    locations = array("I")
+            write_columns(index_file, location_file, hash_keys, locations)
+
+            location_file.seek(0)
+            while True:
+                chunk = location_file.read(1 << 20)
+                if not chunk:
+                    break
+                index_file.write(chunk)
+    finally:
+        for path in run_paths:
+            os.remove(path)
+    return entry_count
+
+def write_columns(index_file, location_file, hash_keys, locations):
+    """
+    This method is a helper method for build_position_index().
+
+    Args:
+        index_file (file): File the hashes are written to.
+        location_file (file): File the locations are written to.
+        hash_keys (array): Hashes to write.
+        locations (array): Game and ply of each hash, one after the other.
+
+    Returns:
+        None
+    """
+    if sys.byteorder == "big":
+        hash_keys.byteswap()
+        locations.byteswap()
+    index_file.write(hash_keys.tobytes())
+    location_file.write(locations.tobytes())
+
+class PositionIndex:
+    """
+    A class representing a position index opened through a memory map.
+
+    Lookups binary search the mapped hashes, so nothing is replayed or loaded.
+
+    Attributes:
+        _file (file): Index file.
+        _mmap (mmap): Memory map of the whole file.
+        _entry_count (int): Number of positions indexed.
+        _view (memoryview): View of _mmap that _hash_keys and _locations are cast from.
+        _hash_keys (memoryview or array): Position hashes in ascending order.
+        _locations (memoryview or array): Game and ply of each hash, one after the other.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes a new PositionIndex instance and checks the index's header.
+
+        Args:
+            path (str): File written by build_position_index().
+        """
+        self._file = open(path, "rb")
+        if os.fstat(self._file.fileno()).st_size < HEADER_FORMAT.size:
+            self._file.close()
+            raise ValueError(f"Not a position index: {path}")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self._entry_count = HEADER_FORMAT.unpack_from(self._mmap, 0)
+        if magic != POSITION_INDEX_MAGIC or version != POSITION_INDEX_VERSION:
+            self.close()
+            raise ValueError(f"Not a position index: {path}")
+
+        self._view = memoryview(self._mmap)
+        hash_start = HEADER_FORMAT.size
+        location_start = hash_start + 8 * self._entry_count
+        hash_bytes = self._view[hash_start:location_start]
+        location_bytes = self._view[location_start:location_start + 8 * self._entry_count]
+        if sys.byteorder == "big":
+            self._hash_keys = array("Q", hash_bytes)
+            self._locations = array("I", location_bytes)
+            self._hash_keys.byteswap()
+            self._locations.byteswap()
+        else:
+            self._hash_keys = hash_bytes.cast("Q")
+            self._locations = location_bytes.cast("I")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._entry_count
+
+    def close(self):
+        """
+        Releases the memory map and closes the file.
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        if hasattr(self, "_view"):
+            for view in [self._hash_keys, self._locations]:
+                if isinstance(view, memoryview):
+                    view.release()
+            self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def lookup(self, hash_key):
+        """
+        Finds every game and ply whose position has the hash key.
+
+        Args:
+            hash_key (int): Hash returned by ChessVar's hash_key().
+
+        Returns:
+            locations (list): (game, ply) tuples, ordered by game and then ply.
+        """
+        start = bisect_left(self._hash_keys, hash_key)
+        end = bisect_right(self._hash_keys, hash_key, start)
+        locations = self._locations
+        return [(locations[2 * entry], locations[2 * entry + 1]) for entry in range(start, end)]
+
+    def find_games(self, chess_var):
+        """
+        Finds every game and ply that reached a position, including its reserve lists and capture counts.
+
+        Args:
+            chess_var (ChessVar): Position to look for.
+
+        Returns:
+            locations (list): (game, ply) tuples, ordered by game and then ply.
+        """
+        return self.lookup(chess_var.hash_key())
+
+def main(argv=None):
+    """
+    Builds a position index, or looks up a position, from the command line.
+
+    Args:
+        argv (list): Command line arguments, or None to read them from sys.argv.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Index or search the positions of a game archive.")
+    parser.add_argument("index", help="position index file")
+    parser.add_argument("--build", metavar="ARCHIVE", help="archive written by GameRecord.py to index")
+    parser.add_argument("--notation", help="position in ChessVar notation to look up")
+    args = parser.parse_args(argv)
+
+    if args.build:
+        print(f"{build_position_index(args.build, args.index)} positions indexed")
+    if args.notation:
+        with PositionIndex(args.index) as position_index:
+            for game_number, ply in position_index.find_games(chess_var_from_notation(args.notation)):
+                print(f"game {game_number} ply {ply}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import unittest
+import os
+import tempfile
+from ChessVar import ChessVar
+from GameRecord import write_game_records
+from PositionIndex import PositionIndex, build_position_index
+from Tournament import play_game
+
+class TestPositionIndex(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.archive_path = os.path.join(self.directory.name, "games.cvgr")
+        self.index_path = os.path.join(self.directory.name, "games.cvpi")
+        self.games = [["e2/e4/x", "e7/e5/x", "g1/f3/x"],
+                      ["g1/f3/x", "e7/e5/x", "e2/e4/x"],
+                      ["d2/d4/x", "d7/d5/x"]]
+        self.games += [play_game(game_number, "random", "greedy", game_number)["moves"] for game_number in range(5)]
+        write_game_records(self.archive_path, ((moves, "UNFINISHED") for moves in self.games))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_find_games(self):
+        """Every game and ply reaching a position is found"""
+        # Small runs make sure runs are merged
+        entry_count = build_position_index(self.archive_path, self.index_path, run_size=50)
+        self.assertEqual(entry_count, sum(len(moves) + 1 for moves in self.games))
+
+        with PositionIndex(self.index_path) as position_index:
+            self.assertEqual(len(position_index), entry_count)
+
+            # 1: Starting position is ply 0 of every game
+            self.assertEqual(position_index.find_games(ChessVar()), [(game, 0) for game in range(len(self.games))])
+
+            # 2: Transposition reached by two games
+            chess_var = ChessVar()
+            for move in ["e2/e4/x", "e7/e5/x", "g1/f3/x"]:
+                chess_var.push(tuple(move.split("/")))
+            self.assertEqual(position_index.find_games(chess_var)[:2], [(0, 3), (1, 3)])
+
+            # 3: Same placement with a different turn is a different position
+            chess_var.set_player_turn("WHITE")
+            self.assertEqual(position_index.find_games(chess_var), [])
+
+            # 4: Every position of a game with fairy pieces is found
+            chess_var = ChessVar()
+            for ply, move in enumerate(self.games[3]):
+                self.assertIn((3, ply), position_index.find_games(chess_var))
+                chess_var.push(tuple(move.split("/")))
+
+            self.assertEqual(position_index.lookup(12345), [])
+
+    def test_invalid_file(self):
+        with self.assertRaises(ValueError):
+            PositionIndex(self.archive_path)
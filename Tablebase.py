@@ -0,0 +1,729 @@
+# Author: Helen C
+# GitHub username: hchao7
+# Date: 10/18/26
+# Description: Solves small ChessVar endgames by retrograde analysis and probes them through memory maps
+
+import argparse
+import itertools
+import mmap
+import os
+import struct
+from array import array
+from ChessVar import KNIGHT_TARGETS, KING_TARGETS, RAYS, SLIDING_DIRECTIONS, chess_var_from_notation
+
+# File layout: header, then one byte per position. Positions are numbered by player turn (white first)
+# and then by the square of each piece in the order of the material name, the first piece varying slowest.
+TABLEBASE_MAGIC = b"CVTB"
+TABLEBASE_VERSION = 1
+HEADER_FORMAT = struct.Struct("<4sHH32sQ")  # magic, version, reserved, material name, entry count
+
+# A position's byte is the number of moves (plies) until a king is captured with best play, counting the capture.
+# The player to move wins when it is odd and loses when it is even. 0 is a draw and 255 is not a position.
+DRAW = 0
+NOT_A_POSITION = 255
+MAX_DISTANCE = 254
+
+# Order of pieces in a material name; each side has exactly one king
+PIECE_ORDER = "KQRBNFHP"
+CAPTURE_COUNT_PIECES = "QRBN"
+OPPOSITE_DIRECTIONS = {'NORTH': 'SOUTH', 'NORTHEAST': 'SOUTHWEST', 'EAST': 'WEST', 'SOUTHEAST': 'NORTHWEST',
+                       'SOUTH': 'NORTH', 'SOUTHWEST': 'NORTHEAST', 'WEST': 'EAST', 'NORTHWEST': 'SOUTHEAST'}
+
+def side_name(pieces, reserve="", capture_count=0):
+    """
+    Names one side of a material set, such as "KQ", or "KR-FH1" for a king and rook on the board,
+    a falcon and hunter in reserve, and a capture count of 1.
+
+    The capture count is limited to the number of reserve pieces, since only that many can be placed.
+
+    Args:
+        pieces (str): Pieces on the board, in either case and any order.
+        reserve (str): Fairy pieces in the reserve list, in either case and any order.
+        capture_count (int): Player's _capture_count.
+
+    Returns:
+        name (str)
+    """
+    pieces = "".join(sorted(pieces.upper(), key=PIECE_ORDER.index))
+    reserve = "".join(sorted(reserve.upper(), key=PIECE_ORDER.index))
+    if not reserve:
+        return pieces
+    return f"{pieces}-{reserve}{min(capture_count, len(reserve))}"
+
+def parse_material(name):
+    """
+    Parses a material name such as "KQvK" or "KR-F1vK-H0", white first.
+
+    Args:
+        name (str): Material name.
+
+    Returns:
+        material (tuple): (pieces, reserve, capture count) of white and of black.
+    """
+    sides = name.split("v")
+    if len(sides) != 2:
+        raise ValueError(f"Invalid material: {name}")
+    material = []
+    for side in sides:
+        pieces, _, reserve = side.partition("-")
+        capture_count = 0
+        if reserve:
+            if not reserve[-1].isdigit():
+                raise ValueError(f"Invalid material: {name}")
+            reserve, capture_count = reserve[:-1], int(reserve[-1])
+        if (pieces.count("K") != 1 or any(piece not in PIECE_ORDER for piece in pieces)
+                or any(piece not in "FH" for piece in reserve) or len(set(reserve)) != len(reserve)):
+            raise ValueError(f"Invalid material: {name}")
+        reserve = "".join(sorted(reserve, key=PIECE_ORDER.index))
+        material.append((side_name(pieces), reserve, min(capture_count, len(reserve))))
+    if name != material_name(material):
+        raise ValueError(f"Material is not in canonical order, use {material_name(material)}: {name}")
+    return tuple(material)
+
+def material_name(material):
+    """
+    Names a material set.
+
+    Args:
+        material (tuple): (pieces, reserve, capture count) of white and of black.
+
+    Returns:
+        name (str)
+    """
+    return "v".join(side_name(*side) for side in material)
+
+def material_pieces(material):
+    """
+    Lists the pieces of a material set in the order their squares are indexed.
+
+    Args:
+        material (tuple): (pieces, reserve, capture count) of white and of black.
+
+    Returns:
+        pieces (list): (piece as on the board, color) pairs, white pieces first.
+    """
+    return ([(piece, "WHITE") for piece in material[0][0]]
+            + [(piece.lower(), "BLACK") for piece in material[1][0]])
+
+def chess_var_material(chess_var):
+    """
+    Names the material set of a game.
+
+    Args:
+        chess_var (ChessVar): Game to name.
+
+    Returns:
+        name (str)
+    """
+    board = chess_var.get_board()
+    sides = []
+    for color, pieces in [("WHITE", PIECE_ORDER), ("BLACK", PIECE_ORDER.lower())]:
+        player = chess_var.get_player(color)
+        on_board = "".join(piece * bin(board.get_piece_bitboard(piece)).count("1") for piece in pieces)
+        sides.append(side_name(on_board, "".join(player.get_reserve_list()), player.get_capture_count()))
+    return "v".join(sides)
+
+def piece_targets(piece, color, square, occupancy, own_occupancy):
+    """
+    Lists the squares a piece can move to, following ChessVar's generate_piece_targets().
+
+    Args:
+        piece (str): Piece as on the board.
+        color (str): "WHITE" or "BLACK".
+        square (int): Square of the piece, from 0 (a8) to 63 (h1).
+        occupancy (int): Bitboard of every piece.
+        own_occupancy (int): Bitboard of the pieces of the piece's color.
+
+    Returns:
+        targets (list): Squares the piece can move to, including captures.
+    """
+    piece_type = piece.upper()
+    if piece_type == 'P':
+        targets = []
+        if color == "WHITE":
+            forward_ray, capture_directions, home_row = RAYS['NORTH'][square], ['NORTHWEST', 'NORTHEAST'], 6
+        else:
+            forward_ray, capture_directions, home_row = RAYS['SOUTH'][square], ['SOUTHWEST', 'SOUTHEAST'], 1
+        if forward_ray and not (occupancy >> forward_ray[0]) & 1:
+            targets.append(forward_ray[0])
+            if square // 8 == home_row and not (occupancy >> forward_ray[1]) & 1:
+                targets.append(forward_ray[1])
+        for direction in capture_directions:
+            capture_ray = RAYS[direction][square]
+            if capture_ray and (occupancy & ~own_occupancy) >> capture_ray[0] & 1:
+                targets.append(capture_ray[0])
+        return targets
+    if piece_type == 'N':
+        return [target for target in KNIGHT_TARGETS[square] if not (own_occupancy >> target) & 1]
+    if piece_type == 'K':
+        return [target for target in KING_TARGETS[square] if not (own_occupancy >> target) & 1]
+
+    targets = []
+    for direction in SLIDING_DIRECTIONS[(piece_type, color)]:
+        for target in RAYS[direction][square]:
+            if (occupancy >> target) & 1:
+                if not (own_occupancy >> target) & 1:
+                    targets.append(target)
+                break
+            targets.append(target)
+    return targets
+
+def piece_origins(piece, color, square, occupancy):
+    """
+    Lists the squares a piece could have come from without capturing, the reverse of piece_targets().
+
+    Args:
+        piece (str): Piece as on the board.
+        color (str): "WHITE" or "BLACK".
+        square (int): Square of the piece, from 0 (a8) to 63 (h1).
+        occupancy (int): Bitboard of every piece.
+
+    Returns:
+        origins (list): Empty squares the piece could have moved from.
+    """
+    piece_type = piece.upper()
+    if piece_type == 'P':
+        backward_ray, home_row = (RAYS['SOUTH'][square], 6) if color == "WHITE" else (RAYS['NORTH'][square], 1)
+        origins = []
+        if backward_ray and not (occupancy >> backward_ray[0]) & 1:
+            origins.append(backward_ray[0])
+            if (len(backward_ray) > 1 and backward_ray[1] // 8 == home_row
+                    and not (occupancy >> backward_ray[1]) & 1):
+                origins.append(backward_ray[1])
+        return origins
+    if piece_type == 'N':
+        return [origin for origin in KNIGHT_TARGETS[square] if not (occupancy >> origin) & 1]
+    if piece_type == 'K':
+        return [origin for origin in KING_TARGETS[square] if not (occupancy >> origin) & 1]
+
+    origins = []
+    for direction in SLIDING_DIRECTIONS[(piece_type, color)]:
+        for origin in RAYS[OPPOSITE_DIRECTIONS[direction]][square]:
+            if (occupancy >> origin) & 1:
+                break
+            origins.append(origin)
+    return origins
+
+def match_pieces(parent_pieces, child_pieces, new_piece=None):
+    """
+    This method is a helper method for TablebaseSolver's solve().
+
+    Args:
+        parent_pieces (list): Pieces of the parent table, with None for a piece that was captured.
+        child_pieces (list): Pieces of the child table.
+        new_piece (tuple): Piece that was placed, which has no parent index.
+
+    Returns:
+        order (list): Parent index of each child piece, or None for the placed piece.
+    """
+    unused = list(enumerate(parent_pieces))
+    order = []
+    for child_piece in child_pieces:
+        if child_piece == new_piece:
+            order.append(None)
+            new_piece = ()
+            continue
+        position = next(position for position, (_, piece) in enumerate(unused) if piece == child_piece)
+        order.append(unused.pop(position)[0])
+    return order
+
+class TablebaseSolver:
+    """
+    A class representing the retrograde solver of a material set and every material set it can turn into.
+
+    Captures and fairy piece placements lead to other tables, which are solved first and kept in memory.
+    Within a table, positions are solved in order of distance: a position whose child is lost is won
+    one move later, and a position whose children are all won is lost one move after the slowest.
+
+    Attributes:
+        _values (dict): Maps the names of the material sets solved so far to one byte per position.
+    """
+
+    def __init__(self):
+        """
+        Initializes a new TablebaseSolver instance with no tables solved.
+
+        This method does not require any arguments.
+        """
+        self._values = {}
+
+    def get_values(self):
+        """
+        Returns the solved tables.
+
+        This method does not require any arguments.
+
+        Returns:
+            values (dict): Maps material names to one byte per position.
+        """
+        return self._values
+
+    def solve(self, name):
+        """
+        Solves a material set and the sets it can turn into.
+
+        Args:
+            name (str): Material name such as "KQvK".
+
+        Returns:
+            values (bytearray): One byte per position, as described for the tablebase file.
+        """
+        if name in self._values:
+            return self._values[name]
+        material = parse_material(name)
+        pieces = material_pieces(material)
+        piece_count = len(pieces)
+        stride = 64 ** piece_count
+        multipliers = [64 ** (piece_count - 1 - position) for position in range(piece_count)]
+
+        # Tables reached by capturing piece j: (child values, child stride, child multipliers, order)
+        capture_children = {}
+        for captured, (piece, color) in enumerate(pieces):
+            if piece.upper() == 'K':
+                continue
+            child = [list(side) for side in material]
+            victim = child[0 if color == "WHITE" else 1]
+            victim[0] = victim[0].replace(piece.upper(), "", 1)
+            if piece.upper() in CAPTURE_COUNT_PIECES:
+                victim[2] = min(victim[2] + 1, len(victim[1]))
+            capture_children[captured] = self.get_child(child, pieces, captured=captured)
+
+        # Tables reached by placing a fairy piece, by color
+        drop_children = {"WHITE": [], "BLACK": []}
+        for side_number, color in enumerate(["WHITE", "BLACK"]):
+            on_board, reserve, capture_count = material[side_number]
+            if not reserve or capture_count == 0:
+                continue
+            for fairy_piece in reserve:
+                child = [list(side) for side in material]
+                child[side_number] = [on_board + fairy_piece, reserve.replace(fairy_piece, ""), capture_count - 1]
+                new_piece = (fairy_piece if color == "WHITE" else fairy_piece.lower(), color)
+                home_squares = range(48, 64) if color == "WHITE" else range(0, 16)
+                drop_children[color].append((self.get_child(child, pieces, new_piece=new_piece), home_squares))
+
+        values = bytearray(2 * stride)
+        remaining = array("H", bytes(4 * stride))
+        loss_floors = bytearray(2 * stride)
+        escapes = bytearray(2 * stride)  # 1 if a move leads to a drawn position in another table, 2 if a move wins
+        buckets = {}
+
+        # Scores every position from its moves that leave the table, and counts the moves that do not
+        for offset, squares in enumerate(itertools.product(range(64), repeat=piece_count)):
+            occupancies = {"WHITE": 0, "BLACK": 0}
+            square_pieces = {}
+            for position, (square, (_, color)) in enumerate(zip(squares, pieces)):
+                occupancies[color] |= 1 << square
+                square_pieces[square] = position
+            if len(square_pieces) < piece_count:
+                values[offset] = values[stride + offset] = NOT_A_POSITION
+                continue
+            occupancy = occupancies["WHITE"] | occupancies["BLACK"]
+
+            for turn, color in enumerate(["WHITE", "BLACK"]):
+                index = turn * stride + offset
+                own_occupancy = occupancies[color]
+                quiet_moves = 0
+                win = loss = 0
+                escape = 0
+                for position, (piece, piece_color) in enumerate(pieces):
+                    if piece_color != color:
+                        continue
+                    for target in piece_targets(piece, color, squares[position], occupancy, own_occupancy):
+                        if not (occupancy >> target) & 1:
+                            quiet_moves += 1
+                            continue
+                        captured = square_pieces[target]
+                        if captured not in capture_children:
+                            win = 1
+                            break
+                        child_values, child_stride, child_multipliers, order = capture_children[captured]
+                        child_index = (1 - turn) * child_stride + sum(
+                            (target if parent == position else squares[parent]) * multiplier
+                            for parent, multiplier in zip(order, child_multipliers))
+                        win, loss, escape = self.score_child(child_values[child_index], win, loss, escape)
+                    if win == 1:
+                        break
+
+                if win != 1:
+                    for (child_values, child_stride, child_multipliers, order), home_squares in drop_children[color]:
+                        for square in home_squares:
+                            if (occupancy >> square) & 1:
+                                continue
+                            child_index = (1 - turn) * child_stride + sum(
+                                (square if parent is None else squares[parent]) * multiplier
+                                for parent, multiplier in zip(order, child_multipliers))
+                            win, loss, escape = self.score_child(child_values[child_index], win, loss, escape)
+
+                if win:
+                    buckets.setdefault(win, []).append(index)
+                    escape |= 2
+                elif quiet_moves == 0 and loss and not escape:
+                    buckets.setdefault(loss, []).append(index)
+                remaining[index] = quiet_moves
+                loss_floors[index] = loss
+                escapes[index] = escape
+
+        # Solves the rest in order of distance, walking back along moves that stay in the table
+        distance = 1
+        while buckets:
+            if distance > MAX_DISTANCE:
+                raise ValueError(f"{name} has a position more than {MAX_DISTANCE} moves from a king capture")
+            for index in buckets.pop(distance, []):
+                if values[index]:
+                    continue
+                values[index] = distance
+                turn, offset = divmod(index, stride)
+                mover = "BLACK" if turn == 0 else "WHITE"
+                parent_base = (1 - turn) * stride + offset
+                squares = []
+                for multiplier in multipliers:
+                    square, offset = divmod(offset, multiplier)
+                    squares.append(square)
+                occupancy = 0
+                for square in squares:
+                    occupancy |= 1 << square
+
+                for position, (piece, color) in enumerate(pieces):
+                    if color != mover:
+                        continue
+                    square = squares[position]
+                    base = parent_base - square * multipliers[position]
+                    for origin in piece_origins(piece, color, square, occupancy):
+                        parent = base + origin * multipliers[position]
+                        if values[parent]:
+                            continue
+                        if distance % 2 == 0:
+                            buckets.setdefault(distance + 1, []).append(parent)
+                        elif not escapes[parent]:
+                            # Positions that can win or draw by leaving the table are never lost
+                            remaining[parent] -= 1
+                            if remaining[parent] == 0:
+                                buckets.setdefault(max(distance + 1, loss_floors[parent]), []).append(parent)
+            distance += 1
+
+        self._values[name] = values
+        return values
+
+    @staticmethod
+    def score_child(child_value, win, loss, escape):
+        """
+        This method is a helper method for solve().
+
+        Args:
+            child_value (int): Byte of the position after a move, for the other player.
+            win (int): Shortest win found so far, or 0.
+            loss (int): Longest loss found so far, or 0.
+            escape (int): 1 if a drawn position was found so far.
+
+        Returns:
+            scores (tuple): Updated win, loss, and escape.
+        """
+        if child_value == DRAW:
+            return win, loss, escape | 1
+        if child_value % 2 == 0:
+            return (child_value + 1 if not win else min(win, child_value + 1)), loss, escape
+        return win, max(loss, child_value + 1), escape
+
+    def get_child(self, child_material, parent_pieces, captured=None, new_piece=None):
+        """
+        This method is a helper method for solve().
+
+        Args:
+            child_material (list): [pieces, reserve, capture count] of white and of black after the move.
+            parent_pieces (list): Pieces of the table being solved.
+            captured (int): Index of the captured piece, if any.
+            new_piece (tuple): Piece that was placed, if any.
+
+        Returns:
+            child (tuple): Child values, stride, multipliers, and the parent index of each child piece.
+        """
+        child_name = material_name(child_material)
+        child_values = self.solve(child_name)
+        child_pieces = material_pieces(parse_material(child_name))
+        parent_pieces = [None if position == captured else piece for position, piece in enumerate(parent_pieces)]
+        child_count = len(child_pieces)
+        return (child_values, 64 ** child_count, [64 ** (child_count - 1 - position) for position in range(child_count)],
+                match_pieces(parent_pieces, child_pieces, new_piece))
+
+def build_tablebases(name, directory):
+    """
+    Solves a material set and every set it can turn into, and writes one file for each.
+
+    Args:
+        name (str): Material name such as "KQvK" or "K-F1vK".
+        directory (str): Directory the files are written to, as <material name>.cvtb.
+
+    Returns:
+        paths (list): Files written.
+    """
+    solver = TablebaseSolver()
+    solver.solve(name)
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for table_name, values in solver.get_values().items():
+        path = os.path.join(directory, f"{table_name}.cvtb")
+        with open(path, "wb") as table_file:
+            table_file.write(HEADER_FORMAT.pack(TABLEBASE_MAGIC, TABLEBASE_VERSION, 0,
+                                                table_name.encode(), len(values)))
+            table_file.write(values)
+        paths.append(path)
+    return paths
+
+class Tablebase:
+    """
+    A class representing one material set's tablebase opened through a memory map.
+
+    A probe reads the squares of the pieces from the Board's bitboards and one byte of the file,
+    so it takes the same time for any position.
+
+    Attributes:
+        _file (file): Tablebase file.
+        _mmap (mmap): Memory map of the whole file.
+        _name (str): Material name such as "KQvK".
+        _pieces (list): (piece as on the board, color) pairs, in the order their squares are indexed.
+        _stride (int): Number of positions with one player to move.
+        _multipliers (list): Index multiplier of each piece's square.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes a new Tablebase instance and checks the file's header.
+
+        Args:
+            path (str): File written by build_tablebases().
+        """
+        self._file = open(path, "rb")
+        if os.fstat(self._file.fileno()).st_size < HEADER_FORMAT.size:
+            self._file.close()
+            raise ValueError(f"Not a tablebase: {path}")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, name, entry_count = HEADER_FORMAT.unpack_from(self._mmap, 0)
+        if magic != TABLEBASE_MAGIC or version != TABLEBASE_VERSION:
+            self.close()
+            raise ValueError(f"Not a tablebase: {path}")
+        self._name = name.rstrip(b"\0").decode()
+        self._pieces = material_pieces(parse_material(self._name))
+        self._stride = 64 ** len(self._pieces)
+        self._multipliers = [64 ** (len(self._pieces) - 1 - position) for position in range(len(self._pieces))]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return 2 * self._stride
+
+    def close(self):
+        """
+        Releases the memory map and closes the file.
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        self._mmap.close()
+        self._file.close()
+
+    def get_name(self):
+        """
+        Returns the material name of the tablebase.
+
+        This method does not require any arguments.
+
+        Returns:
+            name (str)
+        """
+        return self._name
+
+    def get_index(self, chess_var):
+        """
+        Numbers the position of a game with the tablebase's material.
+
+        Args:
+            chess_var (ChessVar): Game with the tablebase's material.
+
+        Returns:
+            index (int): Number of the position in the file.
+        """
+        board = chess_var.get_board()
+        bitboards = {}
+        index = self._stride if chess_var.get_player_turn() == "BLACK" else 0
+        for (piece, _), multiplier in zip(self._pieces, self._multipliers):
+            bitboard = bitboards.get(piece, board.get_piece_bitboard(piece))
+            square = (bitboard & -bitboard).bit_length() - 1
+            bitboards[piece] = bitboard & (bitboard - 1)
+            index += square * multiplier
+        return index
+
+    def probe(self, chess_var):
+        """
+        Looks up the result of a game with the tablebase's material.
+
+        Args:
+            chess_var (ChessVar): Game to look up.
+
+        Returns:
+            result (tuple): "WIN", "LOSS", or "DRAW" for the player to move, and the number of moves until
+            a king is captured (0 for a draw), or None if the game has different material or is finished.
+        """
+        if chess_var.get_game_state() != "UNFINISHED" or chess_var_material(chess_var) != self._name:
+            return None
+        return self.probe_index(self.get_index(chess_var))
+
+    def probe_index(self, index):
+        """
+        Looks up the result of a position by its number.
+
+        Args:
+            index (int): Number of the position, as returned by get_index().
+
+        Returns:
+            result (tuple): "WIN", "LOSS", or "DRAW" for the player to move, and the number of moves until
+            a king is captured (0 for a draw).
+        """
+        return decode_value(self._mmap[HEADER_FORMAT.size + index])
+
+def decode_value(value):
+    """
+    Decodes a position's byte.
+
+    Args:
+        value (int): Byte of a position.
+
+    Returns:
+        result (tuple): "WIN", "LOSS", or "DRAW" for the player to move, and the number of moves until
+        a king is captured (0 for a draw).
+    """
+    if value == DRAW:
+        return "DRAW", 0
+    if value == NOT_A_POSITION:
+        raise ValueError("Not a position")
+    return ("WIN" if value % 2 else "LOSS"), value
+
+class Tablebases:
+    """
+    A class representing a directory of tablebase files, opened when a position with their material is first probed.
+
+    Attributes:
+        _directory (str): Directory of the tablebase files.
+        _tablebases (dict): Maps material names to their open Tablebase, or None if there is no file.
+    """
+
+    def __init__(self, directory):
+        """
+        Initializes a new Tablebases instance without opening any file.
+
+        Args:
+            directory (str): Directory of the tablebase files.
+        """
+        self._directory = directory
+        self._tablebases = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes every open tablebase.
+
+        This method does not require any arguments.
+
+        Returns:
+            None
+        """
+        for tablebase in self._tablebases.values():
+            if tablebase is not None:
+                tablebase.close()
+        self._tablebases = {}
+
+    def probe(self, chess_var):
+        """
+        Looks up the result of a game in the tablebase of its material.
+
+        Args:
+            chess_var (ChessVar): Game to look up.
+
+        Returns:
+            result (tuple): "WIN", "LOSS", or "DRAW" for the player to move and the number of moves until
+            a king is captured, or None if there is no tablebase for the game's material.
+        """
+        if chess_var.get_game_state() != "UNFINISHED":
+            return None
+        name = chess_var_material(chess_var)
+        if name not in self._tablebases:
+            path = os.path.join(self._directory, f"{name}.cvtb")
+            self._tablebases[name] = Tablebase(path) if os.path.exists(path) else None
+        tablebase = self._tablebases[name]
+        if tablebase is None:
+            return None
+        return tablebase.probe_index(tablebase.get_index(chess_var))
+
+    def best_move(self, chess_var):
+        """
+        Chooses the move that wins fastest, draws, or loses slowest.
+
+        Args:
+            chess_var (ChessVar): Game to move in.
+
+        Returns:
+            move (tuple): Best move, or None if a position after some move is not in the tablebases.
+        """
+        best_move, best_score = None, None
+        for move in chess_var.generate_moves():
+            chess_var.push(move)
+            if chess_var.get_game_state() != "UNFINISHED":
+                result = ("LOSS", 0)
+            else:
+                result = self.probe(chess_var)
+            chess_var.pop()
+            if result is None:
+                return None
+            # The player to move after the move is the opponent, so the opponent's loss is a win
+            child_result, distance = result
+            if child_result == "LOSS":
+                score = (2, -distance)
+            elif child_result == "DRAW":
+                score = (1, 0)
+            else:
+                score = (0, distance)
+            if best_score is None or score > best_score:
+                best_move, best_score = move, score
+        return best_move
+
+def main(argv=None):
+    """
+    Builds tablebases, or probes a position, from the command line.
+
+    Args:
+        argv (list): Command line arguments, or None to read them from sys.argv.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Build or probe ChessVar endgame tablebases.")
+    parser.add_argument("directory", help="directory of the tablebase files")
+    parser.add_argument("--build", metavar="MATERIAL", help='material set to solve, such as "KQvK" or "K-F1vK"')
+    parser.add_argument("--notation", help="position in ChessVar notation to probe")
+    args = parser.parse_args(argv)
+
+    if args.build:
+        for path in build_tablebases(args.build, args.directory):
+            print(path)
+    if args.notation:
+        with Tablebases(args.directory) as tablebases:
+            chess_var = chess_var_from_notation(args.notation)
+            result = tablebases.probe(chess_var)
+            if result is None:
+                print("not in the tablebases")
+            else:
+                best_move = tablebases.best_move(chess_var)
+                print(f"{result[0]} in {result[1]}" + (f", best move {'/'.join(best_move)}" if best_move else ""))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import unittest
+import os
+import tempfile
+from ChessVar import ChessVar, chess_var_from_notation
+from Tablebase import (Tablebase, Tablebases, build_tablebases, chess_var_material, parse_material, side_name,
+                       HEADER_FORMAT)
+
+class TestTablebase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_material_names(self):
+        # 1: Pieces are sorted and the capture count is limited to the reserve
+        self.assertEqual(side_name("rk"), "KR")
+        self.assertEqual(side_name("KQ", "hf", 5), "KQ-FH2")
+        self.assertEqual(parse_material("KR-F1vK"), (("KR", "F", 1), ("K", "", 0)))
+
+        # 2: Names that are not canonical or have no king are rejected
+        for name in ["KvKvK", "RKvK", "QvK", "K-F2vK", "K-XvK", "K-FF1vK"]:
+            with self.assertRaises(ValueError):
+                parse_material(name)
+
+        # 3: Material of a game includes reserve lists and capture counts
+        self.assertEqual(chess_var_material(ChessVar()), "KQRRBBNNPPPPPPPP-FH0vKQRRBBNNPPPPPPPP-FH0")
+        chess_var = chess_var_from_notation("8/8/8/8/8/8/2K5/k7 w F/- 3/0 +/-")
+        self.assertEqual(chess_var_material(chess_var), "K-F1vK")
+
+    def test_king_versus_king(self):
+        """Kings next to each other are captured and every other position is a draw"""
+        paths = build_tablebases("KvK", self.directory.name)
+        self.assertEqual(paths, [os.path.join(self.directory.name, "KvK.cvtb")])
+        self.assertEqual(os.path.getsize(paths[0]), HEADER_FORMAT.size + 2 * 64 * 64)
+
+        with Tablebase(paths[0]) as tablebase:
+            self.assertEqual(tablebase.get_name(), "KvK")
+            self.assertEqual(len(tablebase), 8192)
+            self.assertEqual(tablebase.probe(chess_var_from_notation("8/8/8/8/8/8/1K6/k7 b -/- 0/0 -/-")), ("WIN", 1))
+            self.assertEqual(tablebase.probe(chess_var_from_notation("8/8/8/8/8/8/2K5/k7 b -/- 0/0 -/-")), ("DRAW", 0))
+
+            # Different material is not in the tablebase
+            self.assertIsNone(tablebase.probe(ChessVar()))
+
+    def test_reserve_pieces(self):
+        """A fairy piece in reserve is placed to trap the king"""
+        paths = build_tablebases("K-F1vK", self.directory.name)
+        self.assertEqual(sorted(os.path.basename(path) for path in paths), ["K-F1vK.cvtb", "KFvK.cvtb", "KvK.cvtb"])
+
+        with Tablebases(self.directory.name) as tablebases:
+            # 1: Placing a falcon on b1 leaves the black king no safe square
+            chess_var = chess_var_from_notation("8/8/8/8/8/8/2K5/k7 w F/- 1/0 +/-")
+            self.assertEqual(tablebases.probe(chess_var), ("WIN", 3))
+            move = tablebases.best_move(chess_var)
+            self.assertEqual(move, ('b1', 'x', 'F'))
+            chess_var.push(move)
+            self.assertEqual(tablebases.probe(chess_var), ("LOSS", 2))
+
+            # 2: Every black move loses, and the king is captured two moves later
+            chess_var.push(tablebases.best_move(chess_var))
+            self.assertEqual(tablebases.probe(chess_var), ("WIN", 1))
+            chess_var.push(tablebases.best_move(chess_var))
+            self.assertEqual(chess_var.get_game_state(), "WHITE_WON")
+
+            # 3: Without a capture the falcon cannot be placed, and there is no tablebase for that material
+            self.assertIsNone(tablebases.probe(chess_var_from_notation("8/8/8/8/8/8/2K5/k7 w F/- 0/0 -/-")))
+
+    def test_invalid_file(self):
+        path = os.path.join(self.directory.name, "empty.cvtb")
+        with open(path, "wb") as empty_file:
+            empty_file.write(b"CVGR" + bytes(60))
+        with self.assertRaises(ValueError):
+            Tablebase(path)
+
+if __name__ == "__main__":
+    unittest.main()
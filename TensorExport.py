@@ -0,0 +1,180 @@
+# Author: Helen C
+# GitHub username: hchao7
+# Date: 10/18/26
+# Description: Exports the positions of archived games as NumPy feature planes for training evaluation models
+
+import argparse
+import os
+import numpy as np
+from ChessVar import ChessVar, WHITE_PIECES, BLACK_PIECES, decode_move
+from GameRecord import GameRecordReader
+
+# One 8x8 plane per feature, rows and columns as in Board's _board_display (a8 at [0, 0]).
+# Piece planes are 1 where the piece is, reserve planes are 1 everywhere while the fairy piece is in reserve,
+# capture-count planes hold the player's _capture_count everywhere, and the last plane is 1 when white is to move.
+PLANE_NAMES = ([f"piece {piece}" for piece in WHITE_PIECES + BLACK_PIECES]
+               + ["reserve F", "reserve H", "reserve f", "reserve h",
+                  "capture count WHITE", "capture count BLACK", "WHITE to move"])
+PIECE_PLANES = len(WHITE_PIECES + BLACK_PIECES)
+GAME_RESULT_VALUES = {"WHITE_WON": 1, "BLACK_WON": -1, "DRAW": 0, "UNFINISHED": 0}
+
+def encode_planes(bitboards, scalars):
+    """
+    Expands piece bitboards and per-position features into feature planes.
+
+    Args:
+        bitboards (numpy.ndarray): uint64 array of shape (N, 16), one bitboard per piece in PLANE_NAMES order.
+        scalars (numpy.ndarray): uint8 array of shape (N, 7), the value of each of the remaining planes.
+
+    Returns:
+        planes (numpy.ndarray): uint8 array of shape (N, len(PLANE_NAMES), 8, 8).
+    """
+    count = len(bitboards)
+    planes = np.empty((count, len(PLANE_NAMES), 8, 8), dtype=np.uint8)
+    square_bytes = np.ascontiguousarray(bitboards, dtype="<u8").view(np.uint8)
+    planes[:, :PIECE_PLANES] = np.unpackbits(square_bytes, axis=1, bitorder="little").reshape(count, PIECE_PLANES, 8, 8)
+    planes[:, PIECE_PLANES:] = scalars[:, :, None, None]
+    return planes
+
+def position_features(chess_var):
+    """
+    This method is a helper method for export_batches().
+
+    Args:
+        chess_var (ChessVar): Game in the position to export.
+
+    Returns:
+        features (tuple): List of 16 piece bitboards and list of 7 plane values.
+    """
+    board = chess_var.get_board()
+    white, black = chess_var.get_player("WHITE"), chess_var.get_player("BLACK")
+    white_reserve, black_reserve = white.get_reserve_list(), black.get_reserve_list()
+    bitboards = [board.get_piece_bitboard(piece) for piece in WHITE_PIECES + BLACK_PIECES]
+    scalars = ['F' in white_reserve, 'H' in white_reserve, 'f' in black_reserve, 'h' in black_reserve,
+               min(white.get_capture_count(), 255), min(black.get_capture_count(), 255),
+               chess_var.get_player_turn() == "WHITE"]
+    return bitboards, scalars
+
+def export_batches(archive_path, batch_size=4096):
+    """
+    Replays every game of an archive and yields its positions in batches.
+
+    Each position is the game before one of its moves, so only one batch is held in memory at a time.
+    All batches have batch_size positions except the last, which has the rest.
+
+    Args:
+        archive_path (str): Archive written by GameRecord.py.
+        batch_size (int): Number of positions in each batch.
+
+    Returns:
+        batches (generator): Dicts of NumPy arrays with one entry per position: "planes" (uint8, shape
+        (N, len(PLANE_NAMES), 8, 8)), "moves" (uint16 move code played), "results" (int8, 1 if white won,
+        -1 if black won, 0 otherwise), "games" (uint32 game number), and "plies" (uint32 moves before it).
+    """
+    bitboards, scalars, moves, results, games, plies = [], [], [], [], [], []
+
+    def make_batch():
+        return {"planes": encode_planes(np.array(bitboards, dtype=np.uint64), np.array(scalars, dtype=np.uint8)),
+                "moves": np.array(moves, dtype=np.uint16), "results": np.array(results, dtype=np.int8),
+                "games": np.array(games, dtype=np.uint32), "plies": np.array(plies, dtype=np.uint32)}
+
+    with GameRecordReader(archive_path) as reader:
+        for game_number in range(len(reader)):
+            chess_var = ChessVar()
+            result_value = GAME_RESULT_VALUES[reader.get_result(game_number)]
+            for ply, move_code in enumerate(reader.get_move_codes(game_number)):
+                position_bitboards, position_scalars = position_features(chess_var)
+                if not chess_var.push(decode_move(move_code)):
+                    break
+                bitboards.append(position_bitboards)
+                scalars.append(position_scalars)
+                moves.append(move_code)
+                results.append(result_value)
+                games.append(game_number)
+                plies.append(ply)
+                if len(moves) == batch_size:
+                    yield make_batch()
+                    bitboards, scalars, moves, results, games, plies = [], [], [], [], [], []
+    if moves:
+        yield make_batch()
+
+def export_shards(archive_path, directory, batch_size=4096, compress=False):
+    """
+    Writes the positions of an archive as one .npz file per batch.
+
+    Args:
+        archive_path (str): Archive written by GameRecord.py.
+        directory (str): Directory the shards are written to, as shard-00000.npz, shard-00001.npz, ...
+        batch_size (int): Number of positions in each shard.
+        compress (bool): Compresses the shards with zlib.
+
+    Returns:
+        paths (list): Shards written.
+    """
+    os.makedirs(directory, exist_ok=True)
+    save = np.savez_compressed if compress else np.savez
+    paths = []
+    for shard_number, batch in enumerate(export_batches(archive_path, batch_size)):
+        path = os.path.join(directory, f"shard-{shard_number:05d}.npz")
+        save(path, **batch)
+        paths.append(path)
+    return paths
+
+def export_memmap(archive_path, directory, batch_size=4096):
+    """
+    Writes the positions of an archive into memory-mapped .npy files, one per array of export_batches().
+
+    The number of positions is read from the archive's index, so the files are created at their full size
+    and filled one batch at a time. If a game has an illegal move, its remaining positions are left out
+    and the end of each file stays zero.
+
+    Args:
+        archive_path (str): Archive written by GameRecord.py.
+        directory (str): Directory the files are written to, as planes.npy, moves.npy, results.npy, ...
+        batch_size (int): Number of positions written at once.
+
+    Returns:
+        position_count (int): Number of positions written.
+    """
+    with GameRecordReader(archive_path) as reader:
+        capacity = sum(reader.get_index_entry(game_number)[1] for game_number in range(len(reader)))
+    os.makedirs(directory, exist_ok=True)
+    arrays = {}
+    position_count = 0
+    for batch in export_batches(archive_path, batch_size):
+        if not arrays:
+            arrays = {name: np.lib.format.open_memmap(os.path.join(directory, f"{name}.npy"), mode="w+",
+                                                      dtype=array.dtype, shape=(capacity,) + array.shape[1:])
+                      for name, array in batch.items()}
+        for name, array in batch.items():
+            arrays[name][position_count:position_count + len(array)] = array
+        position_count += len(batch["moves"])
+    for array in arrays.values():
+        array.flush()
+    return position_count
+
+def main(argv=None):
+    """
+    Exports the positions of an archive from the command line.
+
+    Args:
+        argv (list): Command line arguments, or None to read them from sys.argv.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Export archived games as NumPy feature planes.")
+    parser.add_argument("archive", help="archive written by GameRecord.py")
+    parser.add_argument("directory", help="directory the arrays are written to")
+    parser.add_argument("--batch-size", type=int, default=4096, help="positions per batch or shard")
+    parser.add_argument("--memmap", action="store_true", help="write memory-mapped .npy files instead of .npz shards")
+    parser.add_argument("--compress", action="store_true", help="compress the .npz shards")
+    args = parser.parse_args(argv)
+
+    if args.memmap:
+        print(f"{export_memmap(args.archive, args.directory, args.batch_size)} positions")
+    else:
+        print(f"{len(export_shards(args.archive, args.directory, args.batch_size, args.compress))} shards")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import unittest
+import os
+import tempfile
+from ChessVar import ChessVar, encode_move
+from GameRecord import write_game_records
+from Tournament import play_game
+
+try:
+    import numpy as np
+    from TensorExport import PLANE_NAMES, export_batches, export_shards, export_memmap
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestTensorExport(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.archive_path = os.path.join(self.directory.name, "games.cvgr")
+        self.games = [(play_game(game_number, "random", "greedy", game_number)["moves"], "WHITE_WON")
+                      for game_number in range(4)]
+        self.games.append((["e2/e4/x", "d7/d5/x", "e4/d5/x", "d8/d5/x", "c2/c3/x", "d5/d2/x", "d1/d2/x",
+                            "c7/c6/x", "d2/d1/x", "d8/x/f"], "BLACK_WON"))
+        write_game_records(self.archive_path, self.games)
+        self.position_count = sum(len(moves) for moves, _ in self.games)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_export_batches(self):
+        """Planes match the board, reserve lists, capture counts, and turn of every position"""
+        batches = list(export_batches(self.archive_path, batch_size=64))
+        self.assertTrue(all(len(batch["moves"]) == 64 for batch in batches[:-1]))
+        self.assertEqual(sum(len(batch["moves"]) for batch in batches), self.position_count)
+        self.assertEqual(batches[0]["planes"].shape, (64, len(PLANE_NAMES), 8, 8))
+        self.assertEqual(batches[0]["planes"].dtype, np.uint8)
+
+        planes = np.concatenate([batch["planes"] for batch in batches])
+        moves = np.concatenate([batch["moves"] for batch in batches])
+        results = np.concatenate([batch["results"] for batch in batches])
+        position = 0
+        for moves_played, result in self.games:
+            chess_var = ChessVar()
+            for move in moves_played:
+                board_display = chess_var.get_board().get_board_display()
+                for plane, name in enumerate(PLANE_NAMES[:16]):
+                    expected = [[int(board_display[row][column + 1] == name[-1]) for column in range(8)]
+                                for row in range(8)]
+                    self.assertEqual(planes[position, plane].tolist(), expected)
+                white, black = chess_var.get_player("WHITE"), chess_var.get_player("BLACK")
+                self.assertEqual(planes[position, 16:, 3, 5].tolist(),
+                                 ['F' in white.get_reserve_list(), 'H' in white.get_reserve_list(),
+                                  'f' in black.get_reserve_list(), 'h' in black.get_reserve_list(),
+                                  white.get_capture_count(), black.get_capture_count(),
+                                  chess_var.get_player_turn() == "WHITE"])
+                self.assertEqual(moves[position], encode_move(tuple(move.split("/"))))
+                self.assertEqual(results[position], 1 if result == "WHITE_WON" else -1)
+                chess_var.push(tuple(move.split("/")))
+                position += 1
+
+        # The fairy piece placement is made by black after its queen was captured
+        self.assertEqual(planes[-1, PLANE_NAMES.index("reserve f")].max(), 1)
+        self.assertEqual(planes[-1, PLANE_NAMES.index("capture count BLACK")].max(), 1)
+
+    def test_shards_and_memmap(self):
+        # 1: One shard per batch
+        shard_directory = os.path.join(self.directory.name, "shards")
+        paths = export_shards(self.archive_path, shard_directory, batch_size=20, compress=True)
+        self.assertEqual(len(paths), (self.position_count + 19) // 20)
+        with np.load(paths[0]) as shard:
+            self.assertEqual(shard["planes"].shape, (20, len(PLANE_NAMES), 8, 8))
+            self.assertEqual(shard["plies"][:3].tolist(), [0, 1, 2])
+
+        # 2: Memory-mapped arrays hold every position, in the same order as the shards
+        memmap_directory = os.path.join(self.directory.name, "memmap")
+        self.assertEqual(export_memmap(self.archive_path, memmap_directory, batch_size=100), self.position_count)
+        planes = np.load(os.path.join(memmap_directory, "planes.npy"), mmap_mode="r")
+        games = np.load(os.path.join(memmap_directory, "games.npy"), mmap_mode="r")
+        self.assertEqual(planes.shape[0], self.position_count)
+        self.assertEqual(games[-1], len(self.games) - 1)
+        with np.load(paths[-1]) as shard:
+            self.assertTrue(np.array_equal(planes[-len(shard["planes"]):], shard["planes"]))
+        del planes, games
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,225 @@
+# Author: Helen C
+# GitHub username: hchao7
+# Date: 10/18/26
+# Description: Plays many ChessVar games between two computer players across all CPU cores
+
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from ChessVar import ChessVar
+from Engine import Engine
+from MCTS import MCTSPlayer
+from OpeningBook import OpeningBook
+from Tablebase import Tablebases
+
+def make_policy(spec):
+    """
+    Creates a move-selection policy from its description.
+
+    Policies are described by strings so they can be sent to worker processes:
+    "random" picks a random legal move, "greedy" prefers the move that captures the most valuable piece,
+    "engine:depth=2,nodes=5000,time=0.5,hash=4,quiescence=0" searches with an Engine, and
+    "mcts:playouts=500,policy=random" searches with an MCTSPlayer (all options are optional;
+    an engine given no time or node limit searches to depth 2).
+    Any policy also takes "book=path", which plays moves from an opening book written by OpeningBook.py
+    while the position is in the book, and "tablebases=directory", which plays perfect moves from the
+    tablebases written by Tablebase.py once the material is small enough.
+
+    Args:
+        spec (str): Description of the policy.
+
+    Returns:
+        policy (function): Takes a ChessVar and a random.Random and returns a move. Its close attribute
+        releases the files and processes the policy holds.
+    """
+    name, _, options = spec.partition(":")
+    params = dict(option.split("=", 1) for option in options.split(",") if option)
+
+    if "tablebases" in params:
+        tablebases = Tablebases(params.pop("tablebases"))
+        fallback = make_policy(name + ":" + ",".join(f"{key}={value}" for key, value in params.items()))
+
+        def policy(chess_var, generator):
+            move = tablebases.best_move(chess_var) if tablebases.probe(chess_var) is not None else None
+            return move if move is not None else fallback(chess_var, generator)
+
+        def close():
+            tablebases.close()
+            fallback.close()
+        policy.close = close
+        return policy
+
+    if "book" in params:
+        book = OpeningBook(params.pop("book"))
+        fallback = make_policy(name + ":" + ",".join(f"{key}={value}" for key, value in params.items()))
+
+        def policy(chess_var, generator):
+            move = book.choose_move(chess_var, generator)
+            return move if move is not None else fallback(chess_var, generator)
+
+        def close():
+            book.close()
+            fallback.close()
+        policy.close = close
+        return policy
+
+    if name == "random":
+        def policy(chess_var, generator):
+            return generator.choice(chess_var.generate_moves())
+        policy.close = lambda: None
+        return policy
+
+    if name == "greedy":
+        piece_values = {'.': 0, 'P': 1, 'N': 3, 'B': 3, 'F': 4, 'H': 4, 'R': 5, 'Q': 9, 'K': 100}
+
+        def policy(chess_var, generator):
+            board = chess_var.get_board()
+            moves = chess_var.generate_moves()
+            generator.shuffle(moves)
+            return max(moves, key=lambda move: piece_values[board.get_piece(move[1]).upper()] if move[2] == 'x' else 0)
+        policy.close = lambda: None
+        return policy
+
+    if name == "engine":
+        # Without a time or node limit, the depth is the only bound on each search
+        default_depth = 64 if "time" in params or "nodes" in params else 2
+        engine = Engine(max_depth=int(params.get("depth", default_depth)),
+                        time_limit=float(params["time"]) if "time" in params else None,
+                        node_limit=int(params["nodes"]) if "nodes" in params else None,
+                        hash_size_mb=float(params.get("hash", 4)),
+                        quiescence=params.get("quiescence", "1") != "0")
+
+        def policy(chess_var, generator):
+            return engine.search(chess_var)["move"]
+        policy.close = engine.close
+        return policy
+
+    if name == "mcts":
+        player = MCTSPlayer(playouts=int(params.get("playouts", 500)), policy=params.get("policy", "light"),
+                            max_plies=int(params.get("plies", 200)))
+
+        def policy(chess_var, generator):
+            return player.search(chess_var)["move"]
+        policy.close = player.close
+        return policy
+
+    raise ValueError(f"Unknown policy: {spec}")
+
+def play_game(game_number, white_spec, black_spec, seed, max_plies=300, random_opening_plies=0):
+    """
+    Plays one game between two policies.
+
+    Args:
+        game_number (int): Number of the game in its tournament.
+        white_spec (str): Policy of the white-piece player.
+        black_spec (str): Policy of the black-piece player.
+        seed (int): Seed of the game's random number generator.
+        max_plies (int): Number of moves after which the game is a draw.
+        random_opening_plies (int): Number of random moves played first, so that games differ.
+
+    Returns:
+        record (dict): "game", "seed", "white", "black", "result" ("WHITE_WON", "BLACK_WON", or "DRAW"),
+        "plies", and "moves" in start/end/fairy format.
+    """
+    generator = random.Random(seed)
+    policies = {"WHITE": make_policy(white_spec), "BLACK": make_policy(black_spec)}
+    chess_var = ChessVar(white_spec, black_spec)
+    moves = []
+
+    try:
+        while chess_var.get_game_state() == "UNFINISHED" and len(moves) < max_plies:
+            legal_moves = chess_var.generate_moves()
+            if not legal_moves:
+                break
+            if len(moves) < random_opening_plies:
+                move = generator.choice(legal_moves)
+            else:
+                move = policies[chess_var.get_player_turn()](chess_var, generator)
+            chess_var.push(move)
+            moves.append("/".join(move))
+    finally:
+        for policy in policies.values():
+            policy.close()
+
+    result = chess_var.get_game_state()
+    return {"game": game_number, "seed": seed, "white": white_spec, "black": black_spec,
+            "result": result if result != "UNFINISHED" else "DRAW", "plies": len(moves), "moves": moves}
+
+def run_tournament(policy_a, policy_b, num_games, output_path, workers=None, base_seed=0, max_plies=300,
+                   random_opening_plies=0):
+    """
+    Plays games between two policies on a process pool, alternating colors.
+
+    policy_a plays white in even-numbered games and black in odd-numbered games.
+    Each game's record is written to output_path as a line of JSON as soon as the game finishes.
+
+    Args:
+        policy_a (str): Description of the first policy.
+        policy_b (str): Description of the second policy.
+        num_games (int): Number of games to play.
+        output_path (str): File the game records are written to.
+        workers (int): Number of worker processes, or None for one per CPU core.
+        base_seed (int): Seed of the first game; game n uses base_seed + n.
+        max_plies (int): Number of moves after which a game is a draw.
+        random_opening_plies (int): Number of random moves played first in each game.
+
+    Returns:
+        summary (dict): "games", "wins", "losses", and "draws" from policy_a's point of view, and "time" (seconds).
+    """
+    start_time = time.perf_counter()
+    summary = {"games": 0, "wins": 0, "losses": 0, "draws": 0}
+    with open(output_path, "w") as output_file, ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for game_number in range(num_games):
+            white_spec, black_spec = (policy_a, policy_b) if game_number % 2 == 0 else (policy_b, policy_a)
+            futures.append(executor.submit(play_game, game_number, white_spec, black_spec, base_seed + game_number,
+                                           max_plies, random_opening_plies))
+
+        for future in as_completed(futures):
+            record = future.result()
+            output_file.write(json.dumps(record) + "\n")
+            output_file.flush()
+
+            summary["games"] += 1
+            policy_a_color = "WHITE" if record["game"] % 2 == 0 else "BLACK"
+            if record["result"] == "DRAW":
+                summary["draws"] += 1
+            elif record["result"] == policy_a_color + "_WON":
+                summary["wins"] += 1
+            else:
+                summary["losses"] += 1
+
+    summary["time"] = time.perf_counter() - start_time
+    return summary
+
+def main(argv=None):
+    """
+    Runs a tournament from the command line.
+
+    Args:
+        argv (list): Command line arguments, or None to read them from sys.argv.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Play ChessVar games between two policies.")
+    parser.add_argument("policy_a", help='first policy, e.g. "random", "greedy", or "engine:depth=2"')
+    parser.add_argument("policy_b", help="second policy")
+    parser.add_argument("--games", type=int, default=100, help="number of games")
+    parser.add_argument("--output", default="tournament.jsonl", help="file the game records are written to")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--max-plies", type=int, default=300, help="moves after which a game is a draw")
+    parser.add_argument("--random-opening-plies", type=int, default=2, help="random moves played first")
+    args = parser.parse_args(argv)
+
+    summary = run_tournament(args.policy_a, args.policy_b, args.games, args.output, args.workers, args.seed,
+                             args.max_plies, args.random_opening_plies)
+    print(f"{args.policy_a} vs {args.policy_b}: +{summary['wins']} -{summary['losses']} ={summary['draws']} "
+          f"in {summary['time']:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import unittest
+from ChessVar import encode_move
+from Engine import TranspositionTable, EXACT_BOUND, LOWER_BOUND, UPPER_BOUND
+
+class TestTranspositionTable(unittest.TestCase):
+    def setUp(self):
+        self.table = TranspositionTable(1)
+
+    def test_size(self):
+        """Table is preallocated to fit its size in megabytes"""
+        stats = self.table.get_stats()
+        self.assertEqual(stats["entries"], 1024 * 1024 // 16)
+        self.assertEqual(stats["filled"], 0)
+
+    def test_store_and_probe_methods(self):
+        # 1: Missing position
+        self.assertEqual(self.table.probe(12345), None)
+
+        # 2: Stored entries are returned unchanged
+        move_code = encode_move(('d1', 'x', 'F'))
+        self.table.store(12345, 6, -250, LOWER_BOUND, move_code)
+        self.assertEqual(self.table.probe(12345), (6, -250, LOWER_BOUND, move_code))
+        self.table.store(2 ** 64 - 1, 0, 99990, EXACT_BOUND, 0)
+        self.assertEqual(self.table.probe(2 ** 64 - 1), (0, 99990, EXACT_BOUND, 0))
+
+        # 3: Same bucket, different position
+        self.assertEqual(self.table.probe(12345 + 2 ** 40), None)
+
+        stats = self.table.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["stores"]), (2, 2, 2))
+
+    def test_replacement_policy(self):
+        """Deepest entry is kept and the second slot is always replaced"""
+        num_buckets = self.table.get_stats()["entries"] // 2
+        keys = [7 + num_buckets * index for index in range(1, 5)]
+
+        self.table.store(keys[0], 8, 10, EXACT_BOUND, 0)
+        self.table.store(keys[1], 2, 20, UPPER_BOUND, 0)
+        self.table.store(keys[2], 3, 30, UPPER_BOUND, 0)
+        self.assertEqual(self.table.probe(keys[0]), (8, 10, EXACT_BOUND, 0))
+        self.assertEqual(self.table.probe(keys[1]), None)
+        self.assertEqual(self.table.probe(keys[2]), (3, 30, UPPER_BOUND, 0))
+
+        # Deeper search takes the depth-preferred slot
+        self.table.store(keys[3], 9, 40, EXACT_BOUND, 0)
+        self.assertEqual(self.table.probe(keys[0]), None)
+        self.assertEqual(self.table.probe(keys[3]), (9, 40, EXACT_BOUND, 0))
+        self.assertEqual(self.table.get_stats()["overwrites"], 2)
+
+        # Clear empties the table
+        self.table.clear()
+        self.assertEqual(self.table.probe(keys[3]), None)
+        self.assertEqual(self.table.get_stats()["stores"], 0)
+
+    def test_shared_buffer(self):
+        """Tables kept in the same memory see each other's entries"""
+        buffer = memoryview(bytearray(TranspositionTable.get_buffer_size(1)))
+        first_table = TranspositionTable(1, buffer)
+        second_table = TranspositionTable(1, buffer)
+        self.assertEqual(first_table.get_stats()["entries"], self.table.get_stats()["entries"])
+
+        first_table.store(12345, 4, 77, EXACT_BOUND, 0)
+        self.assertEqual(second_table.probe(12345), (4, 77, EXACT_BOUND, 0))
+        second_table.clear()
+        self.assertEqual(first_table.probe(12345), None)
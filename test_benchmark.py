@@ -0,0 +1,57 @@
+import unittest
+import contextlib
+import io
+import os
+import tempfile
+from Benchmark import (sample_positions, benchmark_evaluation, benchmark_playouts, benchmark_suite, find_regressions,
+                       load_baseline, save_baseline, main, PIECE_METHODS)
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_sample_positions(self):
+        positions = sample_positions(5, seed=3)
+        self.assertEqual(len(positions), 5)
+        for chess_var in positions:
+            self.assertEqual(chess_var.get_game_state(), "UNFINISHED")
+
+    def test_benchmark_evaluation(self):
+        positions = sample_positions(3)
+        report = benchmark_evaluation(positions, repeat=20)
+        self.assertEqual(set(report), {"evaluations_per_second", "rescans_per_second", "move_evaluations_per_second"})
+        for value in report.values():
+            self.assertGreater(value, 0)
+
+    def test_benchmark_playouts(self):
+        report = benchmark_playouts(playouts=8, workers=[0, 2])
+        self.assertEqual(set(report), {"playouts_per_second_0_workers", "playouts_per_second_2_workers"})
+        for value in report.values():
+            self.assertGreater(value, 0)
+
+    def test_benchmark_suite(self):
+        report = benchmark_suite(rounds=1, min_time=0.001)
+        self.assertEqual(set(report), {"Board.alg_coordinate_to_list_index", "ChessVar.make_move",
+                                       "ChessVar.enter_fairy_piece", "replay_chess_game",
+                                       "ChessVar.print_board_display"}
+                         | {f"Pieces.is_valid_move_for_{name}" for name in PIECE_METHODS.values()})
+        for value in report.values():
+            self.assertGreater(value, 0)
+
+    def test_regressions(self):
+        # 1: Only paths slower than the threshold are regressions, the largest slowdown first
+        baseline = {"make_move": 10.0, "replay": 100.0, "render": 4.0}
+        report = {"make_move": 11.0, "replay": 150.0, "render": 5.0, "new path": 1.0}
+        self.assertEqual(find_regressions(report, baseline, threshold=20), [("replay", 100.0, 150.0, 50.0),
+                                                                             ("render", 4.0, 5.0, 25.0)])
+        self.assertEqual(find_regressions(report, baseline, threshold=60), [])
+
+        # 2: Baselines are saved as JSON
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            save_baseline(baseline, path)
+            self.assertEqual(load_baseline(path), baseline)
+
+            # 3: The command line fails when the suite is slower than the baseline
+            save_baseline({"replay_chess_game": 1e-9}, path)
+            with contextlib.redirect_stdout(io.StringIO()) as output, self.assertRaises(SystemExit):
+                main(["--baseline", path])
+            self.assertIn("REGRESSION replay_chess_game", output.getvalue())
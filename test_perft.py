@@ -0,0 +1,104 @@
+import unittest
+import io
+import contextlib
+import unittest.mock
+from ChessVar import ChessVar, Pieces
+from Perft import perft, perft_divide, run_perft, validate_moves, main
+
+# Reference counts up to depth 3 were checked by validating every pair of squares with make_move() and enter_fairy_piece()
+FAIRY_BOARD = [['8', 'r', '.', '.', 'q', 'k', '.', 'n', 'r'],
+               ['7', 'p', 'p', '.', '.', 'f', 'p', 'p', '.'],
+               ['6', '.', '.', 'n', '.', '.', '.', '.', 'p'],
+               ['5', '.', '.', 'p', 'P', '.', '.', '.', '.'],
+               ['4', '.', 'b', '.', '.', 'H', '.', '.', '.'],
+               ['3', '.', '.', 'N', '.', '.', 'Q', '.', '.'],
+               ['2', 'P', 'P', '.', '.', '.', 'P', 'P', 'P'],
+               ['1', 'R', '.', 'B', '.', 'K', '.', '.', 'R'],
+               [' ', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']]
+
+KING_CAPTURE_BOARD = [['8', '.', '.', '.', '.', 'k', '.', '.', '.'],
+                      ['7', '.', '.', '.', 'p', '.', 'p', '.', '.'],
+                      ['6', '.', '.', '.', '.', '.', '.', '.', '.'],
+                      ['5', '.', '.', '.', 'R', '.', 'b', '.', '.'],
+                      ['4', '.', '.', '.', '.', '.', '.', '.', '.'],
+                      ['3', '.', '.', 'n', '.', '.', '.', '.', '.'],
+                      ['2', '.', '.', '.', '.', 'P', '.', '.', '.'],
+                      ['1', '.', '.', '.', '.', 'K', '.', '.', 'Q'],
+                      [' ', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']]
+
+class TestPerft(unittest.TestCase):
+
+    def test_starting_position(self):
+        chess_var = ChessVar()
+        for depth, nodes in enumerate([1, 20, 400, 8902, 197750]):
+            self.assertEqual(perft(chess_var, depth), nodes)
+
+    def test_fairy_pieces(self):
+        # Both players may place a fairy piece
+        chess_var = ChessVar(board_display=FAIRY_BOARD)
+        chess_var.get_player("WHITE").set_reserve_list(['F'])
+        chess_var.get_player("BLACK").set_reserve_list(['h'])
+        for color in ["WHITE", "BLACK"]:
+            chess_var.get_player(color).set_capture_count(1)
+            chess_var.get_player(color).set_fairy_piece_entry(True)
+        for depth, nodes in enumerate([1, 51, 2096, 105342]):
+            self.assertEqual(perft(chess_var, depth), nodes)
+
+    def test_king_capture(self):
+        # Black to move, with both fairy pieces available
+        chess_var = ChessVar(board_display=KING_CAPTURE_BOARD)
+        chess_var.set_player_turn("BLACK")
+        chess_var.get_player("BLACK").set_capture_count(2)
+        chess_var.get_player("BLACK").set_fairy_piece_entry(True)
+        for depth, nodes in enumerate([1, 48, 1412, 59798]):
+            self.assertEqual(perft(chess_var, depth), nodes)
+
+    def test_perft_divide(self):
+        chess_var = ChessVar()
+        divide = perft_divide(chess_var, 3)
+        self.assertEqual(len(divide), 20)
+        self.assertEqual(sum(divide.values()), 8902)
+        self.assertEqual(divide["e2/e4/x"], 600)
+        self.assertEqual(divide["g1/f3/x"], 440)
+
+        report = run_perft(chess_var, 2, divide=True)
+        self.assertEqual(report["nodes"], 400)
+        self.assertEqual(report["divide"]["g1/f3/x"], 20)
+        self.assertGreater(report["nodes_per_second"], 0)
+
+    def test_validate(self):
+        # 1: The generated moves match the validators, fairy piece placements included
+        chess_var = ChessVar(board_display=FAIRY_BOARD)
+        chess_var.get_player("WHITE").set_reserve_list(['F'])
+        chess_var.get_player("BLACK").set_reserve_list(['h'])
+        for color in ["WHITE", "BLACK"]:
+            chess_var.get_player(color).set_capture_count(1)
+            chess_var.get_player(color).set_fairy_piece_entry(True)
+        self.assertEqual(perft(chess_var, 2, validate=True), 2096)
+        self.assertEqual(perft_divide(ChessVar(), 2, validate=True)["b1/c3/x"], 20)
+
+        # 2: A validator that rejects generated moves stops the count, with or without validate
+        with unittest.mock.patch.object(Pieces, "is_valid_move_for_knight", return_value=False):
+            with self.assertRaises(ValueError):
+                perft(ChessVar(), 2)
+            with self.assertRaises(ValueError):
+                validate_moves(ChessVar())
+
+        # 3: A validator that accepts moves that are not generated
+        with unittest.mock.patch.object(Pieces, "is_valid_move_for_knight", return_value=True):
+            with self.assertRaises(ValueError):
+                perft(ChessVar(), 1, validate=True)
+
+    def test_command_line(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            main(["2", "--divide"])
+        lines = output.getvalue().splitlines()
+        self.assertTrue(lines[1].startswith("depth 2: 400 nodes"))
+        self.assertIn("e2/e4/x: 20", lines)
+
+        # Depths below 1 and --turn with --notation are rejected
+        for argv in [["0"], ["1", "--notation", "8/8/8/8/8/8/2K5/k7 w -/- 0/0 -/-", "--turn", "BLACK"],
+                     ["1", "--notation", "8/8/8/8/8/8/2K5/k7 w -/- 0/0 -/-", "--board", "board.json"]]:
+            with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                main(argv)
@@ -0,0 +1,69 @@
+import unittest
+import io
+import os
+import tempfile
+import tracemalloc
+from ChessVar import ChessVar, replay_chess_game, replay_moves
+
+class TestReplayChessGameMethod(unittest.TestCase):
+
+    def test_game_end(self):
+        # 1: Game ends when either player's king is captured
+        game = ChessVar()
+        board_display = [
+        ['8','r','n','b','q','.','b','n','r'],
+        ['7','p','p','p','p','p','p','p','p'],
+        ['6','.','.','.','.','.','.','.','.'],
+        ['5','.','.','.','.','.','.','.','.'],
+        ['4','.','.','.','.','.','.','.','.'],
+        ['3','.','.','.','.','k','.','.','.'],
+        ['2','P','P','P','P','P','P','P','P'],
+        ['1','R','N','B','Q','K','B','N','R'],
+        [' ','a','b','c','d','e','f','g','h']]
+
+        game.get_board().set_board_display(board_display)
+        game, results = replay_chess_game(game, ["d2/e3/x\n"])
+        self.assertEqual(game.get_game_state(), "WHITE_WON")
+        self.assertEqual(results, [{"ply": 1, "move": "d2/e3/x", "turn": "WHITE", "game_state": "WHITE_WON"}])
+
+    def test_moves_and_fairy_pieces(self):
+        # 1: Regular moves and fairy piece placements are applied in turn
+        moves = ["d2/d4/x", "e7/e5/x", "d4/e5/x", "d7/d6/x", "e5/d6/x", "", "c7/d6/x", "d2/x/F", "d8/d7/x", "END/x/x"]
+        game = ChessVar()
+        game.get_player("WHITE").set_fairy_piece_entry(True)
+        game, results = replay_chess_game(game, io.StringIO("\n".join(moves)))
+        self.assertEqual([result["ply"] for result in results], list(range(1, 10)))
+        self.assertEqual(results[6], {"ply": 7, "move": "d2/x/F", "turn": "WHITE", "game_state": "UNFINISHED"})
+        self.assertEqual(game.get_board().get_piece("d2"), "F")
+        self.assertEqual(game.get_game_state(), "END")
+
+    def test_errors(self):
+        # 1: Replay stops at the first move that cannot be applied
+        game, results = replay_chess_game(ChessVar(), ["e2/e4/x", "e2/e4/x", "e7/e5/x"])
+        self.assertEqual(results[-1], {"ply": 2, "move": "e2/e4/x", "error": "illegal move"})
+        self.assertEqual(game.get_board().get_piece("e5"), ".")
+
+        # 2: Malformed moves
+        for move in ["e2-e4", "z9/e4/x", "e2//x", "d1/x/Q"]:
+            game, results = replay_chess_game(ChessVar(), [move])
+            self.assertEqual(results, [{"ply": 1, "move": move, "error": "malformed move"}])
+
+        # 3: Moves after the game ends
+        results = list(replay_moves(ChessVar(), ["END/x/x", "e2/e4/x"]))
+        self.assertEqual(results[-1]["error"], "game finished")
+
+    def test_large_file(self):
+        # 1: Only the last result is kept, and the file is read one line at a time
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "moves.txt")
+            with open(path, "w") as move_file:
+                move_file.write("g1/f3/x\ng8/f6/x\nf3/g1/x\nf6/g8/x\n" * 2500)
+
+            tracemalloc.start()
+            game, results = replay_chess_game(ChessVar(), path, keep_results=False)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        self.assertEqual(results, [{"ply": 10000, "move": "f6/g8/x", "turn": "BLACK", "game_state": "UNFINISHED"}])
+        self.assertEqual(game.get_board().get_piece("g8"), "n")
+        self.assertLess(peak, 1024 * 1024)
@@ -0,0 +1,56 @@
+import unittest
+import json
+import os
+import tempfile
+from ChessVar import ChessVar
+from Tournament import make_policy, play_game, run_tournament
+
+class TestTournament(unittest.TestCase):
+
+    def test_play_game(self):
+        # 1: Same seed plays the same game
+        record = play_game(0, "random", "greedy", seed=7, max_plies=60)
+        self.assertEqual(record, play_game(0, "random", "greedy", seed=7, max_plies=60))
+        self.assertIn(record["result"], ["WHITE_WON", "BLACK_WON", "DRAW"])
+        self.assertLessEqual(record["plies"], 60)
+
+        # 2: Recorded moves replay to the same result
+        chess_var = ChessVar()
+        for move in record["moves"]:
+            start, end, fairy = move.split("/")
+            self.assertTrue(chess_var.push((start, end, fairy)))
+        result = chess_var.get_game_state()
+        self.assertEqual(record["result"], result if result != "UNFINISHED" else "DRAW")
+
+    def test_make_policy(self):
+        # 1: Engine policy captures an exposed king
+        chess_var = ChessVar()
+        chess_var.get_board().remove_piece('e7')
+        chess_var.get_board().place_piece('e4', 'Q')
+        policy = make_policy("engine:depth=2,hash=1")
+        self.addCleanup(policy.close)
+        self.assertEqual(policy(chess_var, None), ('e4', 'e8', 'x'))
+
+        # 2: Engine policy without limits searches to a fixed depth instead of running unbounded
+        chess_var = ChessVar()
+        policy = make_policy("engine:hash=1")
+        self.addCleanup(policy.close)
+        self.assertIn(policy(chess_var, None), chess_var.generate_moves())
+
+        # 3: Unknown policy
+        with self.assertRaises(ValueError):
+            make_policy("unknown")
+
+    def test_run_tournament(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output_path = os.path.join(directory, "results.jsonl")
+            summary = run_tournament("greedy", "random", 6, output_path, workers=2, max_plies=80,
+                                     random_opening_plies=2)
+            with open(output_path) as output_file:
+                records = [json.loads(line) for line in output_file]
+
+        self.assertEqual(summary["games"], 6)
+        self.assertEqual(summary["wins"] + summary["losses"] + summary["draws"], 6)
+        self.assertEqual(sorted(record["game"] for record in records), list(range(6)))
+        for record in records:
+            self.assertEqual(record["white"], "greedy" if record["game"] % 2 == 0 else "random")